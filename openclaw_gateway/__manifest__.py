@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 {
     'name': 'OpenClaw Gateway (API Skills)',
-    'version': '18.0.1.3.0',
+    'version': '18.0.1.4.0',
     'category': 'Tools',
     'summary': 'API Skills Gateway for OpenClaw and n8n Integration',
     'description': """
@@ -26,6 +26,12 @@ API Endpoints:
 * GET  /api/health - Health check (no auth)
 * GET  /api/skills - List available skills
 * POST /api/skills/<code> - Execute skill
+* POST /api/skills/batch - Execute several skills in one call
+* POST /api/skills/pipeline - Chain skills, passing results between steps
+* GET  /api/metrics - Gateway counters and in-flight executions
+* GET  /api/workflow/status/<job_id> - Job status (long-poll with ?wait=)
+* GET  /api/workflow/stream/<job_id> - Job status as Server-Sent Events
+* GET  /api/exports/<job_id>/download - Download a finished export file
 
 Security:
 ---------
@@ -34,12 +40,17 @@ Security:
 * Role-based access (Admin, Sales, HR, Finance)
 * Optional IP whitelisting
 * Token expiry support
+* Per-token and per-skill rate limiting (429 + Retry-After)
+* Per-skill and gateway-wide concurrency caps with load shedding (503)
 * Full request/response logging
 
 Integration:
 -----------
 Works with OpenClaw (Telegram/WhatsApp bot), n8n (automation), 
 and any HTTP client supporting JSON APIs.
+
+Lead, sale order and partner changes can be pushed to n8n through a
+transactional outbox (batched, retried with backoff, ordered per record).
     """,
     'author': 'Freezoner',
     'website': 'https://freezoner.com',
@@ -59,10 +70,13 @@ and any HTTP client supporting JSON APIs.
         'views/api_token_views.xml',
         'views/request_log_views.xml',
         'views/webhook_views.xml',
+        'views/event_outbox_views.xml',
+        'views/webhook_inbox_views.xml',
         'views/menu.xml',
         'data/seed_skills.xml',
         'data/seed_tokens.xml',
         'data/n8n_config.xml',
+        'data/cron.xml',
     ],
     'external_dependencies': {
         'python': [],
@@ -1,17 +1,53 @@
 # -*- coding: utf-8 -*-
 """API Controller for OpenClaw Gateway"""
+import hashlib
+import hmac
 import json
 import time
 import logging
 from datetime import datetime
 
-from odoo import http
+from odoo import http, api, SUPERUSER_ID
 from odoo.http import request, Response
 
 from ..executors.bulk_import import BulkImportExecutor
+from ..models.idempotency import MAX_KEY_LENGTH
+from ..models.skill import EXECUTION_SLOT_NAMESPACE
+from ..models.webhook_log import TERMINAL_JOB_STATUSES
+from ..tools import compression, job_notify, metrics, serialization
 
 _logger = logging.getLogger(__name__)
 
+# HTTP status for skill errors that are not plain client errors (default 400)
+ERROR_HTTP_STATUS = {
+    'RATE_LIMITED': 429,
+    'OVERLOADED': 503,
+    'TIMEOUT': 504,
+}
+
+# Accept header media types mapped to response formats
+FORMAT_MEDIA_TYPES = {
+    'application/json': 'json',
+    'application/vnd.openclaw.columnar+json': 'columnar',
+    'application/msgpack': 'msgpack',
+    'application/x-msgpack': 'msgpack',
+}
+MSGPACK_CONTENT_TYPE = 'application/msgpack'
+
+DEFAULT_MAX_BATCH_SIZE = 20
+
+DEFAULT_COMPRESSION_MIN_BYTES = 1024
+DEFAULT_COMPRESSION_LEVEL = 6
+
+# Job status long-poll / SSE (kept below the default limit_time_real of 120 s)
+MAX_STATUS_WAIT_SECONDS = 60
+MAX_STREAM_SECONDS = 100
+STATUS_RECHECK_SECONDS = 10
+# Waiting clients hold a worker; ``openclaw_gateway.max_status_waiters`` caps them
+# across all workers with advisory-lock slots (outside the execution slot range)
+STATUS_WAITER_LOCK_KEY = EXECUTION_SLOT_NAMESPACE - 1
+DEFAULT_MAX_STATUS_WAITERS = 4
+
 
 class OpenClawAPIController(http.Controller):
     """
@@ -21,6 +57,9 @@ class OpenClawAPIController(http.Controller):
     - GET  /api/health - Health check (no auth)
     - GET  /api/skills - List available skills (with auth)
     - POST /api/skills/<code> - Execute skill (with auth)
+    - POST /api/skills/batch - Execute several skills in one call (with auth)
+    - POST /api/skills/pipeline - Execute chained skills in one call (with auth)
+    - GET  /api/metrics - Gateway counters and in-flight executions (with auth)
     """
     
     # ==================== Helper Methods ====================
@@ -56,22 +95,148 @@ class OpenClawAPIController(http.Controller):
                 'message': f'Token validation failed: {str(e)}'
             }
     
-    def _json_response(self, data, status=200):
+    def _check_rate_limit(self, token_record, skill_code=None, cost=1, skill_costs=None):
+        """
+        Consume calls from the token's rate limit buckets (fails open on error).
+        
+        Args:
+            token_record: openclaw.api.token record
+            skill_code (str): Skill code for per-skill limits
+            cost (int): Number of calls to account for
+            skill_costs (dict): {skill_code: calls} for multi-skill requests
+            
+        Returns:
+            dict: {'allowed': bool, 'retry_after': int (when throttled)}
+        """
+        try:
+            throttle = token_record.check_rate_limit(skill_code, cost=cost, skill_costs=skill_costs)
+            if not throttle['allowed']:
+                metrics.incr('rate_limited', skill_code)
+            return throttle
+        except Exception as e:
+            _logger.exception(f"Error checking rate limit: {str(e)}")
+            return {'allowed': True}
+    
+    def _rate_limited_response(self, throttle):
+        """Build the error body for a throttled call (429, or 400 when it can never fit)."""
+        if throttle.get('error') == 'COST_EXCEEDS_CAPACITY':
+            return {
+                'success': False,
+                'error': 'COST_EXCEEDS_CAPACITY',
+                'message': (f'Request needs {throttle["cost"]} calls but the rate limit allows at most '
+                            f'{throttle["capacity"]} at once; split it into smaller requests'),
+            }
+        return {
+            'success': False,
+            'error': 'RATE_LIMITED',
+            'message': f'Rate limit exceeded, retry in {throttle["retry_after"]} seconds',
+            'retry_after': throttle['retry_after'],
+        }
+    
+    def _rate_limited_http(self, throttle):
         """
-        Return standardized JSON HTTP response.
+        Return (HTTP status, headers) for a throttled call.
+        
+        Calls that can never fit the bucket get 400 without Retry-After.
+        """
+        if 'retry_after' not in throttle:
+            return 400, None
+        return 429, {'Retry-After': str(throttle['retry_after'])}
+    
+    def _result_http_status(self, result):
+        """Map a skill result to its HTTP status code."""
+        if result.get('success'):
+            return 200
+        return ERROR_HTTP_STATUS.get(result.get('error'), 400)
+    
+    def _result_headers(self, result):
+        """Extra headers for a skill result (Retry-After for throttled/shed calls)."""
+        if result.get('retry_after'):
+            return {'Retry-After': str(result['retry_after'])}
+        return None
+    
+    def _get_compression_settings(self):
+        """Return (min_bytes, level) from system parameters, with safe defaults."""
+        try:
+            params = request.env['ir.config_parameter'].sudo()
+            return (
+                int(params.get_param('openclaw_gateway.compression_min_bytes', DEFAULT_COMPRESSION_MIN_BYTES)),
+                int(params.get_param('openclaw_gateway.compression_level', DEFAULT_COMPRESSION_LEVEL)),
+            )
+        except Exception:
+            return DEFAULT_COMPRESSION_MIN_BYTES, DEFAULT_COMPRESSION_LEVEL
+    
+    def _compress_body(self, body, headers):
+        """
+        Compress ``body`` according to the client's Accept-Encoding.
+        
+        Bodies below the configured size threshold are sent as-is.
         
         Args:
-            data (dict): Response data
+            body (bytes): Encoded response body
+            headers (dict): Response headers, updated in place
+            
+        Returns:
+            bytes: Body to send
+        """
+        min_bytes, level = self._get_compression_settings()
+        if min_bytes <= 0 or len(body) < min_bytes:
+            return body
+        headers['Vary'] = 'Accept-Encoding'
+        encoding = compression.negotiate(request.httprequest.headers.get('Accept-Encoding'))
+        if not encoding:
+            return body
+        compressed = compression.compress(body, encoding, level)
+        metrics.incr('compression_bytes_in', encoding, len(body))
+        metrics.incr('compression_bytes_out', encoding, len(compressed))
+        headers['Content-Encoding'] = encoding
+        return compressed
+    
+    def _get_response_format(self, payload):
+        """
+        Resolve the requested response format.
+        
+        The payload "format" key wins over the Accept header; the first
+        recognised media type in Accept is used otherwise.
+        
+        Returns:
+            str: 'json', 'columnar', 'msgpack' or the unknown value requested
+        """
+        if isinstance(payload, dict) and payload.get('format'):
+            return str(payload['format']).lower()
+        accept = request.httprequest.headers.get('Accept') or ''
+        for media_type in accept.split(','):
+            response_format = FORMAT_MEDIA_TYPES.get(media_type.split(';')[0].strip().lower())
+            if response_format:
+                return response_format
+        return 'json'
+    
+    def _json_response(self, data, status=200, headers=None, content_type=None):
+        """
+        Return standardized JSON HTTP response, compressed when the client
+        accepts it and the body is above the configured threshold.
+        
+        Args:
+            data (dict|bytes): Response data, or JSON bytes already encoded
+                with ``serialization.dumps``
             status (int): HTTP status code
+            headers (dict): Extra response headers (e.g. Retry-After)
+            content_type (str): Content type of pre-encoded non-JSON bodies
             
         Returns:
             Response: Odoo HTTP Response object
         """
+        body = data if isinstance(data, bytes) else serialization.dumps(data)
+        content_type = content_type or 'application/json'
+        response_headers = {'Content-Type': content_type}
+        if headers:
+            response_headers.update(headers)
+        body = self._compress_body(body, response_headers)
         return Response(
-            json.dumps(data, default=str),
+            body,
             status=status,
-            mimetype='application/json',
-            headers={'Content-Type': 'application/json'}
+            mimetype=content_type,
+            headers=response_headers
         )
     
     def _log_request(self, token_name, endpoint, method, skill_code, 
@@ -85,8 +250,8 @@ class OpenClawAPIController(http.Controller):
             endpoint (str): API endpoint called
             method (str): HTTP method
             skill_code (str): Skill code executed
-            request_data (dict): Request payload
-            response_data (dict): Response data
+            request_data (dict|bytes|str): Request payload (raw body bytes are stored as-is)
+            response_data (dict|bytes): Response data (encoded bytes are stored as-is)
             status (str): 'ok' or 'error'
             error (str): Error message if failed
             duration_ms (int): Request duration in milliseconds
@@ -99,8 +264,8 @@ class OpenClawAPIController(http.Controller):
                 'endpoint': endpoint,
                 'method': method,
                 'skill_code': skill_code,
-                'request_json': json.dumps(request_data, default=str) if request_data else '{}',
-                'response_json': json.dumps(response_data, default=str) if response_data else '{}',
+                'request_json': serialization.to_text(request_data),
+                'response_json': serialization.to_text(response_data),
                 'status': status,
                 'error': error,
                 'duration_ms': duration_ms,
@@ -110,6 +275,64 @@ class OpenClawAPIController(http.Controller):
         except Exception as e:
             _logger.error(f"Failed to log API request: {str(e)}")
     
+    def _idempotency_begin(self, token_record, endpoint, raw_body, variant=''):
+        """
+        Handle the Idempotency-Key header before anything is executed.
+        
+        Takes the (token, key) advisory lock for the rest of the transaction,
+        so a concurrent duplicate waits here for the first request to finish.
+        
+        Args:
+            token_record: Validated token
+            endpoint (str): Endpoint path (part of the request fingerprint)
+            raw_body (bytes): Request body
+            variant (str): Extra fingerprint input (e.g. response format)
+            
+        Returns:
+            tuple: (idempotency state for ``_idempotency_finish`` or None,
+                    Response to return immediately or None)
+        """
+        key = request.httprequest.headers.get('Idempotency-Key')
+        if not key:
+            return None, None
+        if len(key) > MAX_KEY_LENGTH:
+            return None, self._json_response({
+                'success': False,
+                'error': 'INVALID_IDEMPOTENCY_KEY',
+                'message': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters'
+            }, 400)
+        Record = request.env['openclaw.idempotency.record'].sudo()
+        request_hash = hashlib.sha256(f'{endpoint}\n{variant}\n'.encode() + raw_body).hexdigest()
+        Record.acquire(token_record, key)
+        stored = Record.lookup(token_record, key)
+        if not stored:
+            return {'key': key, 'hash': request_hash}, None
+        if stored['request_hash'] != request_hash:
+            return None, self._json_response({
+                'success': False,
+                'error': 'IDEMPOTENCY_KEY_REUSED',
+                'message': 'Idempotency-Key was already used for a different request'
+            }, 422)
+        metrics.incr('idempotent_replays')
+        return None, self._json_response(
+            stored['body'],
+            status=stored['status_code'],
+            headers={'Idempotent-Replayed': 'true'},
+            content_type=stored['content_type']
+        )
+    
+    def _idempotency_finish(self, idempotency, token_record, status, body, content_type=None):
+        """
+        Store the first response of an Idempotency-Key request for replays.
+        
+        Throttled, overloaded and failed (5xx) responses are not stored so the
+        client's retry executes again.
+        """
+        if idempotency and status < 500 and status != 429:
+            request.env['openclaw.idempotency.record'].sudo().store(
+                token_record, idempotency['key'], idempotency['hash'], status, body, content_type
+            )
+    
     def _get_token_from_request(self):
         """Extract token from request headers."""
         return request.httprequest.headers.get('X-OPENCLAW-TOKEN')
@@ -285,9 +508,10 @@ class OpenClawAPIController(http.Controller):
         remote_addr = self._get_remote_addr()
         user_agent = self._get_user_agent()
         
-        # Parse request payload
+        # Parse request payload (raw bytes are reused for the request log)
+        raw_body = request.httprequest.get_data() or b'{}'
         try:
-            payload = json.loads(request.httprequest.data.decode('utf-8') or '{}')
+            payload = json.loads(raw_body)
         except json.JSONDecodeError as e:
             duration_ms = int((time.time() - start_time) * 1000)
             error_response = {
@@ -328,7 +552,7 @@ class OpenClawAPIController(http.Controller):
                 endpoint=f'/api/skills/{code}',
                 method='POST',
                 skill_code=code,
-                request_data=payload,
+                request_data=raw_body,
                 response_data=error_response,
                 status='error',
                 error=validation['error'],
@@ -343,9 +567,98 @@ class OpenClawAPIController(http.Controller):
         token_record = validation['token_record']
         user_roles = validation.get('roles', [])
         
+        # Resolve response format before spending any execution time on it
+        response_format = self._get_response_format(payload)
+        format_error = None
+        if response_format not in FORMAT_MEDIA_TYPES.values():
+            format_error = ('INVALID_FORMAT', f'Unknown format "{response_format}" (json, columnar, msgpack)', 400)
+        elif response_format == 'msgpack' and serialization.msgpack is None:
+            format_error = ('FORMAT_NOT_AVAILABLE', 'MessagePack is not available on this server', 406)
+        if format_error:
+            duration_ms = int((time.time() - start_time) * 1000)
+            error_response = {'success': False, 'error': format_error[0], 'message': format_error[1]}
+            
+            self._log_request(
+                token_name=token_record.name,
+                endpoint=f'/api/skills/{code}',
+                method='POST',
+                skill_code=code,
+                request_data=raw_body,
+                response_data=error_response,
+                status='error',
+                error=format_error[0],
+                duration_ms=duration_ms,
+                remote_addr=remote_addr,
+                user_agent=user_agent
+            )
+            
+            return self._json_response(error_response, status=format_error[2])
+        
+        # Replay the stored response of a retried Idempotency-Key request
+        idempotency, replay = self._idempotency_begin(
+            token_record, f'/api/skills/{code}', raw_body, variant=response_format)
+        if replay:
+            return replay
+        
+        # Enforce rate limits before any executor runs
+        throttle = self._check_rate_limit(token_record, skill_code=code)
+        if not throttle['allowed']:
+            duration_ms = int((time.time() - start_time) * 1000)
+            error_response = self._rate_limited_response(throttle)
+            
+            self._log_request(
+                token_name=token_record.name,
+                endpoint=f'/api/skills/{code}',
+                method='POST',
+                skill_code=code,
+                request_data=raw_body,
+                response_data=error_response,
+                status='error',
+                error=error_response['error'],
+                duration_ms=duration_ms,
+                remote_addr=remote_addr,
+                user_agent=user_agent
+            )
+            
+            status_code, headers = self._rate_limited_http(throttle)
+            return self._json_response(error_response, status=status_code, headers=headers)
+        
         try:
+            # Asynchronous mode: queue the execution and answer 202 with a job id
+            if isinstance(payload, dict) and payload.pop('async', False) is True:
+                # Savepoint: a failed enqueue must not abort the transaction used for logging
+                with request.env.cr.savepoint():
+                    job = request.env['openclaw.workflow.job'].sudo().enqueue_skill(token_record, code, payload)
+                token_record.sudo().update_usage()
+                accepted = {
+                    'success': True,
+                    'async': True,
+                    'job_id': job.job_id,
+                    'status_url': f'/api/workflow/status/{job.job_id}',
+                    'skill': code
+                }
+                self._log_request(
+                    token_name=token_record.name,
+                    endpoint=f'/api/skills/{code}',
+                    method='POST',
+                    skill_code=code,
+                    request_data=raw_body,
+                    response_data=accepted,
+                    status='ok',
+                    error=None,
+                    duration_ms=int((time.time() - start_time) * 1000),
+                    remote_addr=remote_addr,
+                    user_agent=user_agent
+                )
+                body = serialization.dumps(accepted)
+                self._idempotency_finish(idempotency, token_record, 202, body)
+                return self._json_response(body, status=202)
+            
             # Execute skill
-            Skill = request.env['openclaw.skill'].sudo()
+            Skill = request.env['openclaw.skill'].sudo().with_context(
+                openclaw_token_id=token_record.id,
+                openclaw_response_format=response_format,
+            )
             result = Skill.run_skill(code, payload, user_roles=user_roles)
             
             duration_ms = int((time.time() - start_time) * 1000)
@@ -357,14 +670,25 @@ class OpenClawAPIController(http.Controller):
             # Update token usage
             token_record.sudo().update_usage()
             
+            # Serialize once; the same bytes are logged and sent
+            # (MessagePack bodies are logged as JSON for readability)
+            if response_format == 'msgpack' and result.get('success'):
+                body = serialization.dumps_msgpack(result)
+                content_type = MSGPACK_CONTENT_TYPE
+            else:
+                body = serialization.dumps(result)
+                content_type = None
+            status_code = self._result_http_status(result)
+            self._idempotency_finish(idempotency, token_record, status_code, body, content_type)
+            
             # Log request
             self._log_request(
                 token_name=token_record.name,
                 endpoint=f'/api/skills/{code}',
                 method='POST',
                 skill_code=code,
-                request_data=payload,
-                response_data=result,
+                request_data=raw_body,
+                response_data=result if content_type else body,
                 status=status,
                 error=error,
                 duration_ms=duration_ms,
@@ -373,8 +697,12 @@ class OpenClawAPIController(http.Controller):
             )
             
             # Return appropriate HTTP status
-            http_status = 200 if result.get('success') else 400
-            return self._json_response(result, status=http_status)
+            return self._json_response(
+                body,
+                status=status_code,
+                headers=self._result_headers(result),
+                content_type=content_type
+            )
             
         except Exception as e:
             _logger.exception(f"Error executing skill {code}: {str(e)}")
@@ -391,7 +719,7 @@ class OpenClawAPIController(http.Controller):
                 endpoint=f'/api/skills/{code}',
                 method='POST',
                 skill_code=code,
-                request_data=payload,
+                request_data=raw_body,
                 response_data=error_response,
                 status='error',
                 error='EXECUTION_ERROR',
@@ -402,6 +730,228 @@ class OpenClawAPIController(http.Controller):
             
             return self._json_response(error_response, status=500)
 
+    # ==================== Route 3a: Batch & Pipeline Execution ====================
+    
+    def _execute_many(self, endpoint, items_key, runner):
+        """
+        Shared handler for endpoints that run several skills in one request.
+        
+        Authenticates once, enforces the batch size and rate limits (each item
+        counts), then calls ``runner`` and writes one usage update and one
+        request log record.
+        
+        Args:
+            endpoint (str): Endpoint path (for logging)
+            items_key (str): Payload key holding the item list ('items', 'steps')
+            runner (callable): runner(payload, items, validation) -> response dict
+            
+        Returns:
+            Response: Odoo HTTP Response object
+        """
+        start_time = time.time()
+        log_code = endpoint.rsplit('/', 1)[-1]
+        token_value = self._get_token_from_request()
+        remote_addr = self._get_remote_addr()
+        user_agent = self._get_user_agent()
+        raw_body = request.httprequest.get_data() or b'{}'
+        
+        def reject(error_response, status, token_name='invalid', headers=None):
+            self._log_request(
+                token_name=token_name,
+                endpoint=endpoint,
+                method='POST',
+                skill_code=log_code,
+                request_data=raw_body,
+                response_data=error_response,
+                status='error',
+                error=error_response['error'],
+                duration_ms=int((time.time() - start_time) * 1000),
+                remote_addr=remote_addr,
+                user_agent=user_agent
+            )
+            return self._json_response(error_response, status=status, headers=headers)
+        
+        try:
+            payload = json.loads(raw_body)
+        except json.JSONDecodeError as e:
+            return reject({
+                'success': False,
+                'error': 'INVALID_JSON',
+                'message': f'Invalid JSON payload: {str(e)}'
+            }, 400)
+        
+        validation = self._validate_token(token_value, skill_code=None, remote_addr=remote_addr)
+        if not validation['valid']:
+            return reject({
+                'success': False,
+                'error': validation['error'],
+                'message': validation['message']
+            }, 401)
+        
+        token_record = validation['token_record']
+        items = payload.get(items_key) if isinstance(payload, dict) else None
+        max_batch_size = int(request.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.max_batch_size', DEFAULT_MAX_BATCH_SIZE))
+        if not isinstance(items, list) or not items:
+            return reject({
+                'success': False,
+                'error': 'ITEMS_REQUIRED',
+                'message': f'Payload "{items_key}" (non-empty list of {{skill, payload}}) is required'
+            }, 400, token_record.name)
+        if len(items) > max_batch_size:
+            return reject({
+                'success': False,
+                'error': 'BATCH_TOO_LARGE',
+                'message': f'{len(items)} {items_key} exceed maximum {max_batch_size}'
+            }, 400, token_record.name)
+        
+        # Every item counts against the rate limits, charged all at once
+        item_counts = {}
+        for item in items:
+            skill_code = item.get('skill') if isinstance(item, dict) else None
+            item_counts[skill_code] = item_counts.get(skill_code, 0) + 1
+        throttle = self._check_rate_limit(token_record, skill_costs=item_counts)
+        if not throttle['allowed']:
+            status_code, headers = self._rate_limited_http(throttle)
+            return reject(self._rate_limited_response(throttle), status_code, token_record.name, headers=headers)
+        
+        try:
+            result = runner(payload, items, validation)
+            
+            token_record.sudo().update_usage()
+            body = serialization.dumps(result)
+            self._log_request(
+                token_name=token_record.name,
+                endpoint=endpoint,
+                method='POST',
+                skill_code=log_code,
+                request_data=raw_body,
+                response_data=body,
+                status='ok' if result.get('success') else 'error',
+                error=result.get('error'),
+                duration_ms=int((time.time() - start_time) * 1000),
+                remote_addr=remote_addr,
+                user_agent=user_agent
+            )
+            return self._json_response(body, status=200 if result.get('success') else 400)
+        
+        except Exception as e:
+            _logger.exception(f"Error executing {log_code}: {str(e)}")
+            return reject({
+                'success': False,
+                'error': 'EXECUTION_ERROR',
+                'message': f'Failed to execute {log_code}: {str(e)}'
+            }, 500, token_record.name)
+    
+    def _allowed_skill_codes(self, token_record):
+        """Skill codes the token is restricted to, or None when unrestricted."""
+        if token_record.allowed_skills:
+            return set(token_record.allowed_skills.mapped('code'))
+        return None
+    
+    @http.route('/api/skills/batch', type='http', auth='public', methods=['POST'], csrf=False)
+    def execute_batch(self, **kwargs):
+        """
+        Execute several skills with one authentication, usage update and log record.
+        
+        Headers:
+            X-OPENCLAW-TOKEN: API token
+            Content-Type: application/json
+            
+        Body:
+            {"items": [{"skill": "customers", "payload": {...}}, ...],
+             "parallel": false}
+            
+        Returns:
+            JSON: {"success": true, "data": {"results": [...], "count": int, "failed": int}}
+        """
+        def run(payload, items, validation):
+            Skill = request.env['openclaw.skill'].sudo().with_context(
+                openclaw_token_id=validation['token_record'].id)
+            results = Skill.run_batch(
+                items,
+                user_roles=validation.get('roles', []),
+                allowed_skill_codes=self._allowed_skill_codes(validation['token_record']),
+                parallel=bool(payload.get('parallel')),
+            )
+            return {
+                'success': True,
+                'data': {
+                    'results': results,
+                    'count': len(results),
+                    'failed': sum(1 for item_result in results if not item_result.get('success')),
+                }
+            }
+        return self._execute_many('/api/skills/batch', 'items', run)
+    
+    @http.route('/api/skills/pipeline', type='http', auth='public', methods=['POST'], csrf=False)
+    def execute_pipeline(self, **kwargs):
+        """
+        Execute a chain of skills in one request and transaction.
+        
+        Headers:
+            X-OPENCLAW-TOKEN: API token
+            Content-Type: application/json
+            
+        Body:
+            {"steps": [
+                {"id": "customer", "skill": "customers", "payload": {"search": "a@b.com", "limit": 1}},
+                {"id": "invoices", "skill": "invoices", "payload": {"limit": 10},
+                 "bind": {"partner_id": "customer.customers[0].id"}}
+            ]}
+            
+        Returns:
+            JSON: {"success": bool, "data": {"steps": [...], "completed": int}}
+        """
+        def run(payload, items, validation):
+            Skill = request.env['openclaw.skill'].sudo().with_context(
+                openclaw_token_id=validation['token_record'].id)
+            return Skill.run_pipeline(
+                items,
+                user_roles=validation.get('roles', []),
+                allowed_skill_codes=self._allowed_skill_codes(validation['token_record']),
+            )
+        return self._execute_many('/api/skills/pipeline', 'steps', run)
+    
+    # ==================== Route 3b: Metrics ====================
+    
+    @http.route('/api/metrics', type='http', auth='public', methods=['GET'], csrf=False)
+    def gateway_metrics(self, **kwargs):
+        """
+        Gateway metrics for monitoring.
+        
+        Headers:
+            X-OPENCLAW-TOKEN: API token
+            
+        Returns:
+            JSON: In-flight executions (all workers) and counters (this worker)
+        """
+        validation = self._validate_token(
+            self._get_token_from_request(), skill_code=None, remote_addr=self._get_remote_addr()
+        )
+        if not validation['valid']:
+            return self._json_response({
+                'success': False,
+                'error': validation['error'],
+                'message': validation['message']
+            }, status=401)
+        
+        try:
+            data = metrics.snapshot()
+            data['inflight'] = request.env['openclaw.skill'].sudo().get_inflight_counts()
+            bytes_in = data['counters'].get('compression_bytes_in', {}).get('total')
+            if bytes_in:
+                bytes_out = data['counters']['compression_bytes_out']['total']
+                data['compression_ratio'] = round(bytes_in / bytes_out, 2)
+            return self._json_response({'success': True, 'data': data})
+        except Exception as e:
+            _logger.exception(f"Error collecting metrics: {str(e)}")
+            return self._json_response({
+                'success': False,
+                'error': 'SERVER_ERROR',
+                'message': f'Failed to collect metrics: {str(e)}'
+            }, status=500)
+
     # ==================== Route 4: Bulk Operations ====================
 
     @http.route('/api/bulk/<string:operation>', type='http', auth='public', methods=['POST'], csrf=False)
@@ -427,7 +977,8 @@ class OpenClawAPIController(http.Controller):
             }, 400)
 
         try:
-            payload = json.loads(request.httprequest.get_data(as_text=True) or '{}')
+            raw_body = request.httprequest.get_data() or b'{}'
+            payload = json.loads(raw_body)
         except json.JSONDecodeError as e:
             return self._json_response({
                 'success': False,
@@ -445,7 +996,7 @@ class OpenClawAPIController(http.Controller):
                 endpoint=f'/api/bulk/{operation}',
                 method='POST',
                 skill_code=skill_code,
-                request_data=payload,
+                request_data=raw_body,
                 response_data={'success': False, 'error': validation.get('error'), 'message': err},
                 status='error',
                 error=validation.get('error'),
@@ -460,6 +1011,29 @@ class OpenClawAPIController(http.Controller):
             }, 401)
 
         token_record = validation['token_record']
+        idempotency, replay = self._idempotency_begin(token_record, f'/api/bulk/{operation}', raw_body)
+        if replay:
+            return replay
+        throttle = self._check_rate_limit(token_record, skill_code=skill_code)
+        if not throttle['allowed']:
+            duration_ms = int((time.time() - start_time) * 1000)
+            err_resp = self._rate_limited_response(throttle)
+            self._log_request(
+                token_name=token_record.name,
+                endpoint=f'/api/bulk/{operation}',
+                method='POST',
+                skill_code=skill_code,
+                request_data=raw_body,
+                response_data=err_resp,
+                status='error',
+                error=err_resp['error'],
+                duration_ms=duration_ms,
+                remote_addr=remote_addr,
+                user_agent=user_agent
+            )
+            status_code, headers = self._rate_limited_http(throttle)
+            return self._json_response(err_resp, status_code, headers=headers)
+
         try:
             if operation == 'import':
                 result = BulkImportExecutor().execute(request.env, payload)
@@ -468,13 +1042,14 @@ class OpenClawAPIController(http.Controller):
 
             duration_ms = int((time.time() - start_time) * 1000)
             token_record.sudo().update_usage()
+            body = serialization.dumps(result)
             self._log_request(
                 token_name=token_record.name,
                 endpoint=f'/api/bulk/{operation}',
                 method='POST',
                 skill_code=skill_code,
-                request_data=payload,
-                response_data=result,
+                request_data=raw_body,
+                response_data=body,
                 status='ok' if result.get('success') else 'error',
                 error=result.get('error'),
                 duration_ms=duration_ms,
@@ -482,7 +1057,8 @@ class OpenClawAPIController(http.Controller):
                 user_agent=user_agent
             )
             status_code = 200 if result.get('success') else 400
-            return self._json_response(result, status=status_code)
+            self._idempotency_finish(idempotency, token_record, status_code, body)
+            return self._json_response(body, status=status_code)
         except Exception as e:
             _logger.exception("Bulk %s error: %s", operation, e)
             duration_ms = int((time.time() - start_time) * 1000)
@@ -492,7 +1068,7 @@ class OpenClawAPIController(http.Controller):
                 endpoint=f'/api/bulk/{operation}',
                 method='POST',
                 skill_code=skill_code,
-                request_data=payload,
+                request_data=raw_body,
                 response_data=err_resp,
                 status='error',
                 error='BULK_ERROR',
@@ -505,26 +1081,50 @@ class OpenClawAPIController(http.Controller):
     # ==================== Route 5: Workflow Job Status ====================
 
     @http.route('/api/workflow/status/<string:job_id>', type='http', auth='public', methods=['GET'], csrf=False)
-    def workflow_status(self, job_id, **kwargs):
-        """Get workflow job status by job_id. No auth required (job_id acts as secret)."""
+    def workflow_status(self, job_id, wait=None, status=None, progress=None, **kwargs):
+        """
+        Get workflow job status by job_id. No auth required (job_id acts as secret).
+        
+        With ``wait=<seconds>`` (max 60) the call long-polls: it answers as soon
+        as the job's status or progress differs from the ``status``/``progress``
+        query parameters (default: the job's state when the call arrived), the
+        job reaches a final status, or the wait expires.
+        """
         try:
-            job = request.env['openclaw.workflow.job'].sudo().search([('job_id', '=', job_id)], limit=1)
-            if not job:
+            registry = request.env.registry
+            token_value = self._get_token_from_request()
+            data = self._job_status_data(request.env, job_id, token_value)
+            if not data:
                 return self._json_response({'success': False, 'error': 'JOB_NOT_FOUND'}, 404)
-            result = {
-                'job_id': job.job_id,
-                'status': job.status,
-                'progress': job.progress_percent,
-                'workflow_type': job.workflow_type,
-                'created_at': job.create_date.isoformat() if job.create_date else None,
-                'error': job.error_message,
-            }
-            if job.result_json:
+            if wait and data['status'] not in TERMINAL_JOB_STATUSES:
                 try:
-                    result['result'] = json.loads(job.result_json)
-                except (TypeError, ValueError):
-                    result['result'] = job.result_json
-            return self._json_response({'success': True, 'data': result})
+                    wait = min(float(wait), MAX_STATUS_WAIT_SECONDS)
+                    baseline = (status or data['status'],
+                                float(progress) if progress is not None else data['progress'])
+                except ValueError:
+                    return self._json_response({
+                        'success': False,
+                        'error': 'INVALID_PARAMETER',
+                        'message': 'wait and progress must be numbers'
+                    }, 400)
+                acquired, waiter = self._acquire_status_waiter(registry)
+                if not acquired:
+                    return self._too_many_waiters_response()
+                # End the read-only request transaction so the wait holds no open
+                # transaction; every re-read uses its own short-lived cursor
+                request.env.cr.commit()
+                try:
+                    deadline = time.monotonic() + wait
+                    while ((data['status'], data['progress']) == baseline
+                           and data['status'] not in TERMINAL_JOB_STATUSES):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        job_notify.wait(registry.db_name, job_id, min(remaining, STATUS_RECHECK_SECONDS))
+                        data = self._read_job_status(registry, job_id, token_value) or data
+                finally:
+                    self._release_status_waiter(waiter)
+            return self._json_response({'success': True, 'data': data})
         except Exception as e:
             _logger.exception("Workflow status error: %s", e)
             return self._json_response({
@@ -532,3 +1132,165 @@ class OpenClawAPIController(http.Controller):
                 'error': 'STATUS_ERROR',
                 'message': str(e)
             }, 500)
+
+    @http.route('/api/workflow/stream/<string:job_id>', type='http', auth='public', methods=['GET'], csrf=False)
+    def workflow_stream(self, job_id, **kwargs):
+        """
+        Stream job status changes as Server-Sent Events.
+        
+        Sends the current status, then one ``status`` event per change until the
+        job is final or the stream reaches its maximum duration (clients such as
+        EventSource reconnect automatically). Comment lines keep idle
+        connections open.
+        """
+        registry = request.env.registry
+        token_value = self._get_token_from_request()
+        data = self._job_status_data(request.env, job_id, token_value)
+        if not data:
+            return self._json_response({'success': False, 'error': 'JOB_NOT_FOUND'}, 404)
+        # The body is produced after the request transaction ends; the waiter
+        # slot is released when the response is closed
+        acquired, waiter = self._acquire_status_waiter(registry)
+        if not acquired:
+            return self._too_many_waiters_response()
+
+        def events():
+            current = data
+            yield self._sse_event(current)
+            deadline = time.monotonic() + MAX_STREAM_SECONDS
+            while current['status'] not in TERMINAL_JOB_STATUSES and time.monotonic() < deadline:
+                job_notify.wait(registry.db_name, job_id, STATUS_RECHECK_SECONDS)
+                latest = self._read_job_status(registry, job_id, token_value)
+                if latest and (latest['status'], latest['progress']) != (current['status'], current['progress']):
+                    current = latest
+                    yield self._sse_event(current)
+                else:
+                    yield b': keep-alive\n\n'
+
+        response = Response(
+            events(),
+            status=200,
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+            direct_passthrough=True,
+        )
+        response.call_on_close(lambda: self._release_status_waiter(waiter))
+        return response
+
+    @http.route('/api/exports/<string:job_id>/download', type='http', auth='public', methods=['GET'], csrf=False)
+    def export_download(self, job_id, **kwargs):
+        """
+        Download the compressed file of a completed export job.
+        
+        Headers:
+            X-OPENCLAW-TOKEN: API token (the token that queued the export)
+            
+        Returns:
+            File: gzip-compressed NDJSON/CSV streamed from the filestore
+        """
+        validation = self._validate_token(self._get_token_from_request(), remote_addr=self._get_remote_addr())
+        if not validation['valid']:
+            return self._json_response({
+                'success': False,
+                'error': validation['error'],
+                'message': validation['message']
+            }, 401)
+        job = request.env['openclaw.workflow.job'].sudo().search([
+            ('job_id', '=', job_id),
+            ('workflow_type', '=', 'export'),
+        ], limit=1)
+        if not job or (job.token_id and job.token_id != validation['token_record']):
+            return self._json_response({'success': False, 'error': 'JOB_NOT_FOUND'}, 404)
+        if job.status != 'completed' or not job.attachment_id:
+            return self._json_response({
+                'success': False,
+                'error': 'EXPORT_NOT_READY',
+                'message': f'Export is {job.status}'
+            }, 409)
+        stream = request.env['ir.binary'].sudo()._get_stream_from(job.attachment_id)
+        return stream.get_response(as_attachment=True)
+
+    def _job_status_data(self, env, job_id, token_value=None):
+        """
+        Read a job's status payload.
+        
+        Jobs queued by an API token (async skill executions) are only visible
+        with that token in X-OPENCLAW-TOKEN.
+        
+        Returns:
+            dict|None: Status payload, or None when the job does not exist
+        """
+        job = env['openclaw.workflow.job'].sudo().search([('job_id', '=', job_id)], limit=1)
+        if not job or (job.token_id and not hmac.compare_digest(job.token_id.token or '', token_value or '')):
+            return None
+        return job.get_status_data()
+    
+    def _read_job_status(self, registry, job_id, token_value=None):
+        """
+        Re-read a job's status payload on a fresh cursor.
+        
+        The request transaction keeps its snapshot, so waits re-read on a new
+        cursor to see changes committed after the request began.
+        """
+        with registry.cursor() as cr:
+            return self._job_status_data(api.Environment(cr, SUPERUSER_ID, {}), job_id, token_value)
+    
+    def _acquire_status_waiter(self, registry):
+        """
+        Take one of the ``openclaw_gateway.max_status_waiters`` slots (0 = unlimited).
+        
+        The slot is a session-level advisory lock, shared by all workers, on a
+        dedicated connection whose transaction is committed at once: while the
+        caller waits the connection sits idle outside any transaction. Release
+        it with ``_release_status_waiter``; a dying worker's connection drops
+        the lock with it.
+        
+        Returns:
+            tuple: (acquired, waiter to release: (cursor, slot), or None when unlimited/refused)
+        """
+        cr = registry.cursor()
+        try:
+            capacity = int(api.Environment(cr, SUPERUSER_ID, {})['ir.config_parameter'].get_param(
+                'openclaw_gateway.max_status_waiters', DEFAULT_MAX_STATUS_WAITERS) or 0)
+            if capacity <= 0:
+                cr.close()
+                return True, None
+            cr.execute("""
+                SELECT slot FROM generate_series(0, %s - 1) AS slot
+                WHERE pg_try_advisory_lock(%s, slot)
+                LIMIT 1
+            """, (capacity, STATUS_WAITER_LOCK_KEY))
+            row = cr.fetchone()
+            cr.commit()
+        except Exception:
+            cr.close()
+            raise
+        if not row:
+            cr.close()
+            return False, None
+        return True, (cr, row[0])
+    
+    def _release_status_waiter(self, waiter):
+        """Release the slot taken by ``_acquire_status_waiter`` and close its cursor."""
+        if waiter is None:
+            return
+        cr, slot = waiter
+        try:
+            cr.execute("SELECT pg_advisory_unlock(%s, %s)", (STATUS_WAITER_LOCK_KEY, slot))
+            cr.commit()
+        finally:
+            cr.close()
+    
+    def _too_many_waiters_response(self):
+        """429 for a long-poll/stream refused because all waiter slots are busy."""
+        metrics.incr('shed', 'workflow_status')
+        return self._json_response({
+            'success': False,
+            'error': 'TOO_MANY_WAITERS',
+            'message': 'Too many clients are waiting on job status; poll without wait or retry later',
+            'retry_after': STATUS_RECHECK_SECONDS,
+        }, 429, headers={'Retry-After': str(STATUS_RECHECK_SECONDS)})
+
+    def _sse_event(self, data):
+        """Encode one SSE ``status`` event."""
+        return b'event: status\ndata: ' + serialization.dumps(data) + b'\n\n'
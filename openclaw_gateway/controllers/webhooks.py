@@ -2,11 +2,11 @@
 from odoo import http
 from odoo.http import request
 import json
-import hmac
-import hashlib
 import logging
 import time
 
+from ..models.webhook_inbox import WEBHOOK_HANDLERS
+
 _logger = logging.getLogger(__name__)
 
 
@@ -18,60 +18,82 @@ class OpenClawWebhookController(http.Controller):
         """Handle incoming webhooks from N8N workflows"""
         start = time.time()
         source_ip = request.httprequest.remote_addr
-        data = request.httprequest.get_data(as_text=True)
+        raw_body = request.httprequest.get_data()
         headers = dict(request.httprequest.headers)
+        inbox = request.env['openclaw.webhook.inbox'].sudo()
 
-        if not self._validate_webhook_signature(data, headers, webhook_id):
-            response = self._webhook_response({
-                'success': False,
-                'error': 'INVALID_SIGNATURE'
-            }, status=401)
-            self._log_webhook(webhook_id, data, {'success': False, 'error': 'INVALID_SIGNATURE'},
-                              401, (time.time() - start) * 1000, source_ip, None)
-            return response
+        signature_error = self._validate_webhook_signature(raw_body, headers, webhook_id)
+        if signature_error:
+            error = {'success': False, 'error': signature_error}
+            status = 409 if signature_error == 'REPLAYED' else 401
+            self._log_webhook(webhook_id, raw_body.decode('utf-8', 'replace'), error,
+                              status, (time.time() - start) * 1000, source_ip, None)
+            return self._webhook_response(error, status=status)
 
         try:
-            payload = json.loads(data) if data else {}
+            payload = json.loads(raw_body) if raw_body else {}
 
-            if webhook_id == 'lead_created':
-                result = self._handle_lead_created_webhook(payload)
-            elif webhook_id == 'bulk_import_complete':
-                result = self._handle_bulk_import_webhook(payload)
-            elif webhook_id == 'workflow_status':
-                result = self._handle_workflow_status_webhook(payload)
-            else:
-                raise ValueError(f"Unknown webhook ID: {webhook_id}")
+            if self._is_async_request(headers):
+                return self._accept_async(inbox, webhook_id, payload, raw_body, source_ip, headers)
+
+            result = inbox.handle(webhook_id, payload)
 
             elapsed_ms = (time.time() - start) * 1000
-            self._log_webhook(webhook_id, payload, result, 200, elapsed_ms, source_ip,
-                              payload.get('n8n_workflow_id') or payload.get('workflow_id'))
+            workflow_id = isinstance(payload, dict) and (
+                payload.get('n8n_workflow_id') or payload.get('workflow_id')) or None
+            self._log_webhook(webhook_id, payload, result, 200, elapsed_ms, source_ip, workflow_id)
             return self._webhook_response(result, status=200)
 
         except Exception as e:
             _logger.error("Webhook error for %s: %s", webhook_id, str(e))
             err_payload = {'success': False, 'error': 'WEBHOOK_ERROR', 'message': str(e)}
             elapsed_ms = (time.time() - start) * 1000
-            self._log_webhook(webhook_id, data if isinstance(data, str) else {},
+            self._log_webhook(webhook_id, raw_body.decode('utf-8', 'replace'),
                               err_payload, 500, elapsed_ms, source_ip, None)
             return self._webhook_response(err_payload, status=500)
 
-    def _validate_webhook_signature(self, data, headers, webhook_id):
-        """Validate webhook signature from N8N"""
-        webhook_secret = request.env['ir.config_parameter'].sudo().get_param(
-            'openclaw_gateway.webhook_secret'
-        )
-        if not webhook_secret:
-            _logger.warning("No webhook secret configured")
+    def _is_async_request(self, headers):
+        """Async mode: gateway-wide setting or per-call ``Prefer: respond-async``."""
+        if 'respond-async' in (headers.get('Prefer') or ''):
             return True
-        signature = headers.get('X-OpenClaw-Signature')
-        if not signature:
-            return False
-        expected = hmac.new(
-            webhook_secret.encode(),
-            data.encode() if data else b'',
-            hashlib.sha256
-        ).hexdigest()
-        return hmac.compare_digest(f"sha256={expected}", signature)
+        return request.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.webhook_async', 'False'
+        ) in ('1', 'True', 'true')
+
+    def _accept_async(self, inbox, webhook_id, payload, raw_body, source_ip, headers):
+        """Persist the raw body to the inbox and answer 202 before processing."""
+        if webhook_id not in WEBHOOK_HANDLERS:
+            return self._webhook_response({
+                'success': False,
+                'error': 'UNKNOWN_WEBHOOK',
+                'message': f"Unknown webhook ID: {webhook_id}",
+            }, status=400)
+        key = inbox.get_idempotency_key(webhook_id, payload, raw_body, headers.get('Idempotency-Key'))
+        inbox_id = inbox.accept(webhook_id, raw_body, key, source_ip)
+        if not inbox_id:
+            return self._webhook_response({
+                'success': True,
+                'duplicate': True,
+                'message': 'Delivery already received',
+            }, status=200)
+        return self._webhook_response({
+            'success': True,
+            'accepted': True,
+            'inbox_id': inbox_id,
+        }, status=202)
+
+    def _validate_webhook_signature(self, raw_body, headers, webhook_id):
+        """
+        Validate webhook signature from N8N.
+
+        Returns:
+            str|None: Error code, or None when the signature is valid
+        """
+        return request.env['openclaw.webhook.inbox'].sudo().verify_signature(
+            raw_body,
+            headers.get('X-OpenClaw-Signature'),
+            headers.get('X-OpenClaw-Timestamp'),
+        )
 
     def _webhook_response(self, data, status=200):
         """Format webhook response"""
@@ -101,63 +123,3 @@ class OpenClawWebhookController(http.Controller):
             })
         except Exception as e:
             _logger.warning("Could not write webhook log: %s", e)
-
-    def _handle_lead_created_webhook(self, payload):
-        """Acknowledge lead creation callback from N8N."""
-        return {
-            'success': True,
-            'webhook': 'lead_created',
-            'message': 'Lead creation acknowledged',
-            'lead_id': payload.get('lead_id'),
-        }
-
-    def _handle_bulk_import_webhook(self, payload):
-        """Acknowledge bulk import completion from N8N."""
-        job_id = payload.get('job_id')
-        if job_id:
-            job = request.env['openclaw.workflow.job'].sudo().search(
-                [('job_id', '=', job_id)], limit=1
-            )
-            if job:
-                job.write({
-                    'status': 'completed',
-                    'progress_percent': 100.0,
-                    'result_json': json.dumps(payload.get('result', payload)),
-                })
-        return {
-            'success': True,
-            'webhook': 'bulk_import_complete',
-            'message': 'Bulk import acknowledged',
-            'job_id': job_id,
-        }
-
-    def _handle_workflow_status_webhook(self, payload):
-        """Update workflow job status from N8N."""
-        job_id = payload.get('job_id') or payload.get('n8n_execution_id')
-        status = payload.get('status')
-        if job_id and status:
-            job = request.env['openclaw.workflow.job'].sudo().search(
-                [('job_id', '=', job_id)], limit=1
-            )
-            if not job and status in ('pending', 'running'):
-                job = request.env['openclaw.workflow.job'].sudo().create({
-                    'job_id': job_id,
-                    'workflow_type': payload.get('workflow_type', 'data_sync'),
-                    'status': status,
-                    'progress_percent': payload.get('progress_percent', 0.0),
-                    'n8n_execution_id': payload.get('n8n_execution_id'),
-                    'error_message': payload.get('error_message'),
-                })
-            elif job:
-                job.write({
-                    'status': status,
-                    'progress_percent': payload.get('progress_percent', job.progress_percent),
-                    'result_json': json.dumps(payload.get('result')) if payload.get('result') else job.result_json,
-                    'error_message': payload.get('error_message') or job.error_message,
-                })
-        return {
-            'success': True,
-            'webhook': 'workflow_status',
-            'message': 'Status updated',
-            'job_id': job_id,
-        }
@@ -11,3 +11,4 @@ from . import lead_creator
 from . import summary
 from . import bulk_import
 from . import advanced_lead
+from . import export
@@ -6,6 +6,8 @@ import re
 
 _logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_BATCH_LEADS = 500
+
 
 class AdvancedLeadExecutor(BaseExecutor):
     """Advanced lead creation with validation and duplicate check."""
@@ -16,7 +18,10 @@ class AdvancedLeadExecutor(BaseExecutor):
 
         Payload: name (required), contact_name, email_from, phone, company, website,
                  description, source, priority (low|medium|high), allow_duplicates.
+                 Or ``leads``: a list of such objects (see ``_execute_batch``).
         """
+        if 'leads' in payload:
+            return self._execute_batch(env, payload)
         if not payload.get('name'):
             return self._format_response(False, error='NAME_REQUIRED', message='Field "name" is required')
 
@@ -35,19 +40,122 @@ class AdvancedLeadExecutor(BaseExecutor):
                 )
 
             lead = env['crm.lead'].sudo().create(lead_data)
-            result = {
-                'lead_id': lead.id,
-                'name': lead.name,
-                'stage': lead.stage_id.name if lead.stage_id else 'New',
-                'assigned_to': lead.user_id.name if lead.user_id else None,
-                'team': lead.team_id.name if lead.team_id else None,
-                'probability': lead.probability,
-            }
-            return self._format_response(True, data=result)
+            return self._format_response(True, data=self._lead_summary(lead))
         except Exception as e:
             _logger.exception("Advanced lead creation error: %s", e)
             return self._format_response(False, error='CREATION_ERROR', message=str(e))
 
+    def _execute_batch(self, env, payload):
+        """
+        Create many leads in one call.
+
+        All items are validated first, duplicates are removed within the batch
+        and probed against the database with one query, and the remaining
+        leads are inserted with one multi-record ``create``.
+
+        Payload: leads (list of lead objects, max
+                 ``openclaw_gateway.max_batch_leads``), allow_duplicates
+                 (default for items without their own flag).
+
+        Returns:
+            dict: {'success': True, 'data': {'results': [...], 'created': int, 'failed': int}}
+                  with one result per item, in input order
+        """
+        leads = payload.get('leads')
+        max_leads = int(env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.max_batch_leads', DEFAULT_MAX_BATCH_LEADS))
+        if not isinstance(leads, list) or not leads:
+            return self._format_response(False, error='INVALID_LEADS', message='"leads" must be a non-empty list')
+        if len(leads) > max_leads:
+            return self._format_response(
+                False, error='BATCH_TOO_LARGE', message=f'At most {max_leads} leads per call'
+            )
+
+        Lead = env['crm.lead'].sudo()
+        results = [None] * len(leads)
+        candidates = []
+        for index, item in enumerate(leads):
+            lead_data = self._validate_lead_data(item) if isinstance(item, dict) else {
+                'error': 'INVALID_ITEM', 'message': 'Each lead must be an object'
+            }
+            if 'error' in lead_data:
+                results[index] = {'index': index, 'success': False, 'error': lead_data['error'],
+                                  'message': lead_data.get('message')}
+                continue
+            candidates.append((index, item, lead_data, Lead._openclaw_email_key(lead_data.get('email_from'))))
+
+        existing_ids = Lead._openclaw_find_by_email([
+            lead_data.get('email_from') for _index, _item, lead_data, _key in candidates
+        ])
+        seen = {}
+        to_create = []
+        for index, item, lead_data, email_key in candidates:
+            allow_duplicates = item.get('allow_duplicates', payload.get('allow_duplicates', False))
+            if email_key and not allow_duplicates:
+                if email_key in seen:
+                    results[index] = {'index': index, 'success': False, 'error': 'DUPLICATE_IN_BATCH',
+                                      'message': f"Same email as item {seen[email_key]}",
+                                      'duplicate_of': seen[email_key]}
+                    continue
+                if email_key in existing_ids:
+                    results[index] = {'index': index, 'success': False, 'error': 'DUPLICATE_FOUND',
+                                      'message': f"Lead with email {lead_data['email_from']} already exists",
+                                      'duplicate_id': existing_ids[email_key]}
+                    continue
+            if email_key:
+                seen.setdefault(email_key, index)
+            to_create.append((index, lead_data))
+
+        for index, lead in self._create_leads(env, to_create):
+            if isinstance(lead, Exception):
+                results[index] = {'index': index, 'success': False, 'error': 'CREATION_ERROR', 'message': str(lead)}
+            else:
+                results[index] = dict(self._lead_summary(lead), index=index, success=True)
+
+        created = sum(1 for result in results if result['success'])
+        return self._format_response(True, data={
+            'results': results,
+            'created': created,
+            'failed': len(results) - created,
+        })
+
+    def _create_leads(self, env, to_create):
+        """
+        Insert leads with one ``create``; if that fails, retry one by one so a
+        single bad item does not sink the batch.
+
+        Yields:
+            tuple: (index, lead record or the Exception raised for that item)
+        """
+        if not to_create:
+            return
+        Lead = env['crm.lead'].sudo()
+        try:
+            with env.cr.savepoint():
+                leads = Lead.create([lead_data for _index, lead_data in to_create])
+        except Exception as e:
+            _logger.info("Batch lead create failed (%s), retrying per item", e)
+            for index, lead_data in to_create:
+                try:
+                    with env.cr.savepoint():
+                        yield index, Lead.create(lead_data)
+                except Exception as item_error:
+                    yield index, item_error
+            return
+        for (index, _lead_data), lead in zip(to_create, leads):
+            yield index, lead
+
+    def _lead_summary(self, lead):
+        """Return the public fields of a created lead."""
+        return {
+            'lead_id': lead.id,
+            'name': lead.name,
+            'stage': lead.stage_id.name if lead.stage_id else 'New',
+            'assigned_to': lead.user_id.name if lead.user_id else None,
+            'team': lead.team_id.name if lead.team_id else None,
+            'probability': lead.probability,
+        }
+
     def _validate_lead_data(self, payload):
         """Validate and sanitize lead data; return dict with error key if invalid."""
         name = payload.get('name')
@@ -95,8 +203,10 @@ class AdvancedLeadExecutor(BaseExecutor):
         return lead_data
 
     def _check_duplicate(self, env, lead_data):
-        """Return existing lead if same email_from exists, else None."""
+        """Return existing lead if the same normalized email exists, else None."""
         email = lead_data.get('email_from')
         if not email:
             return None
-        return env['crm.lead'].sudo().search([('email_from', '=', email)], limit=1) or None
+        Lead = env['crm.lead'].sudo()
+        lead_id = Lead._openclaw_find_by_email([email]).get(Lead._openclaw_email_key(email))
+        return Lead.browse(lead_id) if lead_id else None
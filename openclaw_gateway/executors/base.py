@@ -1,9 +1,35 @@
 # -*- coding: utf-8 -*-
 """Base Executor Class for OpenClaw Skills"""
 import logging
+import time
+from datetime import datetime
+
+from odoo.tools import email_normalize
 
 _logger = logging.getLogger(__name__)
 
+# Response formats that use the columnar layout for record lists
+COLUMNAR_FORMATS = ('columnar', 'msgpack')
+
+# Ordering for incremental (``since``) queries; must match the watermark comparison
+WATERMARK_ORDER = 'write_date asc, id asc'
+WATERMARK_SEPARATOR = '|'
+# Seconds incremental pages stay behind the present (``openclaw_gateway.since_safety_lag_seconds``).
+# write_date is the writing transaction's start time, so a row may commit with a
+# write_date older than watermarks already handed out; holding pages back lets
+# such transactions commit before their rows can be passed by a watermark.
+DEFAULT_SINCE_SAFETY_LAG_SECONDS = 60
+
+# ``search_mode`` values: substring match, or trigram similarity ranking
+SEARCH_MODES = ('ilike', 'fuzzy')
+
+# Maximum values resolved by one multi-get (``lookup_by``/``values``) request
+MAX_LOOKUP_VALUES = 500
+
+
+class SkillTimeout(Exception):
+    """Raised when a skill execution exceeds its time budget."""
+
 
 class BaseExecutor:
     """
@@ -11,6 +37,9 @@ class BaseExecutor:
     All executors should inherit from this class.
     """
     
+    # Requested response format ('json', 'columnar' or 'msgpack'), set by the skill router
+    response_format = 'json'
+    
     def execute(self, env, payload):
         """
         Execute the skill with given payload.
@@ -24,6 +53,25 @@ class BaseExecutor:
         """
         raise NotImplementedError("Subclasses must implement execute() method")
     
+    def _check_budget(self, env):
+        """
+        Checkpoint against the skill's time budget (called by the query helpers).
+        
+        ``statement_timeout`` is a per-statement limit, so before each further
+        query it is lowered to what is left of the budget; once the budget is
+        spent the execution is aborted right away.
+        
+        Raises:
+            SkillTimeout: When the deadline set by the skill router has passed
+        """
+        deadline = env.context.get('openclaw_deadline')
+        if deadline is None:
+            return
+        remaining_ms = int((deadline - time.monotonic()) * 1000)
+        if remaining_ms <= 0:
+            raise SkillTimeout()
+        env.cr.execute("SET LOCAL statement_timeout = %s", (remaining_ms,))
+    
     def _validate_limit(self, limit, max_limit):
         """
         Validate and sanitize limit parameter.
@@ -44,7 +92,7 @@ class BaseExecutor:
         limit = max(1, min(limit, max_limit))
         return limit
     
-    def _format_response(self, success, data=None, error=None, message=None):
+    def _format_response(self, success, data=None, error=None, message=None, **extra):
         """
         Format standardized response.
         
@@ -53,6 +101,7 @@ class BaseExecutor:
             data: Response data
             error (str): Error code if failed
             message (str): Human-readable message
+            **extra: Additional top-level keys (e.g. duplicate_id)
             
         Returns:
             dict: Standardized response
@@ -61,15 +110,340 @@ class BaseExecutor:
         
         if success:
             if data is not None:
+                if self.response_format in COLUMNAR_FORMATS:
+                    data = self._to_columnar(data)
                 response['data'] = data
         else:
             if error:
                 response['error'] = error
             if message:
                 response['message'] = message
+        response.update(extra)
         
         return response
     
+    def _to_columnar(self, data):
+        """
+        Convert top-level record lists in ``data`` to the columnar layout.
+        
+        ``[{'id': 1, 'name': 'A'}, {'id': 2, 'name': 'B'}]`` becomes
+        ``{'fields': ['id', 'name'], 'columns': [[1, 2], ['A', 'B']]}`` so
+        field names are sent once instead of once per row. ``fields`` is the
+        ordered union of the keys of all rows.
+        
+        Args:
+            data (dict): Response data built from projected rows
+            
+        Returns:
+            dict: Data with record lists transposed
+        """
+        if not isinstance(data, dict):
+            return data
+        columnar = {}
+        for key, value in data.items():
+            if isinstance(value, list) and value and all(isinstance(row, dict) for row in value):
+                # Rows may differ in keys (e.g. optional fields); missing values become None
+                field_names = list(dict.fromkeys(name for row in value for name in row))
+                value = {
+                    'fields': field_names,
+                    'columns': [[row.get(name) for row in value] for name in field_names],
+                }
+            columnar[key] = value
+        return columnar
+    
+    def _parse_include(self, payload, allowed):
+        """
+        Read the ``include`` parameter (list or comma-separated string).
+        
+        Args:
+            payload (dict): Skill payload
+            allowed (tuple): Relation names the executor can expand
+            
+        Returns:
+            tuple: (list of relation names, error message or None)
+        """
+        include = payload.get('include') or []
+        if isinstance(include, str):
+            include = [name.strip() for name in include.split(',') if name.strip()]
+        unknown = [name for name in include if name not in allowed]
+        if unknown:
+            return [], f'Unknown include {unknown}; allowed: {list(allowed)}'
+        return include, None
+    
+    def _include_limit(self, payload, default=50, maximum=200):
+        """Per-parent row cap for expanded one2many relations."""
+        return self._validate_limit(payload.get('include_limit') or default, maximum)
+    
+    def _fetch_children(self, env, model_name, parent_field, parent_ids, fields_list,
+                        limit_per_parent, order='sequence, id', where=None):
+        """
+        Fetch child rows for a whole page of parents in one batched read.
+        
+        A single windowed query selects at most ``limit_per_parent`` child ids
+        per parent, then one ``read`` loads them all (no per-parent queries).
+        
+        Args:
+            env: Odoo environment
+            model_name (str): Child model (e.g. 'sale.order.line')
+            parent_field (str): Many2one column pointing at the parent
+            parent_ids (list): Parent record ids
+            fields_list (list): Fields to read on the children
+            limit_per_parent (int): Row cap per parent
+            order (str): SQL ordering of children within a parent
+            where (str): Optional extra SQL condition on the child table
+            
+        Returns:
+            dict: {parent_id: [child row dicts]} (parents without children are absent)
+        """
+        if not parent_ids:
+            return {}
+        self._check_budget(env)
+        Child = env[model_name].sudo()
+        Child.flush_model()
+        env.cr.execute(f"""
+            SELECT id FROM (
+                SELECT id, {parent_field}, row_number() OVER (PARTITION BY {parent_field} ORDER BY {order}) AS rn
+                FROM {Child._table}
+                WHERE {parent_field} = ANY(%s) {'AND ' + where if where else ''}
+            ) ranked
+            WHERE rn <= %s
+            ORDER BY {parent_field}, rn
+        """, (list(parent_ids), limit_per_parent))
+        child_ids = [row[0] for row in env.cr.fetchall()]
+        children = {}
+        for row in Child.browse(child_ids).read(list(fields_list) + [parent_field]):
+            children.setdefault(row[parent_field][0], []).append(row)
+        return children
+    
+    def _read_by_id(self, env, model_name, ids, fields_list):
+        """Read many records at once and index the rows by id."""
+        ids = list({record_id for record_id in ids if record_id})
+        if not ids:
+            return {}
+        self._check_budget(env)
+        return {row['id']: row for row in env[model_name].sudo().browse(ids).read(fields_list)}
+    
+    def _partner_rows(self, env, partner_ids):
+        """Batched contact details for the ``partner`` include, indexed by partner id."""
+        rows = self._read_by_id(env, 'res.partner', partner_ids, ['name', 'email', 'phone', 'city', 'country_id'])
+        return {
+            partner_id: {
+                'id': partner_id,
+                'name': row['name'],
+                'email': row['email'] or None,
+                'phone': row['phone'] or None,
+                'city': row['city'] or None,
+                'country': self._m2o_name(row['country_id']),
+            }
+            for partner_id, row in rows.items()
+        }
+    
+    def _m2o_name(self, value):
+        """Display name from a many2one value returned by ``read`` ((id, name) or False)."""
+        return value[1] if value else None
+    
+    def _m2o_id(self, value):
+        """Id from a many2one value returned by ``read``."""
+        return value[0] if value else None
+    
+    def _parse_since(self, payload):
+        """
+        Parse the ``since`` watermark ("<write_date ISO>|<id>" or a bare date/datetime).
+        
+        Returns:
+            tuple: ((write_date, id) or None, error message or None)
+        """
+        since = payload.get('since')
+        if not since:
+            return None, None
+        write_date, _sep, record_id = str(since).partition(WATERMARK_SEPARATOR)
+        try:
+            return (datetime.fromisoformat(write_date.strip()), int(record_id or 0)), None
+        except ValueError:
+            return None, f'Invalid since watermark {since!r}; expected "<write_date ISO>|<id>"'
+    
+    def _incremental_query(self, env, payload, domain, order):
+        """
+        Apply the ``since`` watermark of ``payload`` to a list query.
+        
+        Args:
+            env: Odoo environment
+            payload (dict): Skill payload
+            domain (list): Query domain
+            order (str): Ordering used without ``since``
+            
+        Returns:
+            tuple: (parsed watermark or None, domain, order, error message or None)
+        """
+        since, since_error = self._parse_since(payload)
+        if not since:
+            return None, domain, order, since_error
+        return since, self._apply_since(env, domain, since), WATERMARK_ORDER, None
+    
+    def _apply_since(self, env, domain, since):
+        """
+        Restrict ``domain`` to records after the (write_date, id) watermark and before the horizon.
+        
+        Records written after ``_since_horizon`` are left for a later page, so
+        the next watermark never passes a transaction that is still open.
+        """
+        write_date, record_id = since
+        return domain + [
+            '|',
+            ('write_date', '>', write_date),
+            '&', ('write_date', '=', write_date), ('id', '>', record_id),
+            ('write_date', '<', self._since_horizon(env)),
+        ]
+    
+    def _since_horizon(self, env):
+        """
+        Return the newest write_date that incremental pages may include (naive UTC).
+        
+        This is the earlier of ``now() - openclaw_gateway.since_safety_lag_seconds``
+        and the start of the oldest transaction still open in the database, so
+        rows of running transactions (which carry their start time as
+        write_date) are never skipped by a watermark.
+        """
+        lag = int(env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.since_safety_lag_seconds', DEFAULT_SINCE_SAFETY_LAG_SECONDS))
+        env.cr.execute("""
+            SELECT LEAST(
+                now() - make_interval(secs => %s),
+                (SELECT min(xact_start) FROM pg_stat_activity
+                 WHERE datname = current_database() AND xact_start IS NOT NULL)
+            ) AT TIME ZONE 'UTC'
+        """, (max(lag, 0),))
+        return env.cr.fetchone()[0]
+    
+    def _change_feed(self, env, model_name, records, since):
+        """
+        Build the incremental-sync fields for a page fetched with ``since``.
+        
+        Args:
+            env: Odoo environment
+            model_name (str): Queried model (for tombstone lookup)
+            records: Page of records, ordered by WATERMARK_ORDER
+            since (tuple): Parsed (write_date, id) watermark
+            
+        Returns:
+            dict: {'next_watermark': str, 'deleted': [ids deleted after the watermark date]}
+        """
+        self._check_budget(env)
+        if records:
+            last = records[-1]
+            next_watermark = f'{last.write_date.isoformat()}{WATERMARK_SEPARATOR}{last.id}'
+        else:
+            next_watermark = f'{since[0].isoformat()}{WATERMARK_SEPARATOR}{since[1]}'
+        return {
+            'next_watermark': next_watermark,
+            'deleted': env['openclaw.tombstone'].sudo().deleted_since(model_name, since[0]),
+        }
+    
+    def _parse_search_mode(self, payload):
+        """
+        Validate ``search_mode`` against the other query options.
+        
+        Returns:
+            tuple: ('ilike' or 'fuzzy', error message or None)
+        """
+        mode = payload.get('search_mode') or 'ilike'
+        if mode not in SEARCH_MODES:
+            return None, f'search_mode must be one of: {", ".join(SEARCH_MODES)}'
+        if mode == 'fuzzy' and payload.get('since'):
+            return None, 'search_mode "fuzzy" cannot be combined with since'
+        return mode, None
+    
+    def _fuzzy_search(self, env, Model, term, domain, limit):
+        """
+        Rank records by trigram similarity to ``term``.
+        
+        Returns:
+            tuple: (records, {id: score}), or (None, None) when pg_trgm is not
+                   installed and the caller should fall back to ilike
+        """
+        if not env.registry.has_trigram:
+            return None, None
+        self._check_budget(env)
+        matches = Model._openclaw_fuzzy_search(term, domain, limit=limit)
+        records = Model.browse([record.id for record, _score in matches])
+        return records, {record.id: score for record, score in matches}
+    
+    def _parse_lookup(self, payload, lookup_fields):
+        """
+        Validate a multi-get request (``lookup_by`` + ``values``).
+        
+        Args:
+            payload (dict): Skill payload
+            lookup_fields (dict): {lookup_by value: field compared with '='}
+            
+        Returns:
+            tuple: (lookup_by or None, values, error message or None)
+        """
+        lookup_by = payload.get('lookup_by')
+        if not lookup_by:
+            return None, None, None
+        if lookup_by not in lookup_fields:
+            return None, None, f'lookup_by must be one of: {", ".join(lookup_fields)}'
+        values = payload.get('values')
+        if not isinstance(values, list) or not values:
+            return None, None, '"values" must be a non-empty list'
+        if len(values) > MAX_LOOKUP_VALUES:
+            return None, None, f'At most {MAX_LOOKUP_VALUES} values per lookup'
+        if any(not isinstance(value, (str, int)) or isinstance(value, bool) for value in values):
+            return None, None, '"values" must contain strings or integers'
+        return lookup_by, values, None
+    
+    def _lookup_key(self, lookup_by, value):
+        """Stored form of a lookup value (None when it cannot match anything)."""
+        if lookup_by == 'id':
+            try:
+                return int(value)
+            except ValueError:
+                return None
+        if lookup_by == 'email':
+            return email_normalize(str(value)) or None
+        return str(value).strip() or None
+    
+    def _lookup(self, Model, lookup_by, field_name, values, domain):
+        """
+        Resolve many values with one indexed ``IN`` query.
+        
+        Args:
+            Model: Model to query (sudo)
+            lookup_by (str): Lookup kind, see ``_lookup_key``
+            field_name (str): Field compared with the normalized values
+            values (list): Values as sent by the caller
+            domain (list): Extra filters
+            
+        Returns:
+            dict: {value: record or None}; the lowest id wins when several records match
+        """
+        keys = {value: self._lookup_key(lookup_by, value) for value in values}
+        wanted = list({key for key in keys.values() if key is not None})
+        by_key = {}
+        if wanted:
+            self._check_budget(Model.env)
+            for record in Model.search(domain + [(field_name, 'in', wanted)], order='id'):
+                by_key.setdefault(record[field_name], record)
+        return {value: by_key.get(key) for value, key in keys.items()}
+    
+    def _lookup_response(self, lookup_by, matches, format_row):
+        """
+        Build the multi-get response keyed by the input values.
+        
+        Returns:
+            dict: Standardized response with {'lookup_by', 'results': {value: row or None},
+                  'found': int, 'not_found': [values]}
+        """
+        results = {value: format_row(record) if record else None for value, record in matches.items()}
+        not_found = [value for value, row in results.items() if row is None]
+        return self._format_response(success=True, data={
+            'lookup_by': lookup_by,
+            'results': results,
+            'found': len(results) - len(not_found),
+            'not_found': not_found,
+        })
+    
     def _safe_field_value(self, record, field_name):
         """
         Safely extract field value from record, handling Many2one fields.
@@ -147,6 +147,12 @@ class BulkImportExecutor(BaseExecutor):
         }
         lead_model = env['crm.lead'].sudo()
         allowed = {'name', 'partner_name', 'email_from', 'phone', 'description', 'type', 'user_id', 'team_id'}
+        # One indexed probe for the whole batch; leads created below are added as we go
+        existing_ids = {}
+        if not validate_only:
+            existing_ids = lead_model._openclaw_find_by_email(
+                record.get('email_from') for record in data[:batch_size] if isinstance(record, dict)
+            )
         for i, record in enumerate(data[:batch_size]):
             if not isinstance(record, dict):
                 results['errors'].append({'line': i + 1, 'error': 'Record must be a dict'})
@@ -161,16 +167,17 @@ class BulkImportExecutor(BaseExecutor):
                 vals = {k: v for k, v in record.items() if k in lead_model._fields and k in allowed}
                 if 'type' not in vals:
                     vals['type'] = 'opportunity'
-                existing = False
-                if record.get('email_from'):
-                    existing = lead_model.search([('email_from', '=', record['email_from'])], limit=1)
+                email_key = lead_model._openclaw_email_key(record.get('email_from'))
+                existing = lead_model.browse(existing_ids[email_key]) if email_key in existing_ids else False
                 if existing and update_existing:
                     existing.write(vals)
                     results['updated'] += 1
                 elif existing:
                     results['skipped'] += 1
                 else:
-                    lead_model.create(vals)
+                    lead = lead_model.create(vals)
+                    if email_key:
+                        existing_ids[email_key] = lead.id
                     results['created'] += 1
                 results['processed'] += 1
             except Exception as e:
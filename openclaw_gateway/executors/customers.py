@@ -2,6 +2,9 @@
 """Customers Executor"""
 from .base import BaseExecutor
 
+# ``lookup_by`` values and the field each one is matched on
+LOOKUP_FIELDS = {'email': 'email_normalized', 'id': 'id'}
+
 
 class CustomersExecutor(BaseExecutor):
     """Executor for querying customers"""
@@ -16,7 +19,11 @@ class CustomersExecutor(BaseExecutor):
                 'limit': int (optional, default 10),
                 'is_company': bool (optional, filter companies only),
                 'country_id': int (optional, filter by country),
-                'search': str (optional, search in name/email)
+                'search': str (optional, search in name/email),
+                'search_mode': 'ilike' | 'fuzzy' (optional, fuzzy ranks by trigram similarity),
+                'lookup_by': 'email' | 'id' (optional, multi-get by exact match),
+                'values': list (with lookup_by, max 500 values),
+                'since': str (optional, watermark 'write_date|id' for incremental sync)
             }
             
         Returns:
@@ -31,42 +38,64 @@ class CustomersExecutor(BaseExecutor):
             domain.append(('is_company', '=', bool(payload['is_company'])))
         if payload.get('country_id'):
             domain.append(('country_id', '=', int(payload['country_id'])))
-        if payload.get('search'):
-            search_term = payload['search']
+        lookup_by, lookup_values, lookup_error = self._parse_lookup(payload, LOOKUP_FIELDS)
+        if lookup_error:
+            return self._format_response(success=False, error='INVALID_LOOKUP', message=lookup_error)
+        if lookup_by:
+            try:
+                Partner = env['res.partner'].sudo()
+                matches = self._lookup(Partner, lookup_by, LOOKUP_FIELDS[lookup_by], lookup_values, domain)
+                return self._lookup_response(lookup_by, matches, self._customer_row)
+            except Exception as e:
+                return self._format_response(
+                    success=False,
+                    error='QUERY_ERROR',
+                    message=f'Failed to look up customers: {str(e)}'
+                )
+        
+        search_mode, search_error = self._parse_search_mode(payload)
+        if search_error:
+            return self._format_response(success=False, error='INVALID_SEARCH_MODE', message=search_error)
+        search_term = payload.get('search')
+        filter_domain = list(domain)
+        if search_term:
             domain.append('|')
             domain.append(('name', 'ilike', search_term))
             domain.append(('email', 'ilike', search_term))
         
+        # Incremental mode: only records changed after the watermark
+        since, domain, order, since_error = self._incremental_query(env, payload, domain, 'name asc')
+        if since_error:
+            return self._format_response(success=False, error='INVALID_SINCE', message=since_error)
+        
         try:
             # Query customers
             Partner = env['res.partner'].sudo()
-            customers = Partner.search(domain, limit=limit, order='name asc')
+            scores = None
+            if search_term and search_mode == 'fuzzy':
+                customers, scores = self._fuzzy_search(env, Partner, search_term, filter_domain, limit)
+            if scores is None:
+                customers = Partner.search(domain, limit=limit, order=order)
             
             # Format results
-            customers_data = []
-            for customer in customers:
-                customers_data.append({
-                    'id': customer.id,
-                    'name': customer.name,
-                    'email': customer.email,
-                    'phone': customer.phone,
-                    'mobile': customer.mobile,
-                    'is_company': customer.is_company,
-                    'street': customer.street,
-                    'city': customer.city,
-                    'country': self._safe_field_value(customer, 'country_id'),
-                    'vat': customer.vat,
-                    'customer_rank': customer.customer_rank,
-                })
+            customers_data = [self._customer_row(customer) for customer in customers]
             
-            return self._format_response(
-                success=True,
-                data={
-                    'customers': customers_data,
-                    'count': len(customers_data),
-                    'total_available': Partner.search_count(domain)
-                }
-            )
+            if scores is not None:
+                for row in customers_data:
+                    row['score'] = scores[row['id']]
+            
+            data = {
+                'customers': customers_data,
+                'count': len(customers_data),
+            }
+            if scores is None:
+                data['total_available'] = Partner.search_count(domain)
+            if search_term:
+                data['search_mode'] = 'fuzzy' if scores is not None else 'ilike'
+            if since:
+                data.update(self._change_feed(env, 'res.partner', customers, since))
+            
+            return self._format_response(success=True, data=data)
             
         except Exception as e:
             return self._format_response(
@@ -74,3 +103,19 @@ class CustomersExecutor(BaseExecutor):
                 error='QUERY_ERROR',
                 message=f'Failed to query customers: {str(e)}'
             )
+    
+    def _customer_row(self, customer):
+        """Serialize one customer for the response."""
+        return {
+            'id': customer.id,
+            'name': customer.name,
+            'email': customer.email,
+            'phone': customer.phone,
+            'mobile': customer.mobile,
+            'is_company': customer.is_company,
+            'street': customer.street,
+            'city': customer.city,
+            'country': self._safe_field_value(customer, 'country_id'),
+            'vat': customer.vat,
+            'customer_rank': customer.customer_rank,
+        }
@@ -15,7 +15,8 @@ class EmployeesExecutor(BaseExecutor):
             payload (dict): {
                 'limit': int (optional, default 10),
                 'department_id': int (optional, filter by department),
-                'active': bool (optional, filter active/inactive)
+                'active': bool (optional, filter active/inactive),
+                'since': str (optional, watermark 'write_date|id' for incremental sync)
             }
             
         Returns:
@@ -30,10 +31,15 @@ class EmployeesExecutor(BaseExecutor):
         if payload.get('active') is not None:
             domain.append(('active', '=', bool(payload['active'])))
         
+        # Incremental mode: only records changed after the watermark
+        since, domain, order, since_error = self._incremental_query(env, payload, domain, 'name asc')
+        if since_error:
+            return self._format_response(success=False, error='INVALID_SINCE', message=since_error)
+        
         try:
             # Query employees
             Employee = env['hr.employee'].sudo()
-            employees = Employee.search(domain, limit=limit, order='name asc')
+            employees = Employee.search(domain, limit=limit, order=order)
             
             # Format results
             employees_data = []
@@ -50,14 +56,15 @@ class EmployeesExecutor(BaseExecutor):
                     'active': employee.active,
                 })
             
-            return self._format_response(
-                success=True,
-                data={
-                    'employees': employees_data,
-                    'count': len(employees_data),
-                    'total_available': Employee.search_count(domain)
-                }
-            )
+            data = {
+                'employees': employees_data,
+                'count': len(employees_data),
+                'total_available': Employee.search_count(domain)
+            }
+            if since:
+                data.update(self._change_feed(env, 'hr.employee', employees, since))
+            
+            return self._format_response(success=True, data=data)
             
         except Exception as e:
             return self._format_response(
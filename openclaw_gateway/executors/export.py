@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Export Executor - Queue Large Extracts as Compressed Attachments"""
+from .base import BaseExecutor
+
+# Models that may be exported, with the only fields that may be exported or
+# filtered on (all of them are written when none are requested)
+EXPORT_MODELS = {
+    'res.partner': ['id', 'name', 'email', 'phone', 'city', 'country_id', 'customer_rank', 'write_date'],
+    'sale.order': ['id', 'name', 'partner_id', 'date_order', 'state', 'amount_total', 'currency_id', 'write_date'],
+    'account.move': ['id', 'name', 'partner_id', 'move_type', 'invoice_date', 'state', 'amount_total',
+                     'payment_state', 'write_date'],
+    'product.product': ['id', 'name', 'default_code', 'barcode', 'list_price', 'qty_available', 'write_date'],
+    'crm.lead': ['id', 'name', 'email_from', 'phone', 'stage_id', 'user_id', 'expected_revenue', 'write_date'],
+    'hr.employee': ['id', 'name', 'job_title', 'department_id', 'work_email', 'write_date'],
+}
+EXPORT_FORMATS = ('ndjson', 'csv')
+
+
+class ExportExecutor(BaseExecutor):
+    """Executor that queues a model/domain/fields extract as a background export job"""
+
+    def execute(self, env, payload):
+        """
+        Validate an export request and queue it.
+
+        Records are read with superuser rights, so fields and domain filters
+        are restricted to the model's allow-list. The matching records are
+        counted by the export cron, not in the request.
+
+        Args:
+            env: Odoo environment
+            payload (dict): {
+                'model': str (required, see EXPORT_MODELS),
+                'domain': list (optional, Odoo domain),
+                'fields': list (optional, subset of the model's allow-list),
+                'export_format': 'ndjson' | 'csv' (default 'ndjson')
+            }
+
+        Returns:
+            dict: {'success': True, 'data': {'job_id', 'status_url', 'export_format'}}
+        """
+        model_name = payload.get('model')
+        if model_name not in EXPORT_MODELS:
+            return self._format_response(
+                success=False,
+                error='INVALID_MODEL',
+                message=f'Model must be one of: {", ".join(sorted(EXPORT_MODELS))}'
+            )
+        Model = env[model_name].sudo()
+
+        allowed_fields = EXPORT_MODELS[model_name]
+        field_names = payload.get('fields') or allowed_fields
+        if not isinstance(field_names, list):
+            return self._format_response(success=False, error='INVALID_FIELD', message='fields must be a list')
+        for name in field_names:
+            if name not in allowed_fields:
+                return self._format_response(
+                    success=False,
+                    error='INVALID_FIELD',
+                    message=f'Field "{name}" cannot be exported from {model_name}; '
+                            f'allowed: {", ".join(allowed_fields)}'
+                )
+
+        export_format = payload.get('export_format') or 'ndjson'
+        if export_format not in EXPORT_FORMATS:
+            return self._format_response(
+                success=False,
+                error='INVALID_FORMAT',
+                message=f'export_format must be one of: {", ".join(EXPORT_FORMATS)}'
+            )
+
+        domain = payload.get('domain') or []
+        if not isinstance(domain, list):
+            return self._format_response(success=False, error='INVALID_DOMAIN', message='domain must be a list')
+        for term in domain:
+            if isinstance(term, (list, tuple)) and term and term[0] not in allowed_fields:
+                return self._format_response(
+                    success=False,
+                    error='INVALID_DOMAIN',
+                    message=f'Cannot filter {model_name} on "{term[0]}"; allowed: {", ".join(allowed_fields)}'
+                )
+        try:
+            # Compiles the domain without running it
+            Model._search(domain)
+        except Exception as e:
+            return self._format_response(success=False, error='INVALID_DOMAIN', message=f'Invalid domain: {str(e)}')
+
+        job = env['openclaw.workflow.job'].sudo().enqueue_export(
+            model_name, domain, field_names, export_format,
+            token_id=env.context.get('openclaw_token_id'),
+        )
+        return self._format_response(
+            success=True,
+            data={
+                'job_id': job.job_id,
+                'status_url': f'/api/workflow/status/{job.job_id}',
+                'export_format': export_format,
+            }
+        )
@@ -3,9 +3,16 @@
 from .base import BaseExecutor
 
 
+INVOICE_LINE_FIELDS = [
+    'product_id', 'name', 'quantity', 'price_unit', 'discount', 'price_subtotal', 'price_total', 'display_type',
+]
+
+
 class InvoicesExecutor(BaseExecutor):
     """Executor for querying invoices"""
     
+    INCLUDES = ('invoice_line_ids', 'partner')
+    
     def execute(self, env, payload):
         """
         Query invoices.
@@ -16,13 +23,19 @@ class InvoicesExecutor(BaseExecutor):
                 'limit': int (optional, default 10),
                 'state': str (optional, filter by state),
                 'partner_id': int (optional, filter by customer),
-                'move_type': str (optional, filter by type: out_invoice, in_invoice, etc.)
+                'move_type': str (optional, filter by type: out_invoice, in_invoice, etc.),
+                'include': list|str (optional, embed 'invoice_line_ids' and/or 'partner'),
+                'include_limit': int (optional, max lines per invoice, default 50),
+                'since': str (optional, watermark 'write_date|id' for incremental sync)
             }
             
         Returns:
             dict: {'success': True, 'data': {'invoices': [...], 'count': int}}
         """
         limit = self._validate_limit(payload.get('limit'), 100)
+        include, include_error = self._parse_include(payload, self.INCLUDES)
+        if include_error:
+            return self._format_response(success=False, error='INVALID_INCLUDE', message=include_error)
         
         # Build domain - only get invoices, not other account moves
         domain = [('move_type', 'in', ['out_invoice', 'in_invoice', 'out_refund', 'in_refund'])]
@@ -34,10 +47,15 @@ class InvoicesExecutor(BaseExecutor):
         if payload.get('move_type'):
             domain = [('move_type', '=', payload['move_type'])]
         
+        # Incremental mode: only records changed after the watermark
+        since, domain, order, since_error = self._incremental_query(env, payload, domain, 'invoice_date desc')
+        if since_error:
+            return self._format_response(success=False, error='INVALID_SINCE', message=since_error)
+        
         try:
             # Query invoices
             AccountMove = env['account.move'].sudo()
-            invoices = AccountMove.search(domain, limit=limit, order='invoice_date desc')
+            invoices = AccountMove.search(domain, limit=limit, order=order)
             
             # Format results
             invoices_data = []
@@ -57,14 +75,18 @@ class InvoicesExecutor(BaseExecutor):
                     'payment_state': invoice.payment_state,
                 })
             
-            return self._format_response(
-                success=True,
-                data={
-                    'invoices': invoices_data,
-                    'count': len(invoices_data),
-                    'total_available': AccountMove.search_count(domain)
-                }
-            )
+            if include:
+                self._expand_invoices(env, invoices, invoices_data, include, self._include_limit(payload))
+            
+            data = {
+                'invoices': invoices_data,
+                'count': len(invoices_data),
+                'total_available': AccountMove.search_count(domain)
+            }
+            if since:
+                data.update(self._change_feed(env, 'account.move', invoices, since))
+            
+            return self._format_response(success=True, data=data)
             
         except Exception as e:
             return self._format_response(
@@ -72,3 +94,28 @@ class InvoicesExecutor(BaseExecutor):
                 error='QUERY_ERROR',
                 message=f'Failed to query invoices: {str(e)}'
             )
+    
+    def _expand_invoices(self, env, invoices, invoices_data, include, include_limit):
+        """Embed requested relations, one batched read per relation for the whole page."""
+        if 'invoice_line_ids' in include:
+            lines = self._fetch_children(
+                env, 'account.move.line', 'move_id', invoices.ids, INVOICE_LINE_FIELDS, include_limit,
+                where="display_type IN ('product', 'line_section', 'line_note')"
+            )
+            for invoice_data in invoices_data:
+                invoice_data['invoice_line_ids'] = [{
+                    'id': line['id'],
+                    'product_id': self._m2o_id(line['product_id']),
+                    'product': self._m2o_name(line['product_id']),
+                    'description': line['name'],
+                    'quantity': line['quantity'],
+                    'price_unit': line['price_unit'],
+                    'discount': line['discount'],
+                    'price_subtotal': line['price_subtotal'],
+                    'price_total': line['price_total'],
+                    'display_type': line['display_type'],
+                } for line in lines.get(invoice_data['id'], [])]
+        if 'partner' in include:
+            partners = self._partner_rows(env, [data['partner_id'] for data in invoices_data])
+            for invoice_data in invoices_data:
+                invoice_data['partner'] = partners.get(invoice_data['partner_id'])
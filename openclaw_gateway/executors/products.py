@@ -2,6 +2,9 @@
 """Products Executor"""
 from .base import BaseExecutor
 
+# ``lookup_by`` values and the field each one is matched on
+LOOKUP_FIELDS = {'barcode': 'barcode', 'default_code': 'default_code', 'id': 'id'}
+
 
 class ProductsExecutor(BaseExecutor):
     """Executor for querying products"""
@@ -16,7 +19,14 @@ class ProductsExecutor(BaseExecutor):
                 'limit': int (optional, default 10),
                 'active': bool (optional, filter active/inactive),
                 'sale_ok': bool (optional, filter products that can be sold),
-                'search': str (optional, search in name/default_code)
+                'search': str (optional, search in name/default_code),
+                'search_mode': 'ilike' | 'fuzzy' (optional, fuzzy ranks by trigram similarity),
+                'lookup_by': 'barcode' | 'default_code' | 'id' (optional, multi-get by exact match),
+                'values': list (with lookup_by, max 500 values),
+                'pricelist_id': int (optional, adds 'price' computed with this pricelist),
+                'partner_id': int (optional, uses the partner's pricelist if no pricelist_id),
+                'quantity': float (optional, default 1, quantity the prices apply to),
+                'since': str (optional, watermark 'write_date|id' for incremental sync)
             }
             
         Returns:
@@ -30,43 +40,75 @@ class ProductsExecutor(BaseExecutor):
             domain.append(('active', '=', bool(payload['active'])))
         if payload.get('sale_ok') is not None:
             domain.append(('sale_ok', '=', bool(payload['sale_ok'])))
-        if payload.get('search'):
-            search_term = payload['search']
+        pricing, pricing_error = self._parse_pricing(env, payload)
+        if pricing_error:
+            return self._format_response(success=False, error='INVALID_PRICING', message=pricing_error)
+        lookup_by, lookup_values, lookup_error = self._parse_lookup(payload, LOOKUP_FIELDS)
+        if lookup_error:
+            return self._format_response(success=False, error='INVALID_LOOKUP', message=lookup_error)
+        if lookup_by:
+            try:
+                Product = env['product.product'].sudo()
+                matches = self._lookup(Product, lookup_by, LOOKUP_FIELDS[lookup_by], lookup_values, domain)
+                found = Product.browse([record.id for record in matches.values() if record])
+                prices = self._product_prices(env, pricing, found)
+                response = self._lookup_response(lookup_by, matches, lambda product: self._priced_row(product, prices))
+                if pricing and response.get('success'):
+                    response['data']['pricing'] = self._pricing_info(pricing)
+                return response
+            except Exception as e:
+                return self._format_response(
+                    success=False,
+                    error='QUERY_ERROR',
+                    message=f'Failed to look up products: {str(e)}'
+                )
+        
+        search_mode, search_error = self._parse_search_mode(payload)
+        if search_error:
+            return self._format_response(success=False, error='INVALID_SEARCH_MODE', message=search_error)
+        search_term = payload.get('search')
+        filter_domain = list(domain)
+        if search_term:
             domain.append('|')
             domain.append(('name', 'ilike', search_term))
             domain.append(('default_code', 'ilike', search_term))
         
+        # Incremental mode: only records changed after the watermark
+        since, domain, order, since_error = self._incremental_query(env, payload, domain, 'name asc')
+        if since_error:
+            return self._format_response(success=False, error='INVALID_SINCE', message=since_error)
+        
         try:
             # Query products
             Product = env['product.product'].sudo()
-            products = Product.search(domain, limit=limit, order='name asc')
+            scores = None
+            if search_term and search_mode == 'fuzzy':
+                products, scores = self._fuzzy_search(env, Product, search_term, filter_domain, limit)
+            if scores is None:
+                products = Product.search(domain, limit=limit, order=order)
             
             # Format results
-            products_data = []
-            for product in products:
-                products_data.append({
-                    'id': product.id,
-                    'name': product.name,
-                    'default_code': product.default_code,
-                    'barcode': product.barcode,
-                    'list_price': product.list_price,
-                    'standard_price': product.standard_price,
-                    'uom': self._safe_field_value(product, 'uom_id'),
-                    'categ': self._safe_field_value(product, 'categ_id'),
-                    'type': product.type,
-                    'sale_ok': product.sale_ok,
-                    'purchase_ok': product.purchase_ok,
-                    'active': product.active,
-                })
+            prices = self._product_prices(env, pricing, products)
+            products_data = [self._priced_row(product, prices) for product in products]
             
-            return self._format_response(
-                success=True,
-                data={
-                    'products': products_data,
-                    'count': len(products_data),
-                    'total_available': Product.search_count(domain)
-                }
-            )
+            if scores is not None:
+                for row in products_data:
+                    row['score'] = scores[row['id']]
+            
+            data = {
+                'products': products_data,
+                'count': len(products_data),
+            }
+            if scores is None:
+                data['total_available'] = Product.search_count(domain)
+            if search_term:
+                data['search_mode'] = 'fuzzy' if scores is not None else 'ilike'
+            if pricing:
+                data['pricing'] = self._pricing_info(pricing)
+            if since:
+                data.update(self._change_feed(env, 'product.product', products, since))
+            
+            return self._format_response(success=True, data=data)
             
         except Exception as e:
             return self._format_response(
@@ -74,3 +116,83 @@ class ProductsExecutor(BaseExecutor):
                 error='QUERY_ERROR',
                 message=f'Failed to query products: {str(e)}'
             )
+    
+    def _product_row(self, product):
+        """Serialize one product for the response."""
+        return {
+            'id': product.id,
+            'name': product.name,
+            'default_code': product.default_code,
+            'barcode': product.barcode,
+            'list_price': product.list_price,
+            'standard_price': product.standard_price,
+            'uom': self._safe_field_value(product, 'uom_id'),
+            'categ': self._safe_field_value(product, 'categ_id'),
+            'type': product.type,
+            'sale_ok': product.sale_ok,
+            'purchase_ok': product.purchase_ok,
+            'active': product.active,
+        }
+    
+    def _priced_row(self, product, prices):
+        """Product row with its pricelist price when prices were requested."""
+        row = self._product_row(product)
+        if prices is not None:
+            row['price'] = prices.get(product.id)
+        return row
+    
+    def _parse_pricing(self, env, payload):
+        """
+        Resolve the pricelist and quantity of a priced query.
+        
+        Returns:
+            tuple: ((pricelist, quantity) or None, error message or None)
+        """
+        pricelist_id = payload.get('pricelist_id')
+        partner_id = payload.get('partner_id')
+        if not pricelist_id and not partner_id:
+            return None, None
+        try:
+            quantity = float(payload.get('quantity') or 1)
+        except (TypeError, ValueError):
+            return None, 'quantity must be a number'
+        if quantity <= 0:
+            return None, 'quantity must be positive'
+        try:
+            if pricelist_id:
+                pricelist = env['product.pricelist'].sudo().browse(int(pricelist_id)).exists()
+            else:
+                partner = env['res.partner'].sudo().browse(int(partner_id)).exists()
+                if not partner:
+                    return None, f'Partner {partner_id} not found'
+                pricelist = partner.property_product_pricelist
+        except (TypeError, ValueError):
+            return None, 'pricelist_id and partner_id must be integers'
+        if not pricelist:
+            return None, 'No pricelist found for the request'
+        return (pricelist, quantity), None
+    
+    def _pricing_info(self, pricing):
+        """Describe the pricelist applied to the ``price`` values."""
+        pricelist, quantity = pricing
+        return {
+            'pricelist_id': pricelist.id,
+            'pricelist': pricelist.name,
+            'currency': pricelist.currency_id.name,
+            'quantity': quantity,
+        }
+    
+    def _product_prices(self, env, pricing, products):
+        """
+        Compute pricelist prices for a page of products in one evaluation.
+        
+        The pricelist rules come from the per-worker rules cache, which any
+        rule change invalidates; prices themselves are always computed fresh.
+        
+        Returns:
+            dict|None: {product_id: price}, or None when no pricing was requested
+        """
+        if not pricing:
+            return None
+        pricelist, quantity = pricing
+        return pricelist.with_context(openclaw_cached_rules=True)._get_products_price(products, quantity)
@@ -3,9 +3,16 @@
 from .base import BaseExecutor
 
 
+ORDER_LINE_FIELDS = [
+    'product_id', 'name', 'product_uom_qty', 'price_unit', 'discount', 'price_subtotal', 'price_total',
+]
+
+
 class SalesOrdersExecutor(BaseExecutor):
     """Executor for querying sales orders"""
     
+    INCLUDES = ('order_line', 'partner')
+    
     def execute(self, env, payload):
         """
         Query sales orders.
@@ -15,13 +22,19 @@ class SalesOrdersExecutor(BaseExecutor):
             payload (dict): {
                 'limit': int (optional, default 10),
                 'state': str (optional, filter by state),
-                'partner_id': int (optional, filter by customer)
+                'partner_id': int (optional, filter by customer),
+                'include': list|str (optional, embed 'order_line' and/or 'partner'),
+                'include_limit': int (optional, max lines per order, default 50),
+                'since': str (optional, watermark 'write_date|id' for incremental sync)
             }
             
         Returns:
             dict: {'success': True, 'data': {'orders': [...], 'count': int}}
         """
         limit = self._validate_limit(payload.get('limit'), 100)
+        include, include_error = self._parse_include(payload, self.INCLUDES)
+        if include_error:
+            return self._format_response(success=False, error='INVALID_INCLUDE', message=include_error)
         
         # Build domain
         domain = []
@@ -30,10 +43,15 @@ class SalesOrdersExecutor(BaseExecutor):
         if payload.get('partner_id'):
             domain.append(('partner_id', '=', int(payload['partner_id'])))
         
+        # Incremental mode: only records changed after the watermark
+        since, domain, order, since_error = self._incremental_query(env, payload, domain, 'date_order desc')
+        if since_error:
+            return self._format_response(success=False, error='INVALID_SINCE', message=since_error)
+        
         try:
             # Query orders
             SaleOrder = env['sale.order'].sudo()
-            orders = SaleOrder.search(domain, limit=limit, order='date_order desc')
+            orders = SaleOrder.search(domain, limit=limit, order=order)
             
             # Format results
             orders_data = []
@@ -50,14 +68,18 @@ class SalesOrdersExecutor(BaseExecutor):
                     'user_id': self._safe_field_value(order, 'user_id'),
                 })
             
-            return self._format_response(
-                success=True,
-                data={
-                    'orders': orders_data,
-                    'count': len(orders_data),
-                    'total_available': SaleOrder.search_count(domain)
-                }
-            )
+            if include:
+                self._expand_orders(env, orders, orders_data, include, self._include_limit(payload))
+            
+            data = {
+                'orders': orders_data,
+                'count': len(orders_data),
+                'total_available': SaleOrder.search_count(domain)
+            }
+            if since:
+                data.update(self._change_feed(env, 'sale.order', orders, since))
+            
+            return self._format_response(success=True, data=data)
             
         except Exception as e:
             return self._format_response(
@@ -65,3 +87,26 @@ class SalesOrdersExecutor(BaseExecutor):
                 error='QUERY_ERROR',
                 message=f'Failed to query sales orders: {str(e)}'
             )
+    
+    def _expand_orders(self, env, orders, orders_data, include, include_limit):
+        """Embed requested relations, one batched read per relation for the whole page."""
+        if 'order_line' in include:
+            lines = self._fetch_children(
+                env, 'sale.order.line', 'order_id', orders.ids, ORDER_LINE_FIELDS, include_limit
+            )
+            for order_data in orders_data:
+                order_data['order_line'] = [{
+                    'id': line['id'],
+                    'product_id': self._m2o_id(line['product_id']),
+                    'product': self._m2o_name(line['product_id']),
+                    'description': line['name'],
+                    'quantity': line['product_uom_qty'],
+                    'price_unit': line['price_unit'],
+                    'discount': line['discount'],
+                    'price_subtotal': line['price_subtotal'],
+                    'price_total': line['price_total'],
+                } for line in lines.get(order_data['id'], [])]
+        if 'partner' in include:
+            partners = self._partner_rows(env, [data['partner_id'] for data in orders_data])
+            for order_data in orders_data:
+                order_data['partner'] = partners.get(order_data['partner_id'])
@@ -14,7 +14,8 @@ class UsersExecutor(BaseExecutor):
             env: Odoo environment
             payload (dict): {
                 'limit': int (optional, default 10),
-                'active': bool (optional, filter active/inactive)
+                'active': bool (optional, filter active/inactive),
+                'since': str (optional, watermark 'write_date|id' for incremental sync)
             }
             
         Returns:
@@ -27,10 +28,15 @@ class UsersExecutor(BaseExecutor):
         if payload.get('active') is not None:
             domain.append(('active', '=', bool(payload['active'])))
         
+        # Incremental mode: only records changed after the watermark
+        since, domain, order, since_error = self._incremental_query(env, payload, domain, 'name asc')
+        if since_error:
+            return self._format_response(success=False, error='INVALID_SINCE', message=since_error)
+        
         try:
             # Query users
             User = env['res.users'].sudo()
-            users = User.search(domain, limit=limit, order='name asc')
+            users = User.search(domain, limit=limit, order=order)
             
             # Format results
             users_data = []
@@ -46,14 +52,15 @@ class UsersExecutor(BaseExecutor):
                     'tz': user.tz,
                 })
             
-            return self._format_response(
-                success=True,
-                data={
-                    'users': users_data,
-                    'count': len(users_data),
-                    'total_available': User.search_count(domain)
-                }
-            )
+            data = {
+                'users': users_data,
+                'count': len(users_data),
+                'total_available': User.search_count(domain)
+            }
+            if since:
+                data.update(self._change_feed(env, 'res.users', users, since))
+            
+            return self._format_response(success=True, data=data)
             
         except Exception as e:
             return self._format_response(
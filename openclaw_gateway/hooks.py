@@ -97,6 +97,7 @@ def post_init_hook(cr, registry):
                 'description': 'Bulk import records for customers (res.partner), products (product.template), or leads (crm.lead). Payload: type (customers|products|leads), data (list of dicts), validate_only, batch_size (default 50, max 500), update_existing.',
                 'executor': 'bulk_import',
                 'max_limit': 500,
+                'timeout_ms': 300000,
                 'input_schema_json': '{"type": "string (required: customers|products|leads)", "data": "array of records (required)", "validate_only": "bool", "batch_size": "int (1-500)", "update_existing": "bool"}',
                 'output_schema_json': '{"total_records": "int", "processed": "int", "created": "int", "updated": "int", "skipped": "int", "errors": "array"}',
             })
@@ -106,11 +107,11 @@ def post_init_hook(cr, registry):
                 'code': 'advanced_lead',
                 'sequence': 96,
                 'active': True,
-                'description': 'Create a CRM lead with validation (email format, duplicate check). Payload: name (required), email_from, phone, partner_name, description, priority (low|medium|high), allow_duplicates.',
+                'description': 'Create a CRM lead with validation (email format, duplicate check). Payload: name (required), email_from, phone, partner_name, description, priority (low|medium|high), allow_duplicates; or leads (list of such objects) to create a batch in one call.',
                 'executor': 'advanced_lead',
                 'max_limit': 1,
-                'input_schema_json': '{"name": "string (required)", "email_from": "string", "phone": "string", "partner_name": "string", "description": "string", "priority": "low|medium|high", "allow_duplicates": "bool"}',
-                'output_schema_json': '{"lead_id": "int", "name": "string", "stage": "string", "assigned_to": "string", "team": "string", "probability": "float"}',
+                'input_schema_json': '{"name": "string (required)", "email_from": "string", "phone": "string", "partner_name": "string", "description": "string", "priority": "low|medium|high", "allow_duplicates": "bool", "leads": "array of lead objects (batch mode)"}',
+                'output_schema_json': '{"lead_id": "int", "name": "string", "stage": "string", "assigned_to": "string", "team": "string", "probability": "float", "results": "array (batch mode: index, success, lead_id | error, duplicate_id, duplicate_of)", "created": "int", "failed": "int"}',
             })
     except (ValueError, KeyError):
         # Old code: executor selection does not include bulk_import/advanced_lead; skip
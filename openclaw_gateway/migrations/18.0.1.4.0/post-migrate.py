@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""Apply 18.0.1.4.0 changes to records created as noupdate data."""
+from odoo import api, SUPERUSER_ID
+
+
+def migrate(cr, version):
+    if not version:
+        return
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    # Exports read with superuser rights: restrict the seeded skill to API admins
+    skill = env.ref('openclaw_gateway.skill_export', raise_if_not_found=False)
+    if skill and not skill.allowed_roles:
+        skill.allowed_roles = env.ref('openclaw_gateway.group_openclaw_api_admin')
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Prepare data for the constraints and columns introduced in 18.0.1.4.0."""
+import logging
+
+from odoo.tools.sql import column_exists, table_exists
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    if not version:
+        return
+
+    # job_id becomes unique (apply_updates relies on ON CONFLICT (job_id));
+    # keep the most recently written row of each job
+    if table_exists(cr, 'openclaw_workflow_job'):
+        cr.execute("""
+            DELETE FROM openclaw_workflow_job j
+            USING (
+                SELECT id, row_number() OVER (
+                    PARTITION BY job_id ORDER BY write_date DESC NULLS LAST, id DESC
+                ) AS rank
+                FROM openclaw_workflow_job
+            ) d
+            WHERE j.id = d.id AND d.rank > 1
+        """)
+        if cr.rowcount:
+            _logger.warning("Removed %d duplicate workflow job rows", cr.rowcount)
+
+    # Rate limits gain CHECK (>= 0) constraints
+    for table in ('openclaw_api_token', 'openclaw_api_token_rate_limit'):
+        if column_exists(cr, table, 'rate_limit') and column_exists(cr, table, 'rate_limit_burst'):
+            cr.execute(f"""
+                UPDATE {table}
+                SET rate_limit = GREATEST(rate_limit, 0), rate_limit_burst = GREATEST(rate_limit_burst, 0)
+                WHERE rate_limit < 0 OR rate_limit_burst < 0
+            """)
+
+    # Lead duplicate probes use the core email_normalized column
+    cr.execute("ALTER TABLE crm_lead DROP COLUMN IF EXISTS openclaw_email_key")
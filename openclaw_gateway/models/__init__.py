@@ -1,6 +1,15 @@
 # -*- coding: utf-8 -*-
 from . import skill
 from . import api_token
+from . import rate_limit
+from . import idempotency
 from . import request_log
 from . import webhook_log
+from . import workflow_export
+from . import webhook_inbox
+from . import tombstone
+from . import crm_lead
+from . import fuzzy_search
+from . import event_outbox
+from . import pricelist
 from . import config_settings_fix
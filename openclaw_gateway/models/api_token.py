@@ -58,9 +58,27 @@ class OpenClawAPIToken(models.Model):
         default=0,
         help="Number of times this token has been used"
     )
+    rate_limit = fields.Integer(
+        string="Rate Limit (req/min)",
+        default=0,
+        help="Sustained number of skill calls per minute allowed for this token. 0 = unlimited."
+    )
+    rate_limit_burst = fields.Integer(
+        string="Rate Limit Burst",
+        default=0,
+        help="Maximum number of calls accepted in a burst. 0 = same as the per-minute rate."
+    )
+    skill_rate_limit_ids = fields.One2many(
+        'openclaw.api.token.rate.limit',
+        'token_id',
+        string="Per-Skill Rate Limits",
+        help="Optional tighter limits for individual skills (applied in addition to the token limit)"
+    )
 
     _sql_constraints = [
-        ('token_unique', 'UNIQUE(token)', 'Token value must be unique!')
+        ('token_unique', 'UNIQUE(token)', 'Token value must be unique!'),
+        ('rate_limit_non_negative', 'CHECK(rate_limit >= 0 AND rate_limit_burst >= 0)',
+         'Rate limit and burst cannot be negative!'),
     ]
 
     def validate_token(self, token_value, skill_code=None, remote_addr=None):
@@ -136,6 +154,49 @@ class OpenClawAPIToken(models.Model):
             'token_name': token_rec.name
         }
     
+    def check_rate_limit(self, skill_code=None, cost=1, skill_costs=None):
+        """
+        Consume calls from the token (and per-skill) rate limit buckets, all or nothing.
+        
+        Args:
+            skill_code (str, optional): Skill being called, for per-skill limits
+            cost (int): Number of calls to account for
+            skill_costs (dict, optional): {skill_code: calls} for a multi-skill
+                request; replaces ``skill_code``/``cost`` (the token bucket is
+                charged the total)
+            
+        Returns:
+            dict: {'allowed': True} or {'allowed': False, 'retry_after': seconds},
+                  see ``_consume_buckets`` for the non-retryable case
+        """
+        self.ensure_one()
+        if skill_costs is None:
+            skill_costs = {skill_code: cost}
+        buckets = []
+        if self.rate_limit > 0:
+            buckets.append((
+                'token:%d' % self.id,
+                self.rate_limit,
+                self.rate_limit_burst or self.rate_limit,
+                sum(skill_costs.values()),
+            ))
+        for code, code_cost in skill_costs.items():
+            if not code or not self.skill_rate_limit_ids:
+                continue
+            skill_limit = self.skill_rate_limit_ids.filtered(
+                lambda l: l.skill_id.code == code and l.rate_limit > 0
+            )[:1]
+            if skill_limit:
+                buckets.append((
+                    'token:%d:skill:%s' % (self.id, code),
+                    skill_limit.rate_limit,
+                    skill_limit.rate_limit_burst or skill_limit.rate_limit,
+                    code_cost,
+                ))
+        if not buckets:
+            return {'allowed': True}
+        return self.env['openclaw.api.token.rate.limit'].sudo()._consume_buckets(buckets)
+
     def update_usage(self):
         """Update last_used_date and increment use_count"""
         self.ensure_one()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Indexed lead email probes for fast duplicate checks."""
+import re
+
+from odoo import models, api
+from odoo.tools import email_normalize
+from odoo.tools.sql import create_index
+
+PLUS_SUFFIX = re.compile(r'\+[^@]*@')
+# SQL twin of ``normalize_email(..., strip_plus=True)``, backed by an expression index
+PLUS_STRIPPED_SQL = "regexp_replace(email_normalized, '\\+[^@]*@', '@')"
+
+
+def normalize_email(value, strip_plus=False):
+    """
+    Return the duplicate-detection key of an email address.
+
+    Args:
+        value (str): Raw email
+        strip_plus (bool): Drop a ``+tag`` suffix from the local part
+
+    Returns:
+        str|None: The address as stored in ``email_normalized``, or None when empty or invalid
+    """
+    key = email_normalize(value or '')
+    if not key:
+        return None
+    if strip_plus:
+        key = PLUS_SUFFIX.sub('@', key, count=1)
+    return key
+
+
+class CrmLead(models.Model):
+    _inherit = 'crm.lead'
+
+    def init(self):
+        """
+        Btree indexes on ``email_normalized`` for exact probes and for probes that ignore plus suffixes.
+
+        The core column only carries a trigram index, which does not serve
+        ``IN`` lookups.
+        """
+        create_index(self.env.cr, 'crm_lead_openclaw_email_normalized_index', 'crm_lead',
+                     ['email_normalized'], where='email_normalized IS NOT NULL')
+        create_index(self.env.cr, 'crm_lead_openclaw_email_plus_index', 'crm_lead',
+                     [PLUS_STRIPPED_SQL], where='email_normalized IS NOT NULL')
+
+    @api.model
+    def _openclaw_strip_plus(self):
+        """Whether duplicate probes ignore ``+tag`` suffixes (``openclaw_gateway.lead_email_strip_plus``)."""
+        return self.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.lead_email_strip_plus', 'False') in ('1', 'True', 'true')
+
+    @api.model
+    def _openclaw_email_key(self, email):
+        """Return the probe key of ``email`` under the current plus-suffix setting."""
+        return normalize_email(email, self._openclaw_strip_plus())
+
+    @api.model
+    def _openclaw_find_by_email(self, emails):
+        """
+        Probe existing active leads for many emails with one indexed query.
+
+        Args:
+            emails (iterable): Raw email addresses
+
+        Returns:
+            dict: {probe key (see ``_openclaw_email_key``): id of the oldest matching lead}
+        """
+        strip_plus = self._openclaw_strip_plus()
+        keys = {normalize_email(email, strip_plus) for email in emails} - {None}
+        if not keys:
+            return {}
+        self.flush_model(['email_normalized', 'active'])
+        column = PLUS_STRIPPED_SQL if strip_plus else 'email_normalized'
+        self.env.cr.execute(f"""
+            SELECT {column}, min(id) FROM crm_lead
+            WHERE {column} IN %s AND email_normalized IS NOT NULL AND active
+            GROUP BY 1
+        """, (tuple(keys),))
+        return dict(self.env.cr.fetchall())
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""Transactional outbox pushing record events to n8n."""
+import json
+import logging
+import time
+from datetime import timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from odoo import models, fields, api
+
+from ..tools import metrics, serialization
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_EVENTS_PATH = '/webhook/openclaw-events'
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_ATTEMPTS = 8
+DEFAULT_TIMEOUT = 10
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 3600
+SENT_RETENTION_DAYS = 7
+
+# One keep-alive connection pool per worker process
+_session = None
+# Databases already warned about a missing n8n base URL (warned once per process)
+_unconfigured_dbs = set()
+
+
+def _get_session():
+    """Return the process-wide pooled HTTP session used to reach n8n."""
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _session = session
+    return _session
+
+
+class OpenClawEventOutbox(models.Model):
+    _name = 'openclaw.event.outbox'
+    _description = 'OpenClaw Event Outbox'
+    _order = 'id'
+
+    res_model = fields.Char('Model', required=True, index=True)
+    res_id = fields.Integer('Record ID', required=True, index=True)
+    event = fields.Selection([
+        ('created', 'Created'),
+        ('updated', 'Updated'),
+    ], required=True)
+    payload_json = fields.Text('Event Payload')
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('sent', 'Sent'),
+        ('dead', 'Dead'),
+    ], default='pending', required=True, index=True)
+    attempts = fields.Integer('Attempts', default=0)
+    next_attempt_at = fields.Datetime('Next Attempt', default=fields.Datetime.now, index=True)
+    sent_at = fields.Datetime('Sent At')
+    last_error = fields.Text('Last Error')
+
+    @api.model
+    def _is_enabled(self):
+        return self.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.outbox_enabled', 'False') in ('1', 'True', 'true')
+
+    @api.model
+    def enqueue(self, records, event, changed_fields=None):
+        """
+        Queue one event per record in the current transaction.
+
+        The rows commit (or roll back) together with the business change,
+        and the dispatcher cron is triggered once per transaction.
+
+        Args:
+            records: Recordset that was created/updated
+            event (str): 'created' or 'updated'
+            changed_fields (list): Field names written (updates only)
+        """
+        if not records or not self._is_enabled():
+            return
+        now = fields.Datetime.now()
+        self.sudo().create([{
+            'res_model': records._name,
+            'res_id': record.id,
+            'event': event,
+            'payload_json': serialization.to_text({
+                'event': f'{records._name}.{event}',
+                'model': records._name,
+                'res_id': record.id,
+                'fields': sorted(changed_fields or []),
+                'timestamp': now,
+            }),
+            'next_attempt_at': now,
+        } for record in records])
+        precommit_data = self.env.cr.precommit.data
+        if not precommit_data.get('openclaw_outbox_triggered'):
+            precommit_data['openclaw_outbox_triggered'] = True
+            cron = self.env.ref('openclaw_gateway.ir_cron_dispatch_outbox', raise_if_not_found=False)
+            if cron:
+                cron.sudo()._trigger()
+
+    def _get_endpoint(self):
+        """Return (url, headers) for event delivery; url is None while ``n8n_base_url`` is unset."""
+        params = self.env['ir.config_parameter'].sudo()
+        base_url = (params.get_param('openclaw_gateway.n8n_base_url') or '').strip().rstrip('/')
+        if not base_url:
+            return None, {}
+        path = params.get_param('openclaw_gateway.n8n_events_path', DEFAULT_EVENTS_PATH)
+        headers = {'Content-Type': 'application/json'}
+        api_key = params.get_param('openclaw_gateway.n8n_api_key')
+        if api_key:
+            headers['X-N8N-API-KEY'] = api_key
+        return f'{base_url}{path}', headers
+
+    def _deliver(self, url, headers, body):
+        """
+        POST one batch to n8n over the pooled keep-alive session.
+
+        Raises:
+            requests.RequestException: On network errors or non-2xx responses
+        """
+        inbox = self.env['openclaw.webhook.inbox']
+        if inbox._get_webhook_secrets():
+            timestamp = int(time.time())
+            headers = dict(headers, **{
+                'X-OpenClaw-Timestamp': str(timestamp),
+                'X-OpenClaw-Signature': inbox.sign(body, timestamp),
+            })
+        response = _get_session().post(url, data=body, headers=headers, timeout=DEFAULT_TIMEOUT)
+        response.raise_for_status()
+
+    def _claim_batch(self, batch_size):
+        """
+        Lock the next due events, oldest first.
+
+        An event is held back while an earlier event for the same record is
+        still waiting for a retry, which keeps delivery ordered per record.
+        """
+        self.env.cr.execute("""
+            SELECT o.id FROM openclaw_event_outbox o
+            WHERE o.state = 'pending' AND o.next_attempt_at <= (now() AT TIME ZONE 'UTC')
+              AND NOT EXISTS (
+                  SELECT 1 FROM openclaw_event_outbox p
+                  WHERE p.res_model = o.res_model AND p.res_id = o.res_id
+                    AND p.state = 'pending' AND p.id < o.id
+                    AND p.next_attempt_at > (now() AT TIME ZONE 'UTC')
+              )
+            ORDER BY o.id
+            LIMIT %s
+            FOR UPDATE OF o SKIP LOCKED
+        """, (batch_size,))
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    @api.model
+    def _cron_dispatch(self):
+        """
+        Deliver pending events to n8n in batches, committing after each batch.
+
+        While ``openclaw_gateway.n8n_base_url`` is unset nothing is sent and
+        events stay pending (no attempt is counted), so they are delivered
+        once the URL is configured.
+        """
+        params = self.env['ir.config_parameter'].sudo()
+        batch_size = int(params.get_param('openclaw_gateway.outbox_batch_size', DEFAULT_BATCH_SIZE))
+        max_attempts = int(params.get_param('openclaw_gateway.outbox_max_attempts', DEFAULT_MAX_ATTEMPTS))
+        url, headers = self._get_endpoint()
+        if not url:
+            if self.env.cr.dbname not in _unconfigured_dbs:
+                _unconfigured_dbs.add(self.env.cr.dbname)
+                _logger.warning("Outbox dispatch skipped: openclaw_gateway.n8n_base_url is not set; "
+                                "events stay pending until it is configured")
+            return
+        _unconfigured_dbs.discard(self.env.cr.dbname)
+
+        while True:
+            events = self._claim_batch(batch_size)
+            if not events:
+                break
+            body = serialization.dumps({
+                'events': [json.loads(event.payload_json) for event in events],
+            })
+            now = fields.Datetime.now()
+            try:
+                self._deliver(url, headers, body)
+            except requests.RequestException as e:
+                _logger.warning("Outbox delivery of %d events failed: %s", len(events), e)
+                metrics.incr('outbox_failures', amount=len(events))
+                for event in events:
+                    attempts = event.attempts + 1
+                    delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+                    event.write({
+                        'attempts': attempts,
+                        'state': 'dead' if attempts >= max_attempts else 'pending',
+                        'next_attempt_at': now + timedelta(seconds=delay),
+                        'last_error': str(e),
+                    })
+                self.env.cr.commit()
+                break
+            events.write({'state': 'sent', 'sent_at': now, 'last_error': False})
+            metrics.incr('outbox_sent', amount=len(events))
+            self.env.cr.commit()
+
+    def action_retry(self):
+        """Button action: requeue dead/pending events for immediate delivery."""
+        self.write({'state': 'pending', 'attempts': 0, 'next_attempt_at': fields.Datetime.now()})
+        self.env.ref('openclaw_gateway.ir_cron_dispatch_outbox').sudo()._trigger()
+        return True
+
+    @api.autovacuum
+    def _gc_sent_events(self):
+        """Drop delivered events after a week."""
+        self.env.cr.execute(
+            "DELETE FROM openclaw_event_outbox WHERE state = 'sent' AND sent_at < %s",
+            (fields.Datetime.now() - timedelta(days=SENT_RETENTION_DAYS),)
+        )
+
+
+class OpenClawOutboxMixin(models.AbstractModel):
+    """Queues outbox events on create/write."""
+    _name = 'openclaw.outbox.mixin'
+    _description = 'OpenClaw Outbox Mixin'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['openclaw.event.outbox'].enqueue(records, 'created')
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env['openclaw.event.outbox'].enqueue(self, 'updated', list(vals))
+        return res
+
+
+class CrmLead(models.Model):
+    _name = 'crm.lead'
+    _inherit = ['crm.lead', 'openclaw.outbox.mixin']
+
+
+class SaleOrder(models.Model):
+    _name = 'sale.order'
+    _inherit = ['sale.order', 'openclaw.outbox.mixin']
+
+
+class ResPartner(models.Model):
+    _name = 'res.partner'
+    _inherit = ['res.partner', 'openclaw.outbox.mixin']
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Search indexes for partners and products: pg_trgm fuzzy ranking and exact multi-get."""
+import logging
+
+import psycopg2
+
+from odoo import models, api
+from odoo.modules.db import has_trigram
+from odoo.tools.sql import create_index
+
+_logger = logging.getLogger(__name__)
+
+# Rows ranked per query before the caller's limit is applied
+FUZZY_CANDIDATE_LIMIT = 200
+# pg_trgm.word_similarity_threshold used by the ``<%`` operator (server default 0.6)
+FUZZY_THRESHOLD = 0.3
+# Text of every translation of a jsonb translated field, as in the core trigram indexes
+TRANSLATED_TEXT_SQL = "(jsonb_path_query_array(%s, '$.*')::text)"
+
+
+def ensure_trigram(env):
+    """
+    Create the pg_trgm extension when the database role may do so.
+
+    Returns:
+        bool: True when pg_trgm is installed
+    """
+    cr = env.cr
+    if not has_trigram(cr):
+        try:
+            with cr.savepoint(flush=False):
+                cr.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except psycopg2.Error as e:
+            _logger.info("pg_trgm unavailable, fuzzy search falls back to ilike: %s", e)
+            return False
+        # The registry flag was computed at load time; refresh it for this process
+        env.registry.has_trigram = True
+    return True
+
+
+class FuzzySearchMixin(models.AbstractModel):
+    """Ranks records by trigram word similarity of a search term."""
+    _name = 'openclaw.fuzzy.search.mixin'
+    _description = 'OpenClaw Fuzzy Search Mixin'
+
+    def _openclaw_fuzzy_sources(self):
+        """
+        Return the ranked text columns as (FROM clause, id expression, text expression).
+
+        Each source is queried separately so every one can use its own GIN index,
+        and contributes at most ``FUZZY_CANDIDATE_LIMIT`` candidates. Models
+        without sources yield no fuzzy results.
+        """
+        return []
+
+    @api.model
+    def _openclaw_fuzzy_search(self, term, domain=None, limit=10):
+        """
+        Return records matching ``domain`` whose text resembles ``term``, best first.
+
+        Record rules and ``active`` apply as in ``search``. Callers should check
+        ``self.env.registry.has_trigram`` and fall back to ilike.
+
+        Args:
+            term (str): Search text (typos tolerated)
+            domain (list): Extra filters
+            limit (int): Maximum records returned
+
+        Returns:
+            list: [(record, score)] ordered by descending similarity
+        """
+        term = (term or '').strip()
+        sources = self._openclaw_fuzzy_sources()
+        if not term or not sources:
+            return []
+        allowed = self._search(domain or []).subselect()
+        branches = []
+        params = []
+        for from_sql, id_sql, text_sql in sources:
+            branches.append(f"""
+                (SELECT {id_sql} AS id, word_similarity(%s, {text_sql}) AS score
+                 FROM {from_sql}
+                 WHERE %s <%% {text_sql} AND {id_sql} IN ({allowed.code})
+                 ORDER BY score DESC
+                 LIMIT %s)
+            """)
+            params += [term, term, *allowed.params, FUZZY_CANDIDATE_LIMIT]
+        self.env.cr.execute("SELECT set_config('pg_trgm.word_similarity_threshold', %s, true)",
+                            (str(FUZZY_THRESHOLD),))
+        self.env.cr.execute(f"""
+            SELECT id, max(score) AS score
+            FROM ({' UNION ALL '.join(branches)}) candidates
+            GROUP BY id
+            ORDER BY score DESC, id
+            LIMIT %s
+        """, params + [limit])
+        rows = self.env.cr.fetchall()
+        records = self.browse([row[0] for row in rows])
+        return list(zip(records, [round(row[1], 4) for row in rows]))
+
+
+class ResPartner(models.Model):
+    _name = 'res.partner'
+    _inherit = ['res.partner', 'openclaw.fuzzy.search.mixin']
+
+    def init(self):
+        """Btree index for exact email lookups; GIN trigram indexes on name and email when pg_trgm is available."""
+        if 'email_normalized' in self._fields:
+            create_index(self.env.cr, 'res_partner_openclaw_email_normalized_index', 'res_partner',
+                         ['email_normalized'], where='email_normalized IS NOT NULL')
+        if ensure_trigram(self.env):
+            create_index(self.env.cr, 'res_partner_openclaw_name_trgm_index', 'res_partner',
+                         ['name gin_trgm_ops'], method='gin')
+            create_index(self.env.cr, 'res_partner_openclaw_email_trgm_index', 'res_partner',
+                         ['email gin_trgm_ops'], method='gin')
+
+    def _openclaw_fuzzy_sources(self):
+        return [
+            ('res_partner', 'id', 'name'),
+            ('res_partner', 'id', 'email'),
+        ]
+
+
+class ProductProduct(models.Model):
+    _name = 'product.product'
+    _inherit = ['product.product', 'openclaw.fuzzy.search.mixin']
+
+    def init(self):
+        """
+        GIN trigram index on the internal reference.
+
+        The template name is served by the core trigram index of
+        ``product_template.name`` (``index='trigram'``), whose expression
+        ``TRANSLATED_TEXT_SQL`` reproduces.
+        """
+        self.env.cr.execute("DROP INDEX IF EXISTS product_template_openclaw_name_trgm_index")
+        if ensure_trigram(self.env):
+            create_index(self.env.cr, 'product_product_openclaw_default_code_trgm_index', 'product_product',
+                         ['default_code gin_trgm_ops'], method='gin')
+
+    def _openclaw_fuzzy_sources(self):
+        return [
+            ('product_product pp JOIN product_template pt ON pt.id = pp.product_tmpl_id',
+             'pp.id', TRANSLATED_TEXT_SQL % 'pt.name'),
+            ('product_product', 'id', 'default_code'),
+        ]
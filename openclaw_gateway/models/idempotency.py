@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Stored responses for Idempotency-Key retries."""
+import base64
+import logging
+
+import psycopg2
+
+from odoo import models, fields, api
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_HOURS = 24
+MAX_KEY_LENGTH = 255
+
+
+class OpenClawIdempotencyRecord(models.Model):
+    """
+    First response returned for a (token, Idempotency-Key) pair.
+
+    Requests carrying the same key are serialized by a transaction-scoped
+    advisory lock, so a concurrent duplicate waits for the first request to
+    commit and then receives its stored response instead of executing again.
+    """
+    _name = 'openclaw.idempotency.record'
+    _description = 'OpenClaw Idempotency Record'
+    _order = 'id desc'
+
+    token_id = fields.Many2one(
+        'openclaw.api.token',
+        string="Token",
+        required=True,
+        ondelete='cascade'
+    )
+    key = fields.Char('Idempotency Key', required=True)
+    request_hash = fields.Char('Request Hash', help="SHA-256 of endpoint and body of the first request")
+    status_code = fields.Integer('HTTP Status')
+    content_type = fields.Char('Content Type')
+    response_body = fields.Binary('Response Body', attachment=False)
+    expires_at = fields.Datetime('Expires At', required=True, index=True)
+
+    _sql_constraints = [
+        ('token_key_unique', 'UNIQUE(token_id, key)',
+         'Idempotency key already used for this token!'),
+    ]
+
+    @api.model
+    def acquire(self, token, key):
+        """
+        Serialize requests using ``key`` for ``token`` until the current transaction ends.
+
+        Args:
+            token: openclaw.api.token record
+            key (str): Idempotency-Key header value
+        """
+        self.env.cr.execute(
+            "SELECT pg_advisory_xact_lock(hashtext(%s))",
+            (f'openclaw_idempotency:{token.id}:{key}',)
+        )
+
+    @api.model
+    def lookup(self, token, key):
+        """
+        Return the unexpired stored response for (token, key).
+
+        Reads on a fresh cursor: the request transaction's snapshot predates
+        the lock wait and would not see a response committed meanwhile.
+
+        Returns:
+            dict|None: {'request_hash', 'status_code', 'content_type', 'body' (bytes)}
+        """
+        with self.env.registry.cursor() as cr:
+            cr.execute("""
+                SELECT request_hash, status_code, content_type, response_body
+                FROM openclaw_idempotency_record
+                WHERE token_id = %s AND key = %s AND expires_at > (now() AT TIME ZONE 'UTC')
+            """, (token.id, key))
+            row = cr.fetchone()
+        if not row:
+            return None
+        return {
+            'request_hash': row[0],
+            'status_code': row[1],
+            'content_type': row[2],
+            'body': base64.b64decode(bytes(row[3])) if row[3] else b'',
+        }
+
+    @api.model
+    def store(self, token, key, request_hash, status_code, body, content_type=None):
+        """
+        Save the response of the first request (commits with the request's own changes).
+
+        Args:
+            token: openclaw.api.token record
+            key (str): Idempotency-Key header value
+            request_hash (str): Hash of the request
+            status_code (int): HTTP status sent
+            body (bytes): Uncompressed response body
+            content_type (str): Response content type
+        """
+        ttl_hours = int(self.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.idempotency_ttl_hours', DEFAULT_TTL_HOURS))
+        self.env.cr.execute("""
+            INSERT INTO openclaw_idempotency_record
+                (token_id, key, request_hash, status_code, content_type, response_body, expires_at,
+                 create_uid, create_date, write_uid, write_date)
+            VALUES (%(token)s, %(key)s, %(hash)s, %(status)s, %(type)s, %(body)s,
+                    (now() AT TIME ZONE 'UTC') + make_interval(hours => %(ttl)s),
+                    %(uid)s, now() AT TIME ZONE 'UTC', %(uid)s, now() AT TIME ZONE 'UTC')
+            ON CONFLICT (token_id, key) DO UPDATE SET
+                request_hash = EXCLUDED.request_hash,
+                status_code = EXCLUDED.status_code,
+                content_type = EXCLUDED.content_type,
+                response_body = EXCLUDED.response_body,
+                expires_at = EXCLUDED.expires_at,
+                write_date = EXCLUDED.write_date
+        """, {
+            'token': token.id,
+            'key': key,
+            'hash': request_hash,
+            'status': status_code,
+            'type': content_type or 'application/json',
+            'body': psycopg2.Binary(base64.b64encode(body)),
+            'ttl': ttl_hours,
+            'uid': self.env.uid,
+        })
+
+    @api.autovacuum
+    def _gc_expired(self):
+        """Drop expired records."""
+        self.env.cr.execute("""
+            DELETE FROM openclaw_idempotency_record
+            WHERE expires_at < (now() AT TIME ZONE 'UTC')
+        """)
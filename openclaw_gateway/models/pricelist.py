@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Cached pricelist rules for gateway price computations."""
+from collections import defaultdict
+
+from odoo import models, fields, api
+
+from ..tools import pricelist_cache
+
+# Sequence bumped after every transaction that changed pricelist rules
+RULES_VERSION_SEQUENCE = 'openclaw_pricelist_rules_version'
+# Marks a transaction whose rule changes bump the version once it commits
+RULES_CHANGED_KEY = 'openclaw_pricelist_rules_changed'
+# Seconds a worker reuses the rules of a pricelist (``openclaw_gateway.pricelist_cache_ttl``)
+DEFAULT_PRICELIST_CACHE_TTL = 300
+
+
+class ProductPricelist(models.Model):
+    _inherit = 'product.pricelist'
+
+    def _get_applicable_rules(self, products, date, **kwargs):
+        """
+        Serve the rules from the per-worker cache when ``openclaw_cached_rules`` is in the context.
+
+        Returns the same rules, in the same order, as the upstream search on
+        ``_get_applicable_rules_domain``: rules of this pricelist that target
+        no category or an ancestor of a product's category, no template or a
+        product's template, no variant or one of ``products``, and are valid
+        at ``date``.
+        """
+        if (not self or not self.env.context.get('openclaw_cached_rules')
+                or products._name != 'product.product'
+                or self.env.cr.postcommit.data.get(RULES_CHANGED_KEY)):
+            return super()._get_applicable_rules(products, date, **kwargs)
+        self.ensure_one()
+        index = self._openclaw_rules_index()
+        categ_ids = {
+            int(categ_id)
+            for parent_path in products.categ_id.mapped('parent_path') if parent_path
+            for categ_id in parent_path.split('/') if categ_id
+        }
+        template_ids = set(products.product_tmpl_id.ids)
+        product_ids = set(products.ids)
+        candidates = list(index['global'])
+        for scope, ids in (('categ', categ_ids), ('template', template_ids), ('product', product_ids)):
+            for key in ids:
+                candidates += index[scope].get(key, ())
+        date = fields.Datetime.to_datetime(date) if date else fields.Datetime.now()
+        return self.env['product.pricelist.item'].browse([
+            rule_id
+            for __, rule_id, categ_id, template_id, product_id, date_start, date_end in sorted(candidates)
+            if (not categ_id or categ_id in categ_ids)
+            and (not template_id or template_id in template_ids)
+            and (not product_id or product_id in product_ids)
+            and (not date_start or date_start <= date)
+            and (not date_end or date_end >= date)
+        ])
+
+    def _openclaw_rules_index(self):
+        """
+        Return the cached rules of the pricelist, bucketed by their most specific target.
+
+        Returns:
+            dict: {'global': [row], 'categ'|'template'|'product': {target_id: [row]}}, each row
+            (position, rule_id, categ_id, template_id, product_id, date_start, date_end)
+            with ``position`` the rule's rank in the pricelist item order
+        """
+        self.env.cr.execute(f"SELECT last_value FROM {RULES_VERSION_SEQUENCE}")
+        version = self.env.cr.fetchone()[0]
+        key = (self.env.cr.dbname, self.id)
+        index = pricelist_cache.get(key, version)
+        if index is not None:
+            return index
+        items = self.env['product.pricelist.item'].with_context(active_test=False).search(
+            [('pricelist_id', '=', self.id)]
+        )
+        index = {'global': [], 'categ': defaultdict(list), 'template': defaultdict(list), 'product': defaultdict(list)}
+        for position, item in enumerate(items):
+            row = (position, item.id, item.categ_id.id, item.product_tmpl_id.id, item.product_id.id,
+                   item.date_start, item.date_end)
+            if item.product_id:
+                index['product'][item.product_id.id].append(row)
+            elif item.product_tmpl_id:
+                index['template'][item.product_tmpl_id.id].append(row)
+            elif item.categ_id:
+                index['categ'][item.categ_id.id].append(row)
+            else:
+                index['global'].append(row)
+        ttl = int(self.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.pricelist_cache_ttl', DEFAULT_PRICELIST_CACHE_TTL))
+        pricelist_cache.put(key, version, index, ttl)
+        return index
+
+
+class ProductPricelistItem(models.Model):
+    _inherit = 'product.pricelist.item'
+
+    def init(self):
+        """Sequence whose value versions the cached rules of every worker."""
+        self.env.cr.execute(f"CREATE SEQUENCE IF NOT EXISTS {RULES_VERSION_SEQUENCE}")
+
+    def _openclaw_rules_changed(self):
+        """
+        Bump the rules version once the current transaction commits.
+
+        Bumping after commit (on its own cursor) keeps a worker from caching
+        the old rules under the new version; one bump covers every rule
+        changed in the transaction, and ``nextval`` takes no row lock.
+        """
+        cr = self.env.cr
+        if cr.postcommit.data.get(RULES_CHANGED_KEY):
+            return
+        cr.postcommit.data[RULES_CHANGED_KEY] = True
+        registry = self.env.registry
+
+        @cr.postcommit.add
+        def bump_rules_version():
+            with registry.cursor() as bump_cr:
+                bump_cr.execute(f"SELECT nextval('{RULES_VERSION_SEQUENCE}')")
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        items = super().create(vals_list)
+        self._openclaw_rules_changed()
+        return items
+
+    def write(self, vals):
+        res = super().write(vals)
+        self._openclaw_rules_changed()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self._openclaw_rules_changed()
+        return res
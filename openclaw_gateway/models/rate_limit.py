@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Token-bucket rate limiting shared across all Odoo workers."""
+import math
+import logging
+
+from odoo import models, fields, api
+
+_logger = logging.getLogger(__name__)
+
+
+class OpenClawTokenRateLimit(models.Model):
+    """
+    Per-skill rate limit override for an API token.
+
+    Bucket state itself lives in the UNLOGGED table ``openclaw_rate_bucket``
+    (created in ``init``) so that every prefork worker draws from the same
+    bucket without WAL overhead.
+    """
+    _name = "openclaw.api.token.rate.limit"
+    _description = "OpenClaw API Token Skill Rate Limit"
+    _order = "token_id, skill_id"
+
+    token_id = fields.Many2one(
+        'openclaw.api.token',
+        string="Token",
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+    skill_id = fields.Many2one(
+        'openclaw.skill',
+        string="Skill",
+        required=True,
+        ondelete='cascade'
+    )
+    rate_limit = fields.Integer(
+        string="Requests / Minute",
+        required=True,
+        default=60,
+        help="Sustained number of calls per minute this token may make to the skill"
+    )
+    rate_limit_burst = fields.Integer(
+        string="Burst",
+        default=0,
+        help="Bucket capacity (maximum calls in a burst). 0 = same as requests per minute."
+    )
+
+    _sql_constraints = [
+        ('token_skill_unique', 'UNIQUE(token_id, skill_id)',
+         'Only one rate limit per skill and token is allowed!'),
+        ('rate_limit_non_negative', 'CHECK(rate_limit >= 0 AND rate_limit_burst >= 0)',
+         'Rate limit and burst cannot be negative!'),
+    ]
+
+    def init(self):
+        """Create the shared bucket table (UNLOGGED: state is disposable, writes are cheap)."""
+        self.env.cr.execute("""
+            CREATE UNLOGGED TABLE IF NOT EXISTS openclaw_rate_bucket (
+                bucket_key VARCHAR PRIMARY KEY,
+                tokens DOUBLE PRECISION NOT NULL,
+                allowed BOOLEAN NOT NULL DEFAULT TRUE,
+                refreshed_at TIMESTAMP NOT NULL
+            )
+        """)
+
+    @api.model
+    def _consume_buckets(self, buckets, cost=1):
+        """
+        Take tokens from every bucket, or from none of them.
+
+        All buckets are refilled and row-locked first (in key order, so
+        concurrent calls cannot deadlock); only when each one holds enough
+        tokens are they all debited. A rejected call therefore leaves no
+        bucket charged. Runs on a dedicated short-lived cursor so the bucket
+        row locks are released immediately instead of being held for the
+        whole request.
+
+        Args:
+            buckets (list): (key, rate_per_minute, capacity) tuples, optionally
+                with a 4th item overriding ``cost`` for that bucket
+            cost (int): Number of tokens to consume
+
+        Returns:
+            dict: {'allowed': True}, {'allowed': False, 'bucket', 'retry_after'}
+                  when throttled, or {'allowed': False, 'bucket', 'error':
+                  'COST_EXCEEDS_CAPACITY', 'cost', 'capacity'} when the call can
+                  never fit the bucket (retrying will not help)
+        """
+        buckets = sorted(
+            (key, rate, capacity, bucket_cost[0] if bucket_cost else cost)
+            for key, rate, capacity, *bucket_cost in buckets
+        )
+        for key, rate, capacity, bucket_cost in buckets:
+            if bucket_cost > capacity:
+                return {
+                    'allowed': False,
+                    'bucket': key,
+                    'error': 'COST_EXCEEDS_CAPACITY',
+                    'cost': bucket_cost,
+                    'capacity': capacity,
+                }
+        with self.env.registry.cursor() as cr:
+            denied = None
+            for key, rate, capacity, bucket_cost in buckets:
+                rate_per_second = rate / 60.0
+                cr.execute("""
+                    INSERT INTO openclaw_rate_bucket AS b (bucket_key, tokens, allowed, refreshed_at)
+                    VALUES (%(key)s, %(capacity)s, TRUE, clock_timestamp() AT TIME ZONE 'UTC')
+                    ON CONFLICT (bucket_key) DO UPDATE SET
+                        tokens = LEAST(%(capacity)s, b.tokens + EXTRACT(EPOCH FROM EXCLUDED.refreshed_at - b.refreshed_at) * %(rate)s),
+                        refreshed_at = EXCLUDED.refreshed_at
+                    RETURNING tokens
+                """, {'key': key, 'capacity': float(capacity), 'rate': rate_per_second})
+                tokens = cr.fetchone()[0]
+                if tokens < bucket_cost:
+                    retry_after = max(1, int(math.ceil((bucket_cost - tokens) / rate_per_second)))
+                    if not denied or retry_after > denied['retry_after']:
+                        denied = {'allowed': False, 'bucket': key, 'retry_after': retry_after}
+            for key, _rate, _capacity, bucket_cost in buckets:
+                cr.execute("""
+                    UPDATE openclaw_rate_bucket
+                    SET tokens = tokens - %s, allowed = %s
+                    WHERE bucket_key = %s
+                """, (0.0 if denied else float(bucket_cost), not denied, key))
+        return denied or {'allowed': True}
+
+    @api.autovacuum
+    def _gc_rate_buckets(self):
+        """Drop buckets idle for a day; they are recreated full on next use."""
+        self.env.cr.execute("""
+            DELETE FROM openclaw_rate_bucket
+            WHERE refreshed_at < (now() AT TIME ZONE 'UTC') - INTERVAL '1 day'
+        """)
@@ -2,6 +2,8 @@
 from odoo import models, fields
 import logging
 
+from ..tools import serialization
+
 _logger = logging.getLogger(__name__)
 
 
@@ -83,8 +85,8 @@ class OpenClawRequestLog(models.Model):
             endpoint (str): API endpoint path
             method (str): HTTP method
             skill_code (str): Skill code executed
-            request_data (dict): Request payload
-            response_data (dict): Response data
+            request_data (dict|bytes): Request payload or raw JSON bytes
+            response_data (dict|bytes): Response data or encoded JSON bytes
             duration_ms (int): Processing duration
             status (str): 'ok' or 'error'
             error (str, optional): Error code if failed
@@ -92,15 +94,13 @@ class OpenClawRequestLog(models.Model):
             user_agent (str, optional): Client user agent
         """
         try:
-            import json
-            
             env['openclaw.request.log'].sudo().create({
                 'token_name': token_name,
                 'endpoint': endpoint,
                 'method': method,
                 'skill_code': skill_code,
-                'request_json': json.dumps(request_data) if request_data else '{}',
-                'response_json': json.dumps(response_data) if response_data else '{}',
+                'request_json': serialization.to_text(request_data),
+                'response_json': serialization.to_text(response_data),
                 'status': status,
                 'error': error,
                 'duration_ms': duration_ms,
@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 from odoo import models, fields, api
+from odoo.tools import config
+from psycopg2 import errors as pg_errors
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
+import re
+import time
 
 # Import executor classes
 from ..executors.ping import PingExecutor
@@ -15,9 +20,34 @@ from ..executors.lead_creator import LeadCreatorExecutor
 from ..executors.summary import SummaryExecutor
 from ..executors.bulk_import import BulkImportExecutor
 from ..executors.advanced_lead import AdvancedLeadExecutor
+from ..executors.export import ExportExecutor
+from ..executors.base import SkillTimeout
+from ..tools import metrics
 
 _logger = logging.getLogger(__name__)
 
+# Execution slots are transaction-scoped advisory locks keyed on
+# (EXECUTION_SLOT_NAMESPACE + skill id, slot number); the bare namespace
+# (skill id 0) holds the gateway-wide slots.
+EXECUTION_SLOT_NAMESPACE = 0x4F430000
+EXECUTION_SLOT_RANGE = 1000000
+SLOT_RETRY_INTERVAL = 0.05
+
+# Executors that never write; batch items using them may run concurrently
+READ_ONLY_EXECUTORS = (
+    'ping', 'sales_orders', 'invoices', 'customers', 'employees', 'products', 'users', 'summary',
+)
+MAX_PARALLEL_ITEMS = 4
+# Connections of the worker's pool left to the request itself and other threads
+RESERVED_POOL_CONNECTIONS = 2
+
+# Pipeline binding path tokens: "customer.customers[0].id" -> customer, customers, [0], id
+BINDING_PATH_TOKEN = re.compile(r'([^.\[\]]+)|\[(-?\d+)\]')
+
+
+class PipelineAborted(Exception):
+    """Raised to roll back a pipeline whose step failed."""
+
 
 class OpenClawSkill(models.Model):
     _name = "openclaw.skill"
@@ -57,6 +87,7 @@ class OpenClawSkill(models.Model):
             ('summary', 'Summary - Database Statistics'),
             ('bulk_import', 'Bulk Import - Customers, Products, Leads'),
             ('advanced_lead', 'Advanced Lead - Create with validation'),
+            ('export', 'Export - Compressed file extracts'),
         ],
         string="Executor",
         required=True,
@@ -75,6 +106,23 @@ class OpenClawSkill(models.Model):
         default=100,
         help="Maximum number of records that can be returned per query"
     )
+    max_concurrency = fields.Integer(
+        string="Max Concurrent Executions",
+        default=0,
+        help="Maximum number of simultaneous executions of this skill across all workers. 0 = unlimited."
+    )
+    queue_timeout_ms = fields.Integer(
+        string="Queue Timeout (ms)",
+        default=0,
+        help="How long a call may wait for a free execution slot before being shed with 503. "
+             "0 = shed immediately when the skill is saturated."
+    )
+    timeout_ms = fields.Integer(
+        string="Timeout (ms)",
+        default=30000,
+        help="Execution time budget. Every SQL statement is cancelled past this budget "
+             "(statement_timeout) and over-budget calls fail with TIMEOUT. 0 = no limit."
+    )
 
     _sql_constraints = [
         ('code_unique', 'UNIQUE(code)', 'Skill code must be unique!')
@@ -102,8 +150,8 @@ class OpenClawSkill(models.Model):
                 'message': f'Skill with code "{skill_code}" not found or inactive'
             }
         
-        # Check role permissions if user_roles provided
-        if user_roles and skill.allowed_roles:
+        # Check role permissions for callers (a caller without roles cannot run role-restricted skills)
+        if user_roles is not None and skill.allowed_roles:
             # Convert user_roles to IDs if they're recordsets
             role_ids = [r.id if hasattr(r, 'id') else r for r in user_roles]
             allowed_role_ids = skill.allowed_roles.ids
@@ -128,12 +176,19 @@ class OpenClawSkill(models.Model):
                 'message': f'Requested limit {limit} exceeds maximum allowed {skill.max_limit}'
             }
         
+        # Reserve execution slots (per skill and gateway-wide), unless a parallel
+        # batch already reserved them for this item
+        overload = None if self.env.context.get('openclaw_slots_reserved') else self._acquire_execution_slots(skill)
+        if overload:
+            metrics.incr('shed', skill_code)
+            return overload
+        
         # Route to appropriate executor
         try:
-            import time
+            metrics.incr('executions', skill_code)
             start_time = time.time()
             
-            result = self._execute_skill(skill, payload)
+            result = self._execute_with_budget(skill, payload)
             
             # Add query time
             duration_ms = int((time.time() - start_time) * 1000)
@@ -151,6 +206,332 @@ class OpenClawSkill(models.Model):
                 'skill': skill_code
             }
     
+    def run_batch(self, items, user_roles=None, allowed_skill_codes=None, parallel=False):
+        """
+        Execute several skills in one call, returning results in item order.
+        
+        Each item goes through ``run_skill`` (role checks, limits, slots and
+        time budget). With ``parallel``, items on read-only executors without
+        a per-skill concurrency cap run concurrently on their own cursors
+        (they do not see writes made by earlier items of the same batch);
+        other items run in order on the request cursor.
+        
+        Concurrent items do not compete for execution slots: the request
+        reserves one gateway slot per thread up front, and the thread count is
+        bounded by those slots and by the worker's connection pool. When no
+        slot is free they run in order like the other items.
+        
+        Args:
+            items (list): [{'skill': code, 'payload': dict}, ...]
+            user_roles (list): User group IDs or group records of the caller
+            allowed_skill_codes (set): Skill codes the token may call (None = all)
+            parallel (bool): Run read-only items concurrently
+            
+        Returns:
+            list: One standardized skill response per item
+        """
+        codes = {item.get('skill') for item in items if isinstance(item, dict)}
+        skills = self.sudo().search([('code', 'in', list(codes)), ('active', '=', True)])
+        executors = {skill.code: skill.executor for skill in skills}
+        concurrent_codes = {
+            skill.code for skill in skills
+            if skill.executor in READ_ONLY_EXECUTORS and skill.max_concurrency <= 0
+        }
+        results = [None] * len(items)
+        concurrent_items = []
+        for index, item in enumerate(items):
+            if not isinstance(item, dict) or not item.get('skill') or not isinstance(item.get('payload', {}), dict):
+                results[index] = {
+                    'success': False,
+                    'error': 'INVALID_ITEM',
+                    'message': 'Each item must be {"skill": code, "payload": object}'
+                }
+                continue
+            skill_code = item['skill']
+            payload = item.get('payload') or {}
+            if allowed_skill_codes is not None and skill_code in executors and skill_code not in allowed_skill_codes:
+                results[index] = {
+                    'success': False,
+                    'error': 'SKILL_NOT_ALLOWED',
+                    'message': f'Token does not have permission for skill "{skill_code}"',
+                    'skill': skill_code
+                }
+                continue
+            if parallel and skill_code in concurrent_codes:
+                concurrent_items.append((index, skill_code, payload))
+                continue
+            results[index] = self.run_skill(skill_code, payload, user_roles=user_roles)
+        
+        workers = self._reserve_batch_workers(len(concurrent_items)) if len(concurrent_items) > 1 else 0
+        if workers < 2:
+            for index, skill_code, payload in concurrent_items:
+                results[index] = self.run_skill(skill_code, payload, user_roles=user_roles)
+            return results
+        role_ids = [r.id if hasattr(r, 'id') else r for r in (user_roles or [])]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (index, pool.submit(self._run_skill_isolated, skill_code, payload, role_ids))
+                for index, skill_code, payload in concurrent_items
+            ]
+            for index, future in futures:
+                results[index] = future.result()
+        return results
+    
+    def _reserve_batch_workers(self, item_count):
+        """
+        Reserve gateway slots on the request transaction for a parallel batch.
+        
+        Returns:
+            int: Number of threads the batch may use (one reserved slot each)
+        """
+        workers = min(MAX_PARALLEL_ITEMS, item_count,
+                      max(config['db_maxconn'] - RESERVED_POOL_CONNECTIONS, 0))
+        gateway_cap = int(self.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.max_concurrent_executions', 0) or 0)
+        if gateway_cap > 0 and workers > 0:
+            workers = self._try_acquire_slots(EXECUTION_SLOT_NAMESPACE, gateway_cap, workers)
+        return workers
+    
+    def run_pipeline(self, steps, user_roles=None, allowed_skill_codes=None):
+        """
+        Execute chained skills in one transaction, feeding outputs forward.
+        
+        Each step may declare ``bind``: a mapping of payload keys to paths
+        into the ``data`` of an earlier step, e.g.
+        ``{"partner_id": "customer.customers[0].id"}``. Steps run in order;
+        the first failing step stops the pipeline and rolls back every write
+        made by earlier steps.
+        
+        Args:
+            steps (list): [{'id': str, 'skill': code, 'payload': dict, 'bind': dict}, ...]
+            user_roles (list): User group IDs or group records of the caller
+            allowed_skill_codes (set): Skill codes the token may call (None = all)
+            
+        Returns:
+            dict: Standardized response with per-step results
+        """
+        outputs = {}
+        step_results = []
+        failure = {}
+        try:
+            with self.env.cr.savepoint():
+                for index, step in enumerate(steps):
+                    if not isinstance(step, dict) or not step.get('skill'):
+                        failure = {'error': 'INVALID_STEP', 'message': f'Step {index + 1} needs a "skill" code'}
+                        raise PipelineAborted()
+                    step_id = str(step.get('id') or step['skill'])
+                    skill_code = step['skill']
+                    payload = step.get('payload') or {}
+                    bind = step.get('bind') or {}
+                    
+                    if not isinstance(payload, dict) or not isinstance(bind, dict):
+                        result = {
+                            'success': False,
+                            'error': 'INVALID_PAYLOAD',
+                            'message': '"payload" and "bind" must be objects',
+                        }
+                    elif allowed_skill_codes is not None and skill_code not in allowed_skill_codes:
+                        result = {
+                            'success': False,
+                            'error': 'SKILL_NOT_ALLOWED',
+                            'message': f'Token does not have permission for skill "{skill_code}"',
+                        }
+                    else:
+                        result = None
+                        payload = dict(payload)
+                        for key, path in bind.items():
+                            try:
+                                payload[key] = self._resolve_binding(outputs, path)
+                            except (KeyError, IndexError, TypeError, ValueError):
+                                result = {
+                                    'success': False,
+                                    'error': 'BINDING_ERROR',
+                                    'message': f'Cannot resolve "{path}" for "{key}"',
+                                }
+                                break
+                        if result is None:
+                            result = self.run_skill(skill_code, payload, user_roles=user_roles)
+                    
+                    step_results.append(dict(result, id=step_id, skill=skill_code))
+                    if not result.get('success'):
+                        failure = {
+                            'error': 'PIPELINE_STEP_FAILED',
+                            'message': f'Step "{step_id}" failed: {result.get("message") or result.get("error")}',
+                            'failed_step': step_id,
+                        }
+                        raise PipelineAborted()
+                    outputs[step_id] = result.get('data')
+        except PipelineAborted:
+            return dict(failure, success=False, steps=step_results)
+        
+        return {
+            'success': True,
+            'data': {
+                'steps': step_results,
+                'completed': len(step_results),
+            }
+        }
+    
+    def _resolve_binding(self, outputs, path):
+        """
+        Resolve a binding path against earlier step outputs.
+        
+        Args:
+            outputs (dict): {step_id: step data}
+            path (str): e.g. "customer.customers[0].id"
+            
+        Returns:
+            Value found at ``path`` (KeyError/IndexError/TypeError if absent)
+        """
+        tokens = BINDING_PATH_TOKEN.findall(str(path))
+        if not tokens:
+            raise ValueError(path)
+        value = outputs
+        for name, index in tokens:
+            value = value[int(index)] if index else value[name]
+        return value
+    
+    def _run_skill_isolated(self, skill_code, payload, role_ids):
+        """Run a read-only skill on a dedicated cursor (used from batch worker threads)."""
+        try:
+            with self.env.registry.cursor() as cr:
+                env = api.Environment(cr, self.env.uid, dict(self.env.context, openclaw_slots_reserved=True))
+                try:
+                    return env['openclaw.skill'].sudo().run_skill(
+                        skill_code, payload, user_roles=env['res.groups'].browse(role_ids)
+                    )
+                finally:
+                    cr.rollback()
+        except Exception as e:
+            _logger.exception(f"Error executing skill {skill_code} in batch: {str(e)}")
+            return {
+                'success': False,
+                'error': 'EXECUTION_ERROR',
+                'message': f'Error executing skill: {str(e)}',
+                'skill': skill_code
+            }
+    
+    def _try_acquire_slot(self, lock_key, capacity):
+        """Grab any free slot of ``lock_key`` in one round trip; held until transaction end."""
+        return bool(self._try_acquire_slots(lock_key, capacity, 1))
+    
+    def _try_acquire_slots(self, lock_key, capacity, count):
+        """
+        Grab up to ``count`` distinct free slots of ``lock_key`` in one round trip.
+        
+        Slots this transaction already holds count as acquired (advisory locks
+        are re-entrant), so a request never competes with itself.
+        
+        Returns:
+            int: Number of slots now held, held until transaction end
+        """
+        self.env.cr.execute("""
+            SELECT slot FROM generate_series(0, %s - 1) AS slot
+            WHERE pg_try_advisory_xact_lock(%s, slot)
+            LIMIT %s
+        """, (capacity, lock_key, count))
+        return len(self.env.cr.fetchall())
+    
+    def _acquire_execution_slots(self, skill):
+        """
+        Enforce the skill and gateway concurrency caps.
+        
+        Slots are PostgreSQL transaction-level advisory locks, so they are
+        shared by every worker and released automatically when the request
+        transaction ends, even if the worker dies.
+        
+        Returns:
+            dict: OVERLOADED error response if no slot became free in time, else None
+        """
+        gateway_cap = int(self.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.max_concurrent_executions', 0) or 0)
+        limits = []
+        if skill.max_concurrency > 0:
+            limits.append((EXECUTION_SLOT_NAMESPACE + skill.id, skill.max_concurrency, 'skill'))
+        if gateway_cap > 0:
+            limits.append((EXECUTION_SLOT_NAMESPACE, gateway_cap, 'gateway'))
+        
+        deadline = time.time() + max(skill.queue_timeout_ms, 0) / 1000.0
+        for lock_key, capacity, scope in limits:
+            while not self._try_acquire_slot(lock_key, capacity):
+                if time.time() >= deadline:
+                    return {
+                        'success': False,
+                        'error': 'OVERLOADED',
+                        'message': f'Too many concurrent executions ({scope} limit {capacity}), retry shortly',
+                        'skill': skill.code,
+                        'retry_after': 1,
+                    }
+                time.sleep(SLOT_RETRY_INTERVAL)
+        return None
+    
+    @api.model
+    def get_inflight_counts(self):
+        """
+        Count executions currently holding a slot, across all workers.
+        
+        Only skills with a concurrency cap (and the gateway cap) are tracked.
+        
+        Returns:
+            dict: {'gateway': int, 'skills': {skill_code: int}}
+        """
+        self.env.cr.execute("""
+            SELECT classid::bigint - %(ns)s, count(*)
+            FROM pg_locks
+            WHERE locktype = 'advisory' AND granted AND objsubid = 2
+              AND classid::bigint >= %(ns)s AND classid::bigint < %(ns)s + %(range)s
+            GROUP BY classid
+        """, {'ns': EXECUTION_SLOT_NAMESPACE, 'range': EXECUTION_SLOT_RANGE})
+        counts = dict(self.env.cr.fetchall())
+        skills = self.sudo().with_context(active_test=False).browse(
+            [skill_id for skill_id in counts if skill_id]
+        ).exists()
+        return {
+            'gateway': counts.get(0, 0),
+            'skills': {skill.code: counts[skill.id] for skill in skills},
+        }
+    
+    def _execute_with_budget(self, skill, payload):
+        """
+        Run ``_execute_skill`` within the skill's time budget.
+        
+        The execution runs in a savepoint with ``SET LOCAL statement_timeout``
+        so a runaway query is cancelled by PostgreSQL. That limit applies per
+        statement: the executor query helpers (``BaseExecutor._check_budget``)
+        lower it to the remaining budget before each further query and abort
+        once the deadline (``openclaw_deadline`` in the context) has passed.
+        A call that finishes over budget is rolled back as well, keeping the
+        request transaction usable for logging.
+        
+        The budget is the skill's ``timeout_ms`` unless the caller passes
+        ``openclaw_timeout_ms`` in the context (asynchronous executions).
+        """
+        timeout_ms = self.env.context.get('openclaw_timeout_ms') or skill.timeout_ms
+        if timeout_ms <= 0:
+            return self._execute_skill(skill, payload)
+        
+        cr = self.env.cr
+        start_time = time.monotonic()
+        try:
+            with cr.savepoint():
+                cr.execute("SET LOCAL statement_timeout = %s", (timeout_ms,))
+                deadline = start_time + timeout_ms / 1000.0
+                result = self.with_context(openclaw_deadline=deadline)._execute_skill(skill, payload)
+                # A cancelled statement swallowed by the executor also lands here
+                if (time.monotonic() - start_time) * 1000 >= timeout_ms:
+                    raise SkillTimeout()
+            cr.execute("SET LOCAL statement_timeout TO DEFAULT")
+            return result
+        except (SkillTimeout, pg_errors.QueryCanceled):
+            metrics.incr('timeouts', skill.code)
+            _logger.warning("Skill %s exceeded its %d ms budget", skill.code, timeout_ms)
+            return {
+                'success': False,
+                'error': 'TIMEOUT',
+                'message': f'Skill "{skill.code}" exceeded its time budget of {timeout_ms} ms',
+                'skill': skill.code,
+            }
+    
     def _execute_skill(self, skill, payload):
         """
         Internal method to route skill execution to appropriate executor.
@@ -170,6 +551,7 @@ class OpenClawSkill(models.Model):
             'summary': SummaryExecutor,
             'bulk_import': BulkImportExecutor,
             'advanced_lead': AdvancedLeadExecutor,
+            'export': ExportExecutor,
         }
         
         # Get executor class
@@ -184,4 +566,6 @@ class OpenClawSkill(models.Model):
         
         # Instantiate and execute
         executor = executor_class()
+        # The controller passes the negotiated format (payload "format" or Accept) in the context
+        executor.response_format = self.env.context.get('openclaw_response_format') or payload.get('format') or 'json'
         return executor.execute(self.env, payload)
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Deletion tombstones for incremental (``since``) sync of query skills."""
+import logging
+from datetime import timedelta
+
+from odoo import models, fields, api
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_TOMBSTONE_RETENTION_DAYS = 30
+MAX_DELETED_IDS = 10000
+
+
+class OpenClawTombstone(models.Model):
+    _name = "openclaw.tombstone"
+    _description = "OpenClaw Deleted Record Tombstone"
+    _order = "deleted_at desc, id desc"
+    _log_access = False
+
+    res_model = fields.Char(string="Model", required=True, index=True)
+    res_id = fields.Integer(string="Record ID", required=True)
+    deleted_at = fields.Datetime(string="Deleted At", required=True, index=True, readonly=True)
+
+    @api.model
+    def record_deletions(self, records):
+        """Store one tombstone per record about to be unlinked."""
+        if not records:
+            return
+        now = fields.Datetime.now()
+        self.sudo().create([{
+            'res_model': records._name,
+            'res_id': record_id,
+            'deleted_at': now,
+        } for record_id in records.ids])
+
+    @api.model
+    def deleted_since(self, model_name, since):
+        """
+        Ids of ``model_name`` records deleted at or after ``since``.
+        
+        Args:
+            model_name (str): Model technical name
+            since (datetime): Watermark write_date
+            
+        Returns:
+            list: Distinct record ids (capped at MAX_DELETED_IDS)
+        """
+        self.flush_model()
+        self.env.cr.execute("""
+            SELECT DISTINCT res_id FROM openclaw_tombstone
+            WHERE res_model = %s AND deleted_at >= %s
+            LIMIT %s
+        """, (model_name, since, MAX_DELETED_IDS))
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    @api.autovacuum
+    def _gc_tombstones(self):
+        """Drop tombstones older than the retention period (clients must sync within it)."""
+        days = int(self.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.tombstone_retention_days', DEFAULT_TOMBSTONE_RETENTION_DAYS))
+        self.env.cr.execute(
+            "DELETE FROM openclaw_tombstone WHERE deleted_at < %s",
+            (fields.Datetime.now() - timedelta(days=days),)
+        )
+
+
+class OpenClawTombstoneMixin(models.AbstractModel):
+    """Records a tombstone on unlink so change feeds can report deletions."""
+    _name = "openclaw.tombstone.mixin"
+    _description = "OpenClaw Tombstone Mixin"
+
+    def unlink(self):
+        self.env['openclaw.tombstone'].record_deletions(self)
+        return super().unlink()
+
+
+class ResPartner(models.Model):
+    _name = 'res.partner'
+    _inherit = ['res.partner', 'openclaw.tombstone.mixin']
+
+
+class SaleOrder(models.Model):
+    _name = 'sale.order'
+    _inherit = ['sale.order', 'openclaw.tombstone.mixin']
+
+
+class AccountMove(models.Model):
+    _name = 'account.move'
+    _inherit = ['account.move', 'openclaw.tombstone.mixin']
+
+
+class HrEmployee(models.Model):
+    _name = 'hr.employee'
+    _inherit = ['hr.employee', 'openclaw.tombstone.mixin']
+
+
+class ProductProduct(models.Model):
+    _name = 'product.product'
+    _inherit = ['product.product', 'openclaw.tombstone.mixin']
+
+
+class ResUsers(models.Model):
+    _name = 'res.users'
+    _inherit = ['res.users', 'openclaw.tombstone.mixin']
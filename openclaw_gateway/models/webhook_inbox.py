@@ -0,0 +1,415 @@
+# -*- coding: utf-8 -*-
+"""Inbox for deferred processing of incoming n8n webhooks."""
+import hashlib
+import hmac
+import json
+import logging
+import re
+import time
+from datetime import timedelta
+
+from odoo import models, fields, api, tools
+
+_logger = logging.getLogger(__name__)
+
+WEBHOOK_HANDLERS = {
+    'lead_created': '_handle_lead_created',
+    'bulk_import_complete': '_handle_bulk_import_complete',
+    'workflow_status': '_handle_workflow_status',
+}
+DEFAULT_BATCH_SIZE = 50
+# Seconds a cron run keeps claiming batches before handing over to a new run
+PROCESS_RUN_WINDOW_SECONDS = 45
+MAX_EVENTS_PER_DELIVERY = 1000
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 3600
+DONE_RETENTION_DAYS = 7
+DEFAULT_REPLAY_WINDOW = 300
+SECRET_SEPARATOR = re.compile(r'[,\n]')
+
+
+class OpenClawWebhookInbox(models.Model):
+    """
+    Raw webhook deliveries accepted with HTTP 202 and processed by a cron.
+
+    ``idempotency_key`` is unique: a redelivery of the same event is
+    recognised at insert time and never processed twice.
+    """
+    _name = 'openclaw.webhook.inbox'
+    _description = 'Webhook Inbox'
+    _order = 'id'
+
+    webhook_id = fields.Char('Webhook ID', required=True, index=True)
+    idempotency_key = fields.Char('Idempotency Key', required=True)
+    body = fields.Text('Raw Body')
+    source_ip = fields.Char('Source IP')
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], default='pending', required=True, index=True)
+    attempts = fields.Integer('Attempts', default=0)
+    next_attempt_at = fields.Datetime('Next Attempt', default=fields.Datetime.now, index=True)
+    processed_at = fields.Datetime('Processed At')
+    error_message = fields.Text('Error Message')
+
+    _sql_constraints = [
+        ('idempotency_key_unique', 'UNIQUE(idempotency_key)',
+         'This webhook delivery was already received!'),
+    ]
+
+    def init(self):
+        """Create the replay cache (UNLOGGED: losing it only reopens the replay window)."""
+        self.env.cr.execute("""
+            CREATE UNLOGGED TABLE IF NOT EXISTS openclaw_webhook_replay (
+                signature VARCHAR PRIMARY KEY,
+                seen_at TIMESTAMP NOT NULL
+            )
+        """)
+
+    # ==================== Signatures ====================
+
+    @api.model
+    @tools.ormcache()
+    def _get_webhook_secrets(self):
+        """
+        Return the active webhook secrets as bytes.
+
+        ``openclaw_gateway.webhook_secret`` may hold several secrets separated
+        by commas or newlines so a new secret can be rolled out before the old
+        one is retired. Cached per worker; any ``ir.config_parameter`` change
+        clears the registry cache and with it this entry.
+
+        Returns:
+            tuple: Secrets encoded to bytes (empty when none configured)
+        """
+        value = self.env['ir.config_parameter'].sudo().get_param('openclaw_gateway.webhook_secret') or ''
+        return tuple(secret.strip().encode() for secret in SECRET_SEPARATOR.split(value) if secret.strip())
+
+    @api.model
+    def sign(self, raw_body, timestamp=None, secret=None):
+        """
+        Compute the ``sha256=`` signature of a body.
+
+        With a timestamp, the signed message is ``<timestamp>.<body>``.
+        The body bytes are fed to HMAC as-is, without decoding or concatenation.
+        """
+        secret = secret or self._get_webhook_secrets()[0]
+        digest = hmac.new(secret, digestmod=hashlib.sha256)
+        if timestamp is not None:
+            digest.update(f'{timestamp}.'.encode())
+        digest.update(raw_body or b'')
+        return f'sha256={digest.hexdigest()}'
+
+    @api.model
+    def verify_signature(self, raw_body, signature, timestamp=None):
+        """
+        Check a delivery signature against every active secret.
+
+        When ``timestamp`` (``X-OpenClaw-Timestamp``, epoch seconds) is sent it
+        must lie within the replay window and the signature is remembered: the
+        same signed request is rejected as a replay. Untimestamped signatures
+        stay accepted unless ``openclaw_gateway.webhook_require_timestamp`` is set.
+
+        Args:
+            raw_body (bytes): Body exactly as received
+            signature (str): ``X-OpenClaw-Signature`` header value
+            timestamp (str): ``X-OpenClaw-Timestamp`` header value, if any
+
+        Returns:
+            str|None: Error code (INVALID_SIGNATURE, STALE_TIMESTAMP, REPLAYED) or None when valid
+        """
+        secrets = self._get_webhook_secrets()
+        if not secrets:
+            _logger.warning("No webhook secret configured")
+            return None
+        if not signature:
+            return 'INVALID_SIGNATURE'
+        params = self.env['ir.config_parameter'].sudo()
+        if timestamp is None:
+            if params.get_param('openclaw_gateway.webhook_require_timestamp', 'False') in ('1', 'True', 'true'):
+                return 'INVALID_SIGNATURE'
+        else:
+            try:
+                skew = abs(time.time() - int(timestamp))
+            except (TypeError, ValueError):
+                return 'INVALID_SIGNATURE'
+            window = int(params.get_param('openclaw_gateway.webhook_replay_window', DEFAULT_REPLAY_WINDOW))
+            if skew > window:
+                return 'STALE_TIMESTAMP'
+        if not any(hmac.compare_digest(self.sign(raw_body, timestamp, secret), signature) for secret in secrets):
+            return 'INVALID_SIGNATURE'
+        if timestamp is not None:
+            self.env.cr.execute("""
+                INSERT INTO openclaw_webhook_replay (signature, seen_at)
+                VALUES (%s, now() AT TIME ZONE 'UTC')
+                ON CONFLICT (signature) DO NOTHING
+                RETURNING signature
+            """, (signature,))
+            if not self.env.cr.fetchone():
+                return 'REPLAYED'
+        return None
+
+    # ==================== Inbox ====================
+
+    @api.model
+    def get_idempotency_key(self, webhook_id, payload, raw_body, header_key=None):
+        """
+        Derive the de-duplication key of a delivery.
+
+        Priority: ``Idempotency-Key`` header, then the n8n execution id (except
+        for ``workflow_status``, where one execution reports many times), then
+        a SHA-256 of the raw body so identical retries collapse.
+
+        Args:
+            webhook_id (str): Webhook route id
+            payload (dict): Parsed body
+            raw_body (bytes): Body exactly as received
+            header_key (str): Value of the Idempotency-Key header, if any
+
+        Returns:
+            str: Key unique per logical delivery
+        """
+        if header_key:
+            return f'{webhook_id}:key:{header_key}'
+        execution_id = isinstance(payload, dict) and payload.get('n8n_execution_id')
+        if execution_id and webhook_id != 'workflow_status':
+            return f'{webhook_id}:exec:{execution_id}'
+        return f'{webhook_id}:sha256:{hashlib.sha256(raw_body or b"").hexdigest()}'
+
+    @api.model
+    def accept(self, webhook_id, raw_body, idempotency_key, source_ip=None):
+        """
+        Store a delivery unless its key was seen before.
+
+        Uses INSERT ... ON CONFLICT DO NOTHING so concurrent redeliveries
+        race safely without aborting the transaction.
+
+        Returns:
+            int|bool: New inbox id, or False for a duplicate
+        """
+        self.env.cr.execute("""
+            INSERT INTO openclaw_webhook_inbox
+                (webhook_id, idempotency_key, body, source_ip, state, attempts, next_attempt_at,
+                 create_uid, create_date, write_uid, write_date)
+            VALUES (%s, %s, %s, %s, 'pending', 0, now() AT TIME ZONE 'UTC',
+                    %s, now() AT TIME ZONE 'UTC', %s, now() AT TIME ZONE 'UTC')
+            ON CONFLICT (idempotency_key) DO NOTHING
+            RETURNING id
+        """, (webhook_id, idempotency_key,
+              raw_body.decode('utf-8', 'replace') if isinstance(raw_body, bytes) else raw_body,
+              source_ip, self.env.uid, self.env.uid))
+        row = self.env.cr.fetchone()
+        if not row:
+            return False
+        cron = self.env.ref('openclaw_gateway.ir_cron_process_webhook_inbox', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+        return row[0]
+
+    # ==================== Handlers ====================
+
+    @api.model
+    def split_events(self, payload):
+        """
+        Return the events carried by a delivery body.
+
+        A body is either one event object, a JSON array of events or
+        ``{"events": [...]}``.
+
+        Returns:
+            tuple: (list of event dicts, bool is_batch)
+
+        Raises:
+            ValueError: Malformed or oversized batch
+        """
+        if isinstance(payload, dict) and isinstance(payload.get('events'), list):
+            events = payload['events']
+        elif isinstance(payload, list):
+            events = payload
+        else:
+            return [payload or {}], False
+        if len(events) > MAX_EVENTS_PER_DELIVERY:
+            raise ValueError(f"Too many events in one delivery (max {MAX_EVENTS_PER_DELIVERY})")
+        if not all(isinstance(event, dict) for event in events):
+            raise ValueError("Every event must be a JSON object")
+        return events, True
+
+    @api.model
+    def handle(self, webhook_id, payload):
+        """
+        Run the handler of ``webhook_id`` (shared by the sync route and the runner).
+
+        Batched bodies are handled in one pass and answered with one result per
+        event under ``results``.
+
+        Raises:
+            ValueError: Unknown webhook id or malformed batch
+        """
+        handler = WEBHOOK_HANDLERS.get(webhook_id)
+        if not handler:
+            raise ValueError(f"Unknown webhook ID: {webhook_id}")
+        events, is_batch = self.split_events(payload)
+        results = getattr(self, handler)(events)
+        if not is_batch:
+            return results[0]
+        return {
+            'success': True,
+            'webhook': webhook_id,
+            'count': len(results),
+            'results': results,
+        }
+
+    @api.model
+    def _handle_lead_created(self, events):
+        """Acknowledge lead creation callbacks from N8N."""
+        return [{
+            'success': True,
+            'webhook': 'lead_created',
+            'message': 'Lead creation acknowledged',
+            'lead_id': event.get('lead_id'),
+        } for event in events]
+
+    @api.model
+    def _handle_bulk_import_complete(self, events):
+        """Acknowledge bulk import completions from N8N."""
+        self.env['openclaw.workflow.job'].sudo().apply_updates([{
+            'job_id': event.get('job_id'),
+            'status': 'completed',
+            'progress_percent': 100.0,
+            'result_json': json.dumps(event.get('result', event)),
+        } for event in events])
+        return [{
+            'success': True,
+            'webhook': 'bulk_import_complete',
+            'message': 'Bulk import acknowledged',
+            'job_id': event.get('job_id'),
+        } for event in events]
+
+    @api.model
+    def _handle_workflow_status(self, events):
+        """
+        Update workflow job statuses from N8N.
+
+        All events go through one atomic upsert per batch; a job is created by
+        the first ``pending``/``running`` event that mentions it.
+        """
+        self.env['openclaw.workflow.job'].sudo().apply_updates([{
+            'job_id': event.get('job_id') or event.get('n8n_execution_id'),
+            'status': event.get('status'),
+            'progress_percent': event.get('progress_percent'),
+            'result_json': json.dumps(event['result']) if event.get('result') else None,
+            'error_message': event.get('error_message'),
+            'workflow_type': event.get('workflow_type'),
+            'n8n_execution_id': event.get('n8n_execution_id'),
+            'create': event.get('status') in ('pending', 'running'),
+        } for event in events])
+        return [{
+            'success': True,
+            'webhook': 'workflow_status',
+            'message': 'Status updated',
+            'job_id': event.get('job_id') or event.get('n8n_execution_id'),
+        } for event in events]
+
+    # ==================== Runner ====================
+
+    def _claim_batch(self, batch_size):
+        """
+        Lock the oldest due deliveries, skipping rows held by another runner.
+
+        Failed deliveries wait for their ``next_attempt_at`` so they neither
+        block newer ones nor get retried on every run.
+        """
+        self.env.cr.execute("""
+            SELECT id FROM openclaw_webhook_inbox
+            WHERE state = 'pending' AND next_attempt_at <= (now() AT TIME ZONE 'UTC')
+            ORDER BY next_attempt_at, id
+            LIMIT %s
+            FOR UPDATE SKIP LOCKED
+        """, (batch_size,))
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    def _process(self):
+        """Process one claimed delivery and log it like a synchronous call."""
+        self.ensure_one()
+        start = time.time()
+        payload = {}
+        try:
+            with self.env.cr.savepoint():
+                payload = json.loads(self.body) if self.body else {}
+                result = self.handle(self.webhook_id, payload)
+            status_code = 200
+            self.write({
+                'state': 'done',
+                'attempts': self.attempts + 1,
+                'processed_at': fields.Datetime.now(),
+                'error_message': False,
+            })
+        except Exception as e:
+            _logger.error("Webhook inbox %s (%s) failed: %s", self.id, self.webhook_id, e)
+            result = {'success': False, 'error': 'WEBHOOK_ERROR', 'message': str(e)}
+            status_code = 500
+            attempts = self.attempts + 1
+            delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+            self.write({
+                'state': 'failed' if attempts >= MAX_ATTEMPTS else 'pending',
+                'attempts': attempts,
+                'next_attempt_at': fields.Datetime.now() + timedelta(seconds=delay),
+                'error_message': str(e),
+            })
+        try:
+            self.env['openclaw.webhook.log'].sudo().log_webhook(
+                self.webhook_id, payload, result, status_code,
+                (time.time() - start) * 1000, self.source_ip,
+                isinstance(payload, dict) and (payload.get('n8n_workflow_id') or payload.get('workflow_id')) or None,
+            )
+        except Exception as e:
+            _logger.warning("Could not write webhook log: %s", e)
+
+    @api.model
+    def _cron_process(self):
+        """
+        Drain the inbox in batches, committing after each batch.
+
+        A run stops claiming batches after ``PROCESS_RUN_WINDOW_SECONDS`` and
+        triggers the cron again if work remains, so sustained inbound load
+        cannot keep one run (and its cron worker) busy forever.
+        """
+        batch_size = int(self.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.webhook_inbox_batch_size', DEFAULT_BATCH_SIZE))
+        deadline = time.monotonic() + PROCESS_RUN_WINDOW_SECONDS
+        while True:
+            if time.monotonic() >= deadline:
+                self.env.ref('openclaw_gateway.ir_cron_process_webhook_inbox').sudo()._trigger()
+                break
+            entries = self._claim_batch(batch_size)
+            if not entries:
+                break
+            for entry in entries:
+                entry._process()
+            self.env.cr.commit()
+
+    def action_retry(self):
+        """Button action: requeue failed deliveries."""
+        self.write({'state': 'pending', 'attempts': 0, 'next_attempt_at': fields.Datetime.now()})
+        self.env.ref('openclaw_gateway.ir_cron_process_webhook_inbox').sudo()._trigger()
+        return True
+
+    @api.autovacuum
+    def _gc_replay_cache(self):
+        """Forget signatures older than the replay window; their timestamps are rejected anyway."""
+        window = int(self.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.webhook_replay_window', DEFAULT_REPLAY_WINDOW))
+        self.env.cr.execute("""
+            DELETE FROM openclaw_webhook_replay
+            WHERE seen_at < (now() AT TIME ZONE 'UTC') - make_interval(secs => %s)
+        """, (window,))
+
+    @api.autovacuum
+    def _gc_done_entries(self):
+        """Drop processed deliveries once they are out of the redelivery window."""
+        self.env.cr.execute(
+            "DELETE FROM openclaw_webhook_inbox WHERE state = 'done' AND processed_at < %s",
+            (fields.Datetime.now() - timedelta(days=DONE_RETENTION_DAYS),)
+        )
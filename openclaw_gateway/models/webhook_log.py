@@ -1,6 +1,69 @@
 # -*- coding: utf-8 -*-
+import base64
+import gzip
 import json
+import logging
+import time
+import uuid
+from datetime import timedelta
+
+import psycopg2
+from psycopg2.extras import execute_values
+
 from odoo import models, fields, api
+from odoo.tools.sql import constraint_definition, create_index, create_unique_index
+
+from ..tools import job_notify, serialization
+
+_logger = logging.getLogger(__name__)
+
+TERMINAL_JOB_STATUSES = ('completed', 'failed', 'cancelled')
+# Statuses only move up this ladder; final statuses never change again
+JOB_STATUS_RANK = {'pending': 0, 'running': 1, 'completed': 2, 'failed': 2, 'cancelled': 2}
+
+# Shared by the upsert and the update: forward-only status, monotonic progress
+JOB_UPDATE_SET = """
+    status = CASE WHEN j.status = 'running' AND {src}.status = 'pending' THEN j.status ELSE {src}.status END,
+    progress_percent = GREATEST(j.progress_percent, {src}.progress_percent),
+    result_json = COALESCE({src}.result_json, j.result_json),
+    error_message = COALESCE({src}.error_message, j.error_message),
+    write_uid = {uid},
+    write_date = now() AT TIME ZONE 'UTC'
+"""
+JOB_OPEN_CONDITION = "j.status NOT IN ('completed', 'failed', 'cancelled')"
+
+# Retention defaults (days; 0 disables the step)
+DEFAULT_LOG_COMPRESS_DAYS = 30
+DEFAULT_LOG_RETENTION_DAYS = 180
+DEFAULT_JOB_RETENTION_DAYS = 90
+# Rows per short transaction, and batches per cron run
+RETENTION_BATCH_SIZE = 1000
+RETENTION_MAX_BATCHES = 50
+
+# Asynchronous skill runs: time budget (``openclaw_gateway.async_skill_timeout_ms``),
+# and how long one cron run keeps claiming jobs before handing over to a new run.
+# Keep both together below the cron worker limit (limit_time_real_cron).
+DEFAULT_ASYNC_SKILL_TIMEOUT_MS = 60000
+SKILL_JOB_RUN_WINDOW_SECONDS = 45
+# Extra time a running job may take before it is presumed lost with its worker
+STALE_JOB_GRACE_SECONDS = 300
+
+
+def pack_json(data):
+    """Encode ``data`` as base64 gzip JSON (the form non-attachment Binary fields store)."""
+    return base64.b64encode(gzip.compress(serialization.dumps(data)))
+
+
+def unpack_json(value):
+    """Decode a value produced by ``pack_json``."""
+    return json.loads(gzip.decompress(base64.b64decode(value)))
+
+
+def _merge_status(current, new):
+    """Return the status after applying ``new`` to ``current`` (forward moves only)."""
+    if current in TERMINAL_JOB_STATUSES or JOB_STATUS_RANK[new] < JOB_STATUS_RANK[current]:
+        return current
+    return new
 
 
 class OpenClawWebhookLog(models.Model):
@@ -17,6 +80,18 @@ class OpenClawWebhookLog(models.Model):
     n8n_workflow_id = fields.Char('N8N Workflow ID')
     success = fields.Boolean('Success', default=True)
     error_message = fields.Text('Error Message')
+    payload_archive = fields.Binary(
+        'Archived Payloads',
+        attachment=False,
+        help="gzip of the request payload and response, moved here by the retention cron"
+    )
+    payload_archived = fields.Boolean('Payload Archived', index=True)
+
+    def init(self):
+        """Index the columns the monitoring list sorts and filters on."""
+        create_index(self.env.cr, 'openclaw_webhook_log_create_date_index', self._table, ['create_date'])
+        create_index(self.env.cr, 'openclaw_webhook_log_success_create_date_index', self._table,
+                     ['success', 'create_date'])
 
     @api.model
     def log_webhook(self, webhook_id, payload, response, status_code=200,
@@ -35,6 +110,102 @@ class OpenClawWebhookLog(models.Model):
         })
 
 
+    def action_restore_payloads(self):
+        """Button action: decompress archived payloads back into the text fields."""
+        for log in self.filtered('payload_archived'):
+            data = unpack_json(log.payload_archive)
+            log.write({
+                'payload_json': data.get('payload'),
+                'response_json': data.get('response'),
+                'payload_archive': False,
+                'payload_archived': False,
+            })
+        return True
+
+    @api.model
+    def _cron_retention(self):
+        """
+        Apply retention to webhook logs and finished workflow jobs.
+
+        Every step works in batches of ``RETENTION_BATCH_SIZE`` rows, each in
+        its own committed transaction, so no lock is held for long and an
+        interrupted run simply resumes next time.
+        """
+        params = self.env['ir.config_parameter'].sudo()
+        now = fields.Datetime.now()
+        log_days = int(params.get_param('openclaw_gateway.webhook_log_retention_days', DEFAULT_LOG_RETENTION_DAYS))
+        job_days = int(params.get_param('openclaw_gateway.workflow_job_retention_days', DEFAULT_JOB_RETENTION_DAYS))
+        compress_days = int(params.get_param('openclaw_gateway.webhook_log_compress_days', DEFAULT_LOG_COMPRESS_DAYS))
+        if log_days > 0:
+            self._delete_in_batches('openclaw_webhook_log', "create_date < %s", (now - timedelta(days=log_days),))
+        if job_days > 0:
+            self._delete_in_batches(
+                'openclaw_workflow_job',
+                "status IN ('completed', 'failed', 'cancelled') AND write_date < %s",
+                (now - timedelta(days=job_days),)
+            )
+            self.env['openclaw.workflow.job'].invalidate_model()
+            self._unlink_orphan_job_attachments()
+        if compress_days > 0:
+            self._compress_payloads(now - timedelta(days=compress_days))
+
+    def _delete_in_batches(self, table, condition, params):
+        """Delete rows of ``table`` matching ``condition``, one committed batch at a time."""
+        cr = self.env.cr
+        for _batch in range(RETENTION_MAX_BATCHES):
+            cr.execute(f"""
+                DELETE FROM {table} WHERE id IN (
+                    SELECT id FROM {table} WHERE {condition}
+                    ORDER BY id LIMIT %s FOR UPDATE SKIP LOCKED
+                )
+            """, params + (RETENTION_BATCH_SIZE,))
+            deleted = cr.rowcount
+            cr.commit()
+            if deleted < RETENTION_BATCH_SIZE:
+                break
+        self.invalidate_model()
+
+    def _unlink_orphan_job_attachments(self):
+        """Remove export files whose job was deleted (files are freed by the filestore GC)."""
+        self.env.cr.execute("""
+            SELECT a.id FROM ir_attachment a
+            LEFT JOIN openclaw_workflow_job j ON j.id = a.res_id
+            WHERE a.res_model = 'openclaw.workflow.job' AND j.id IS NULL
+            LIMIT %s
+        """, (RETENTION_BATCH_SIZE,))
+        attachment_ids = [row[0] for row in self.env.cr.fetchall()]
+        if attachment_ids:
+            self.env['ir.attachment'].sudo().browse(attachment_ids).unlink()
+            self.env.cr.commit()
+
+    def _compress_payloads(self, cutoff):
+        """Move payload/response text of logs older than ``cutoff`` into gzip archives."""
+        cr = self.env.cr
+        for _batch in range(RETENTION_MAX_BATCHES):
+            cr.execute("""
+                SELECT id, payload_json, response_json FROM openclaw_webhook_log
+                WHERE payload_archived IS NOT TRUE AND create_date < %s
+                  AND (payload_json IS NOT NULL OR response_json IS NOT NULL)
+                ORDER BY id LIMIT %s FOR UPDATE SKIP LOCKED
+            """, (cutoff, RETENTION_BATCH_SIZE))
+            rows = cr.fetchall()
+            if not rows:
+                break
+            # Stored base64-encoded, as the ORM expects for non-attachment Binary fields
+            execute_values(cr, """
+                UPDATE openclaw_webhook_log AS l
+                SET payload_archive = v.archive, payload_archived = TRUE,
+                    payload_json = NULL, response_json = NULL
+                FROM (VALUES %s) AS v(id, archive)
+                WHERE l.id = v.id
+            """, [(log_id, psycopg2.Binary(pack_json({'payload': payload, 'response': response})))
+                  for log_id, payload, response in rows], template="(%s, %s::bytea)")
+            cr.commit()
+            if len(rows) < RETENTION_BATCH_SIZE:
+                break
+        self.invalidate_model()
+
+
 class OpenClawWorkflowJob(models.Model):
     _name = 'openclaw.workflow.job'
     _description = 'N8N Workflow Job Status'
@@ -46,6 +217,7 @@ class OpenClawWorkflowJob(models.Model):
         ('lead_creation', 'Lead Creation'),
         ('data_sync', 'Data Synchronization'),
         ('report_generation', 'Report Generation'),
+        ('skill_execution', 'Skill Execution'),
     ], required=True)
     status = fields.Selection([
         ('pending', 'Pending'),
@@ -53,9 +225,293 @@ class OpenClawWorkflowJob(models.Model):
         ('completed', 'Completed'),
         ('failed', 'Failed'),
         ('cancelled', 'Cancelled')
-    ], default='pending', required=True)
+    ], default='pending', required=True, index=True)
     progress_percent = fields.Float('Progress %', default=0.0)
     result_json = fields.Text('Result Data')
     error_message = fields.Text('Error Message')
     n8n_execution_id = fields.Char('N8N Execution ID')
     estimated_completion = fields.Datetime('Estimated Completion')
+    token_id = fields.Many2one(
+        'openclaw.api.token',
+        string="API Token",
+        ondelete='set null',
+        help="Token that queued the job; only this token can read its status"
+    )
+    skill_code = fields.Char('Skill Code')
+    payload_json = fields.Text('Skill Payload')
+    result_archive = fields.Binary(
+        'Compressed Result',
+        attachment=False,
+        help="gzip-compressed result of an asynchronous skill execution"
+    )
+
+    _sql_constraints = [
+        ('job_id_unique', 'UNIQUE(job_id)', 'Job ID must be unique!'),
+    ]
+
+    def init(self):
+        """Index job creation time for the monitoring list and retention; guarantee job_id uniqueness."""
+        create_index(self.env.cr, 'openclaw_workflow_job_create_date_index', self._table, ['create_date'])
+        if not constraint_definition(self.env.cr, self._table, 'openclaw_workflow_job_job_id_unique'):
+            # ON CONFLICT (job_id) needs a unique index even if the constraint could not be added
+            create_unique_index(self.env.cr, 'openclaw_workflow_job_job_id_unique_index', self._table, ['job_id'])
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        jobs = super().create(vals_list)
+        job_notify.notify(self.env.cr, jobs.mapped('job_id'))
+        return jobs
+
+    def write(self, vals):
+        res = super().write(vals)
+        job_notify.notify(self.env.cr, self.mapped('job_id'))
+        return res
+
+    def get_status_data(self):
+        """Return the public status payload of the job (used by the status endpoints)."""
+        self.ensure_one()
+        result = {
+            'job_id': self.job_id,
+            'status': self.status,
+            'progress': self.progress_percent,
+            'workflow_type': self.workflow_type,
+            'created_at': self.create_date.isoformat() if self.create_date else None,
+            'error': self.error_message,
+        }
+        if self.result_archive:
+            result['result'] = unpack_json(self.result_archive)
+        elif self.result_json:
+            try:
+                result['result'] = json.loads(self.result_json)
+            except (TypeError, ValueError):
+                result['result'] = self.result_json
+        return result
+
+    @api.model
+    def enqueue_skill(self, token, skill_code, payload):
+        """
+        Queue an asynchronous skill execution.
+
+        Args:
+            token: openclaw.api.token record of the caller
+            skill_code (str): Skill to run
+            payload (dict): Skill payload
+
+        Returns:
+            record: The pending openclaw.workflow.job
+        """
+        job = self.sudo().create({
+            'job_id': uuid.uuid4().hex,
+            'workflow_type': 'skill_execution',
+            'status': 'pending',
+            'token_id': token.id,
+            'skill_code': skill_code,
+            'payload_json': serialization.to_text(payload),
+        })
+        cron = self.env.ref('openclaw_gateway.ir_cron_run_skill_jobs', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+        return job
+
+    def _claim_skill_job(self):
+        """Lock the oldest pending skill execution, skipping jobs taken by another runner."""
+        self.env.cr.execute("""
+            SELECT id FROM openclaw_workflow_job
+            WHERE workflow_type = 'skill_execution' AND status = 'pending'
+            ORDER BY id
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        """)
+        row = self.env.cr.fetchone()
+        return self.browse(row[0]) if row else self.browse()
+
+    @api.model
+    def _fail_stale_jobs(self, workflow_type, max_age_seconds):
+        """
+        Fail jobs left ``running`` by a worker that died (killed, restarted, OOM).
+
+        A job not written for longer than its time budget plus a grace period
+        cannot still be executing. Such jobs are failed rather than requeued,
+        since a rerun could repeat writes or crash the next worker too.
+        """
+        stale = self.sudo().search([
+            ('workflow_type', '=', workflow_type),
+            ('status', '=', 'running'),
+            ('write_date', '<', fields.Datetime.now() - timedelta(seconds=max_age_seconds)),
+        ])
+        if stale:
+            _logger.warning("Failing %d stale %s jobs: %s", len(stale), workflow_type, stale.mapped('job_id'))
+            stale.write({
+                'status': 'failed',
+                'error_message': 'The worker running this job stopped before it finished',
+            })
+            self.env.cr.commit()
+
+    @api.model
+    def _cron_run_skill_jobs(self):
+        """
+        Run queued skill executions, outside any HTTP worker.
+
+        Each job is marked running and committed (visible to status polls),
+        its token is checked again (a deleted, inactive or expired token fails
+        the job), then it is executed through ``run_skill`` with the roles of its token and the
+        asynchronous time budget; the compressed result is committed with the
+        final status. A run stops claiming jobs after
+        ``SKILL_JOB_RUN_WINDOW_SECONDS`` and triggers the cron again if work
+        remains, so it stays within the cron time limit.
+        """
+        timeout_ms = int(self.env['ir.config_parameter'].sudo().get_param(
+            'openclaw_gateway.async_skill_timeout_ms', DEFAULT_ASYNC_SKILL_TIMEOUT_MS))
+        self._fail_stale_jobs('skill_execution', timeout_ms / 1000 + STALE_JOB_GRACE_SECONDS)
+        Skill = self.env['openclaw.skill'].sudo()
+        deadline = time.monotonic() + SKILL_JOB_RUN_WINDOW_SECONDS
+        while True:
+            if time.monotonic() >= deadline:
+                self.env.ref('openclaw_gateway.ir_cron_run_skill_jobs').sudo()._trigger()
+                break
+            job = self._claim_skill_job()
+            if not job:
+                break
+            job.write({'status': 'running', 'progress_percent': 0.0})
+            self.env.cr.commit()
+            try:
+                result = job._skill_job_token_error()
+                if result is None:
+                    payload = json.loads(job.payload_json or '{}')
+                    result = Skill.with_context(
+                        openclaw_token_id=job.token_id.id,
+                        openclaw_timeout_ms=timeout_ms,
+                    ).run_skill(job.skill_code, payload, user_roles=job.token_id.user_roles)
+            except Exception as e:
+                _logger.exception("Async skill job %s failed: %s", job.job_id, e)
+                self.env.cr.rollback()
+                result = {
+                    'success': False,
+                    'error': 'EXECUTION_ERROR',
+                    'message': f'Error executing skill: {str(e)}',
+                    'skill': job.skill_code
+                }
+            job.write({
+                'status': 'completed' if result.get('success') else 'failed',
+                'progress_percent': 100.0,
+                'result_archive': pack_json(result),
+                'error_message': result.get('message') if not result.get('success') else False,
+            })
+            self.env.cr.commit()
+
+    def _skill_job_token_error(self):
+        """
+        Re-validate the token that queued this skill job.
+
+        Returns:
+            dict|None: Failure result when the token was deleted, deactivated
+            or expired, or lost the skill permission; None when the job may run
+        """
+        self.ensure_one()
+        if not self.token_id:
+            return {
+                'success': False,
+                'error': 'INVALID_TOKEN',
+                'message': 'The token that queued this job no longer exists',
+                'skill': self.skill_code,
+            }
+        validation = self.env['openclaw.api.token'].sudo().validate_token(
+            self.token_id.token, skill_code=self.skill_code
+        )
+        if not validation['valid']:
+            return {
+                'success': False,
+                'error': validation['error'],
+                'message': validation['message'],
+                'skill': self.skill_code,
+            }
+        return None
+
+    @api.model
+    def apply_updates(self, updates):
+        """
+        Apply status updates atomically, safe under concurrent deliveries.
+
+        Updates are first folded per job in the given order. Each job is then
+        written by one ``INSERT ... ON CONFLICT`` (when ``create`` is set) or
+        ``UPDATE`` statement for the whole batch, so parallel reporters can
+        neither lose updates nor race on creation. Progress only moves
+        forward, status only moves pending -> running -> final, and final
+        statuses are never overwritten.
+
+        Args:
+            updates (list): Dicts with ``job_id``, ``status`` and optionally
+                ``progress_percent``, ``result_json``, ``error_message``,
+                ``workflow_type``, ``n8n_execution_id`` and ``create`` (bool,
+                insert the job when it does not exist yet)
+
+        Returns:
+            list: job_id values that were created or changed
+        """
+        merged = {}
+        for update in updates:
+            job_id, status = update.get('job_id'), update.get('status')
+            if not job_id or status not in JOB_STATUS_RANK:
+                continue
+            progress = update.get('progress_percent')
+            progress = float(progress) if progress is not None else None
+            state = merged.get(job_id)
+            if state is None:
+                merged[job_id] = dict(update, progress_percent=progress)
+                continue
+            state['status'] = _merge_status(state['status'], status)
+            if progress is not None:
+                state['progress_percent'] = max(state['progress_percent'] or 0.0, progress)
+            for key in ('result_json', 'error_message'):
+                if update.get(key):
+                    state[key] = update[key]
+            state['create'] = state.get('create') or update.get('create')
+        if not merged:
+            return []
+
+        cr = self.env.cr
+        uid = int(self.env.uid)
+        workflow_types = dict(self._fields['workflow_type'].selection)
+        # Sorted so concurrent batches lock rows in the same order
+        to_upsert = sorted(job_id for job_id, state in merged.items() if state.get('create'))
+        to_update = sorted(job_id for job_id, state in merged.items() if not state.get('create'))
+        changed = []
+        if to_upsert:
+            changed += [row[0] for row in execute_values(cr, f"""
+                INSERT INTO openclaw_workflow_job AS j
+                    (job_id, workflow_type, status, progress_percent, result_json, error_message,
+                     n8n_execution_id, create_uid, create_date, write_uid, write_date)
+                VALUES %s
+                ON CONFLICT (job_id) DO UPDATE SET {JOB_UPDATE_SET.format(src='EXCLUDED', uid=uid)}
+                WHERE {JOB_OPEN_CONDITION}
+                RETURNING j.job_id
+            """, [(
+                job_id,
+                merged[job_id].get('workflow_type') if merged[job_id].get('workflow_type') in workflow_types else 'data_sync',
+                merged[job_id]['status'],
+                merged[job_id]['progress_percent'] or 0.0,
+                merged[job_id].get('result_json'),
+                merged[job_id].get('error_message'),
+                merged[job_id].get('n8n_execution_id'),
+            ) for job_id in to_upsert],
+                template=f"(%s, %s, %s, %s, %s, %s, %s, {uid}, now() AT TIME ZONE 'UTC', {uid}, now() AT TIME ZONE 'UTC')",
+                fetch=True)]
+        if to_update:
+            changed += [row[0] for row in execute_values(cr, f"""
+                UPDATE openclaw_workflow_job AS j SET {JOB_UPDATE_SET.format(src='v', uid=uid)}
+                FROM (VALUES %s) AS v(job_id, status, progress_percent, result_json, error_message)
+                WHERE j.job_id = v.job_id AND {JOB_OPEN_CONDITION}
+                RETURNING j.job_id
+            """, [(
+                job_id,
+                merged[job_id]['status'],
+                merged[job_id]['progress_percent'],
+                merged[job_id].get('result_json'),
+                merged[job_id].get('error_message'),
+            ) for job_id in to_update],
+                template="(%s, %s, %s::float8, %s, %s)",
+                fetch=True)]
+        if changed:
+            self.invalidate_model()
+            job_notify.notify(cr, changed)
+        return changed
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""Background exports written to gzip-compressed attachments."""
+import csv
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+
+from odoo import models, fields, api
+
+from ..tools import serialization
+from .webhook_log import STALE_JOB_GRACE_SECONDS
+
+_logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_SIZE = 2000
+# Bytes per read when hashing/copying the finished file
+FILE_BLOCK_SIZE = 1024 * 1024
+EXPORT_CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+def _flatten(value, for_csv):
+    """Turn an ORM read value into a plain export value."""
+    if isinstance(value, tuple):
+        # many2one (id, display_name)
+        return value[1] if for_csv else [value[0], value[1]]
+    if value is False:
+        return '' if for_csv else None
+    return value
+
+
+class OpenClawWorkflowJobExport(models.Model):
+    _inherit = 'openclaw.workflow.job'
+
+    workflow_type = fields.Selection(
+        selection_add=[('export', 'Export')],
+        ondelete={'export': 'cascade'}
+    )
+    attachment_id = fields.Many2one(
+        'ir.attachment',
+        string="Export File",
+        ondelete='set null',
+        help="Compressed export file, served from the filestore"
+    )
+    total_records = fields.Integer(
+        string="Total Records",
+        help="Records matching the export domain, counted when the export starts"
+    )
+
+    def get_status_data(self):
+        result = super().get_status_data()
+        if self.workflow_type == 'export':
+            result['total_records'] = self.total_records
+        return result
+
+    @api.model
+    def enqueue_export(self, model_name, domain, field_names, export_format, token_id=None):
+        """
+        Queue an export job.
+
+        Args:
+            model_name (str): Model to export (already allow-listed)
+            domain (list): Odoo domain
+            field_names (list): Fields to write (already validated)
+            export_format (str): 'ndjson' or 'csv'
+            token_id (int): Token that requested the export
+
+        Returns:
+            record: The pending openclaw.workflow.job
+        """
+        job = self.sudo().create({
+            'job_id': uuid.uuid4().hex,
+            'workflow_type': 'export',
+            'status': 'pending',
+            'token_id': token_id,
+            'payload_json': json.dumps({
+                'model': model_name,
+                'domain': domain,
+                'fields': field_names,
+                'export_format': export_format,
+            }),
+        })
+        cron = self.env.ref('openclaw_gateway.ir_cron_run_exports', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+        return job
+
+    def _claim_export_job(self):
+        """Lock the oldest pending export, skipping jobs taken by another runner."""
+        self.env.cr.execute("""
+            SELECT id FROM openclaw_workflow_job
+            WHERE workflow_type = 'export' AND status = 'pending'
+            ORDER BY id
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        """)
+        row = self.env.cr.fetchone()
+        return self.browse(row[0]) if row else self.browse()
+
+    @api.model
+    def _cron_run_exports(self):
+        """
+        Run queued exports one by one.
+
+        Running exports commit progress after every chunk; one that has not
+        written for ``STALE_JOB_GRACE_SECONDS`` lost its worker and is failed.
+        """
+        self._fail_stale_jobs('export', STALE_JOB_GRACE_SECONDS)
+        while True:
+            job = self._claim_export_job()
+            if not job:
+                break
+            job.write({'status': 'running', 'progress_percent': 0.0})
+            self.env.cr.commit()
+            try:
+                job._run_export()
+            except Exception as e:
+                _logger.exception("Export job %s failed: %s", job.job_id, e)
+                self.env.cr.rollback()
+                job.write({'status': 'failed', 'error_message': str(e)})
+            self.env.cr.commit()
+
+    def _run_export(self):
+        """
+        Write the export in id-ordered chunks to a gzip temp file, then attach it.
+
+        The matching records are counted first and reported as
+        ``total_records``. Only one chunk of records is held in memory;
+        progress is committed after every chunk. Rows changed while the export runs may reflect
+        either their old or new values.
+        """
+        self.ensure_one()
+        spec = json.loads(self.payload_json)
+        Model = self.env[spec['model']].sudo()
+        field_names = spec['fields']
+        export_format = spec['export_format']
+        domain = list(spec['domain'])
+        total = Model.search_count(domain)
+        self.write({'total_records': total})
+        self.env.cr.commit()
+
+        handle, path = tempfile.mkstemp(suffix=f'.{export_format}.gz')
+        os.close(handle)
+        try:
+            rows = 0
+            last_id = 0
+            with gzip.open(path, 'wt', encoding='utf-8', newline='') as out:
+                writer = None
+                if export_format == 'csv':
+                    writer = csv.writer(out)
+                    writer.writerow(field_names)
+                while True:
+                    records = Model.search(domain + [('id', '>', last_id)], order='id', limit=EXPORT_CHUNK_SIZE)
+                    if not records:
+                        break
+                    for values in records.read(field_names, load='_classic_read'):
+                        if writer:
+                            writer.writerow([_flatten(values.get(name), True) for name in field_names])
+                        else:
+                            out.write(serialization.to_text({
+                                name: _flatten(values.get(name), False) for name in field_names
+                            }))
+                            out.write('\n')
+                    rows += len(records)
+                    last_id = records[-1].id
+                    records.invalidate_recordset()
+                    self.write({'progress_percent': min(99.0, rows * 100.0 / total) if total else 0.0})
+                    self.env.cr.commit()
+
+            filename = f"export_{spec['model'].replace('.', '_')}_{self.job_id}.{export_format}.gz"
+            attachment = self._attach_file(path, filename)
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
+
+        self.write({
+            'status': 'completed',
+            'progress_percent': 100.0,
+            'attachment_id': attachment.id,
+            'result_json': json.dumps({
+                'rows': rows,
+                'total_records': total,
+                'export_format': export_format,
+                'content_type': EXPORT_CONTENT_TYPES[export_format],
+                'content_encoding': 'gzip',
+                'file_name': filename,
+                'file_size': attachment.file_size,
+                'download_url': f'/api/exports/{self.job_id}/download',
+            }),
+        })
+
+    def _attach_file(self, path, filename):
+        """
+        Create the export attachment from the file at ``path`` without loading it in memory.
+
+        With filestore storage the file is moved into the filestore under its
+        SHA-1, exactly where ``ir.attachment`` would have written it; with
+        database storage the content has to be passed as bytes.
+
+        Returns:
+            record: ir.attachment linked to the job
+        """
+        Attachment = self.env['ir.attachment'].sudo()
+        vals = {
+            'name': filename,
+            'mimetype': 'application/gzip',
+            'res_model': self._name,
+            'res_id': self.id,
+        }
+        if Attachment._storage() != 'file':
+            with open(path, 'rb') as compressed:
+                return Attachment.create(dict(vals, raw=compressed.read()))
+
+        sha = hashlib.sha1()
+        with open(path, 'rb') as compressed:
+            for block in iter(lambda: compressed.read(FILE_BLOCK_SIZE), b''):
+                sha.update(block)
+        checksum = sha.hexdigest()
+        fname = f'{checksum[:2]}/{checksum}'
+        full_path = Attachment._full_path(fname)
+        if not os.path.exists(full_path):
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            shutil.move(path, full_path)
+        # Removed by the filestore GC if this transaction rolls back
+        Attachment._mark_for_gc(fname)
+        attachment = Attachment.create(vals)
+        # create/write drop these content fields, which they derive from raw data
+        self.env.cr.execute("""
+            UPDATE ir_attachment SET store_fname = %s, checksum = %s, file_size = %s
+            WHERE id = %s
+        """, (fname, checksum, os.path.getsize(full_path), attachment.id))
+        attachment.invalidate_recordset(['store_fname', 'checksum', 'file_size'])
+        return attachment
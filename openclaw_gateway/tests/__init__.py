@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+from . import test_event_outbox
+from . import test_idempotency
+from . import test_rate_limit
+from . import test_since_watermark
+from . import test_webhook_signature
+from . import test_workflow_job
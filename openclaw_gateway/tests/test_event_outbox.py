@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Outbox delivery against a local HTTP stand-in for n8n."""
+import json
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+
+class _N8nStandIn(BaseHTTPRequestHandler):
+    """Records every POST and answers with the server's configured status."""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.server.received.append((self.path, dict(self.headers), body))
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@tagged('post_install', '-at_install')
+class TestEventOutbox(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.params = cls.env['ir.config_parameter'].sudo()
+        cls.params.set_param('openclaw_gateway.outbox_enabled', 'True')
+        cls.params.set_param('openclaw_gateway.webhook_secret', 'outbox-test-secret')
+        cls.Outbox = cls.env['openclaw.event.outbox']
+
+    def setUp(self):
+        super().setUp()
+        # The dispatcher commits after every batch; keep the test transaction
+        self.patch(self.env.cr, 'commit', lambda: None)
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _N8nStandIn)
+        self.server.received = []
+        self.server.status = 200
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.params.set_param('openclaw_gateway.n8n_base_url', f'http://127.0.0.1:{self.server.server_port}/')
+        self.Outbox.search([]).unlink()
+
+    def _queue_partner_event(self):
+        partner = self.env['res.partner'].create({'name': 'Outbox Partner'})
+        events = self.Outbox.search([('res_model', '=', 'res.partner'), ('res_id', '=', partner.id)])
+        # Due now: the claim compares with the transaction start time
+        events.write({'next_attempt_at': fields.Datetime.now() - timedelta(minutes=1)})
+        return partner, events
+
+    def test_dispatch_delivers_signed_batch(self):
+        partner, events = self._queue_partner_event()
+        self.Outbox._cron_dispatch()
+
+        self.assertEqual(set(events.mapped('state')), {'sent'})
+        self.assertEqual(len(self.server.received), 1)
+        path, headers, body = self.server.received[0]
+        self.assertEqual(path, '/webhook/openclaw-events')
+        payload = json.loads(body)
+        self.assertIn(('res.partner.created', partner.id),
+                      [(event['event'], event['res_id']) for event in payload['events']])
+        timestamp = int(headers['X-OpenClaw-Timestamp'])
+        self.assertEqual(headers['X-OpenClaw-Signature'],
+                         self.env['openclaw.webhook.inbox'].sign(body, timestamp))
+
+    def test_failed_delivery_backs_off(self):
+        __, events = self._queue_partner_event()
+        self.server.status = 500
+        self.Outbox._cron_dispatch()
+
+        self.assertEqual(len(self.server.received), 1)
+        self.assertEqual(set(events.mapped('state')), {'pending'})
+        self.assertEqual(set(events.mapped('attempts')), {1})
+        self.assertTrue(all(event.next_attempt_at > fields.Datetime.now() for event in events))
+        self.assertTrue(all(event.last_error for event in events))
+
+    def test_unconfigured_base_url_keeps_events_pending(self):
+        self.params.set_param('openclaw_gateway.n8n_base_url', '')
+        __, events = self._queue_partner_event()
+        self.Outbox._cron_dispatch()
+
+        self.assertFalse(self.server.received)
+        self.assertEqual(set(events.mapped('state')), {'pending'})
+        self.assertEqual(set(events.mapped('attempts')), {0})
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Idempotency-Key replays on the skill endpoint."""
+import json
+import uuid
+
+from odoo.tests import HttpCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestIdempotency(HttpCase):
+
+    def setUp(self):
+        super().setUp()
+        self.token = self.env['openclaw.api.token'].sudo().create({
+            'name': 'Idempotency',
+            'token': uuid.uuid4().hex,
+        })
+
+    def _post_ping(self, body, key):
+        return self.url_open('/api/skills/ping', data=json.dumps(body), headers={
+            'Content-Type': 'application/json',
+            'X-OPENCLAW-TOKEN': self.token.token,
+            'Idempotency-Key': key,
+        })
+
+    def test_retry_replays_first_response(self):
+        key = uuid.uuid4().hex
+        first = self._post_ping({}, key)
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn('Idempotent-Replayed', first.headers)
+
+        retry = self._post_ping({}, key)
+        self.assertEqual(retry.status_code, 200)
+        self.assertEqual(retry.headers.get('Idempotent-Replayed'), 'true')
+        # Same bytes, including the first call's timestamp: the skill did not run again
+        self.assertEqual(retry.json(), first.json())
+
+    def test_key_reused_for_other_request(self):
+        key = uuid.uuid4().hex
+        self.assertEqual(self._post_ping({}, key).status_code, 200)
+        reused = self._post_ping({'limit': 1}, key)
+        self.assertEqual(reused.status_code, 422)
+        self.assertEqual(reused.json()['error'], 'IDEMPOTENCY_KEY_REUSED')
+
+    def test_keys_are_per_token(self):
+        key = uuid.uuid4().hex
+        first = self._post_ping({}, key)
+        self.token = self.env['openclaw.api.token'].sudo().create({
+            'name': 'Other token',
+            'token': uuid.uuid4().hex,
+        })
+        other = self._post_ping({}, key)
+        self.assertEqual(other.status_code, 200)
+        self.assertNotIn('Idempotent-Replayed', other.headers)
+        self.assertEqual(first.json()['success'], other.json()['success'])
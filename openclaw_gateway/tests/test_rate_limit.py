@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Token-bucket rate limits: all-or-nothing debits, capacity errors and constraints."""
+import uuid
+
+from psycopg2 import IntegrityError
+
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import mute_logger
+
+
+@tagged('post_install', '-at_install')
+class TestRateLimit(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.RateLimit = cls.env['openclaw.api.token.rate.limit'].sudo()
+        cls.skill = cls.env['openclaw.skill'].sudo().search([('code', '=', 'ping')], limit=1)
+
+    def setUp(self):
+        super().setUp()
+        # Buckets live on their own committed cursor; use unique keys and drop them afterwards
+        self.prefix = f'test:{uuid.uuid4().hex}'
+        self.addCleanup(self._drop_buckets)
+
+    def _drop_buckets(self):
+        with self.registry.cursor() as cr:
+            cr.execute("DELETE FROM openclaw_rate_bucket WHERE bucket_key LIKE %s", (f'{self.prefix}%',))
+
+    def _key(self, name):
+        return f'{self.prefix}:{name}'
+
+    def _bucket_tokens(self, name):
+        with self.registry.cursor() as cr:
+            cr.execute("SELECT tokens FROM openclaw_rate_bucket WHERE bucket_key = %s", (self._key(name),))
+            row = cr.fetchone()
+        return row and row[0]
+
+    def test_burst_then_throttled(self):
+        buckets = [(self._key('token'), 60, 3)]
+        for _i in range(3):
+            self.assertTrue(self.RateLimit._consume_buckets(buckets)['allowed'])
+        throttle = self.RateLimit._consume_buckets(buckets)
+        self.assertFalse(throttle['allowed'])
+        self.assertEqual(throttle['bucket'], self._key('token'))
+        self.assertGreaterEqual(throttle['retry_after'], 1)
+
+    def test_denied_call_charges_no_bucket(self):
+        # The wide bucket could pay, the narrow one cannot: neither is debited
+        buckets = [(self._key('wide'), 60, 10, 5), (self._key('narrow'), 1, 6, 5)]
+        self.assertTrue(self.RateLimit._consume_buckets(buckets)['allowed'])
+        throttle = self.RateLimit._consume_buckets(buckets)
+        self.assertFalse(throttle['allowed'])
+        self.assertEqual(throttle['bucket'], self._key('narrow'))
+        self.assertLess(self._bucket_tokens('wide'), 5.1)
+        self.assertGreaterEqual(self._bucket_tokens('wide'), 5)
+        self.assertLess(self._bucket_tokens('narrow'), 1.1)
+
+    def test_cost_above_capacity_is_not_retryable(self):
+        throttle = self.RateLimit._consume_buckets([(self._key('token'), 60, 5)], cost=6)
+        self.assertFalse(throttle['allowed'])
+        self.assertEqual(throttle['error'], 'COST_EXCEEDS_CAPACITY')
+        self.assertNotIn('retry_after', throttle)
+        self.assertIsNone(self._bucket_tokens('token'))
+
+    def test_token_and_skill_buckets(self):
+        token = self.env['openclaw.api.token'].sudo().create({
+            'name': 'Rate limited',
+            'token': uuid.uuid4().hex,
+            'rate_limit': 600,
+            'rate_limit_burst': 10,
+            'skill_rate_limit_ids': [(0, 0, {'skill_id': self.skill.id, 'rate_limit': 1, 'rate_limit_burst': 2})],
+        })
+        self.addCleanup(self._drop_token_buckets, token)
+        self.assertTrue(token.check_rate_limit('ping')['allowed'])
+        self.assertTrue(token.check_rate_limit('ping')['allowed'])
+        self.assertFalse(token.check_rate_limit('ping')['allowed'])
+        # Other skills only draw on the token bucket
+        self.assertTrue(token.check_rate_limit('summary')['allowed'])
+        self.assertEqual(token.check_rate_limit(skill_costs={'summary': 20})['error'], 'COST_EXCEEDS_CAPACITY')
+
+    def _drop_token_buckets(self, token):
+        with self.registry.cursor() as cr:
+            cr.execute("DELETE FROM openclaw_rate_bucket WHERE bucket_key LIKE %s", (f'token:{token.id}%',))
+
+    @mute_logger('odoo.sql_db')
+    def test_negative_limits_rejected(self):
+        with self.assertRaises(IntegrityError), self.env.cr.savepoint():
+            self.env['openclaw.api.token'].sudo().create({
+                'name': 'Negative', 'token': uuid.uuid4().hex, 'rate_limit': 10, 'rate_limit_burst': -5,
+            })
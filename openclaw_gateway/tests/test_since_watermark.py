@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Incremental sync with the ``since`` watermark."""
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.openclaw_gateway.executors.customers import CustomersExecutor
+
+
+@tagged('post_install', '-at_install')
+class TestSinceWatermark(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        Partner = cls.env['res.partner']
+        cls.p1, cls.p2, cls.p3, cls.recent = Partner.create([
+            {'name': f'Since {index}', 'customer_rank': 1} for index in range(4)
+        ])
+        # Dated before any other record so they lead the write_date order; p2 and p3 tie
+        for partner, write_date in ((cls.p1, '2000-01-01 10:00:00'), (cls.p2, '2000-01-01 11:00:00'),
+                                    (cls.p3, '2000-01-01 11:00:00')):
+            cls.env.cr.execute("UPDATE res_partner SET write_date = %s WHERE id = %s", (write_date, partner.id))
+        cls.env.invalidate_all()
+
+    def _page(self, since, limit):
+        result = CustomersExecutor().execute(self.env, {'since': since, 'limit': limit})
+        self.assertTrue(result['success'], result)
+        return [row['id'] for row in result['data']['customers']], result['data']['next_watermark']
+
+    def test_pages_follow_write_date_then_id(self):
+        ids, watermark = self._page('1999-12-31', 2)
+        self.assertEqual(ids, [self.p1.id, self.p2.id])
+        self.assertEqual(watermark, f'2000-01-01T11:00:00|{self.p2.id}')
+
+        # The tie on write_date is broken by id: p3 comes next, p2 is not repeated
+        ids, watermark = self._page(watermark, 1)
+        self.assertEqual(ids, [self.p3.id])
+        self.assertEqual(watermark, f'2000-01-01T11:00:00|{self.p3.id}')
+
+    def test_empty_page_keeps_watermark(self):
+        self.env['ir.config_parameter'].sudo().set_param('openclaw_gateway.since_safety_lag_seconds', '0')
+        ids, watermark = self._page('2999-01-01|0', 10)
+        self.assertEqual(ids, [])
+        self.assertEqual(watermark, '2999-01-01T00:00:00|0')
+
+    def test_recent_writes_are_held_back(self):
+        # Written by the running transaction: still inside the safety lag
+        self.recent.write({'name': 'Since recent'})
+        ids, __ = self._page(f'2000-01-01T11:00:00|{self.p3.id}', 1000)
+        self.assertNotIn(self.recent.id, ids)
+
+    def test_invalid_watermark(self):
+        result = CustomersExecutor().execute(self.env, {'since': 'yesterday'})
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error'], 'INVALID_SINCE')
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Webhook signature checks and the replay window."""
+import time
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestWebhookSignature(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.params = cls.env['ir.config_parameter'].sudo()
+        cls.params.set_param('openclaw_gateway.webhook_secret', 'new-secret,old-secret')
+        cls.params.set_param('openclaw_gateway.webhook_replay_window', '300')
+        cls.params.set_param('openclaw_gateway.webhook_require_timestamp', 'False')
+        cls.Inbox = cls.env['openclaw.webhook.inbox']
+        cls.body = b'{"event": "lead_created", "lead_id": 7}'
+
+    def test_timestamped_signature_accepted_once(self):
+        timestamp = str(int(time.time()))
+        signature = self.Inbox.sign(self.body, timestamp)
+        self.assertIsNone(self.Inbox.verify_signature(self.body, signature, timestamp))
+        self.assertEqual(self.Inbox.verify_signature(self.body, signature, timestamp), 'REPLAYED')
+
+    def test_any_active_secret_is_accepted(self):
+        timestamp = str(int(time.time()))
+        signature = self.Inbox.sign(self.body, timestamp, secret=b'old-secret')
+        self.assertIsNone(self.Inbox.verify_signature(self.body, signature, timestamp))
+
+    def test_tampered_body_or_unknown_secret_rejected(self):
+        timestamp = str(int(time.time()))
+        signature = self.Inbox.sign(self.body, timestamp)
+        self.assertEqual(self.Inbox.verify_signature(self.body + b' ', signature, timestamp), 'INVALID_SIGNATURE')
+        forged = self.Inbox.sign(self.body, timestamp, secret=b'guessed')
+        self.assertEqual(self.Inbox.verify_signature(self.body, forged, timestamp), 'INVALID_SIGNATURE')
+        self.assertEqual(self.Inbox.verify_signature(self.body, None, timestamp), 'INVALID_SIGNATURE')
+
+    def test_timestamp_outside_window_is_stale(self):
+        for skew in (-301, 301):
+            timestamp = str(int(time.time()) + skew)
+            signature = self.Inbox.sign(self.body, timestamp)
+            self.assertEqual(self.Inbox.verify_signature(self.body, signature, timestamp), 'STALE_TIMESTAMP')
+
+    def test_timestamp_is_signed(self):
+        timestamp = int(time.time())
+        signature = self.Inbox.sign(self.body, timestamp)
+        self.assertEqual(self.Inbox.verify_signature(self.body, signature, str(timestamp - 1)), 'INVALID_SIGNATURE')
+
+    def test_untimestamped_signature_depends_on_setting(self):
+        signature = self.Inbox.sign(self.body)
+        self.assertIsNone(self.Inbox.verify_signature(self.body, signature))
+        self.params.set_param('openclaw_gateway.webhook_require_timestamp', 'True')
+        self.assertEqual(self.Inbox.verify_signature(self.body, signature), 'INVALID_SIGNATURE')
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Forward-only job status updates (``apply_updates``)."""
+import uuid
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestApplyUpdates(TransactionCase):
+
+    def setUp(self):
+        super().setUp()
+        self.Job = self.env['openclaw.workflow.job'].sudo()
+        self.job_id = uuid.uuid4().hex
+
+    def _apply(self, *updates):
+        return self.Job.apply_updates([dict(update, job_id=self.job_id) for update in updates])
+
+    def _job(self):
+        return self.Job.search([('job_id', '=', self.job_id)])
+
+    def test_create_then_move_forward(self):
+        self.assertEqual(self._apply({'status': 'running', 'progress_percent': 40, 'create': True}), [self.job_id])
+        self._apply({'status': 'running', 'progress_percent': 70})
+        job = self._job()
+        self.assertEqual(len(job), 1)
+        self.assertEqual((job.status, job.progress_percent), ('running', 70.0))
+
+    def test_progress_and_status_never_go_back(self):
+        self._apply({'status': 'running', 'progress_percent': 60, 'create': True})
+        self._apply({'status': 'pending', 'progress_percent': 20})
+        job = self._job()
+        self.assertEqual((job.status, job.progress_percent), ('running', 60.0))
+
+    def test_final_status_is_kept(self):
+        self._apply({'status': 'completed', 'progress_percent': 100, 'result_json': '{"rows": 3}', 'create': True})
+        self.assertEqual(self._apply({'status': 'running', 'progress_percent': 50}), [])
+        self.assertEqual(self._apply({'status': 'failed', 'create': True}), [])
+        job = self._job()
+        self.assertEqual((job.status, job.progress_percent, job.result_json), ('completed', 100.0, '{"rows": 3}'))
+
+    def test_updates_fold_in_order_within_a_batch(self):
+        self._apply(
+            {'status': 'pending', 'create': True},
+            {'status': 'running', 'progress_percent': 80},
+            {'status': 'pending', 'progress_percent': 10},
+            {'status': 'running', 'error_message': 'retrying'},
+        )
+        job = self._job()
+        self.assertEqual(len(job), 1)
+        self.assertEqual((job.status, job.progress_percent, job.error_message), ('running', 80.0, 'retrying'))
+
+    def test_repeated_create_does_not_duplicate(self):
+        self._apply({'status': 'pending', 'create': True})
+        self._apply({'status': 'running', 'progress_percent': 10, 'create': True})
+        job = self._job()
+        self.assertEqual(len(job), 1)
+        self.assertEqual(job.status, 'running')
+
+    def test_unknown_jobs_and_statuses_are_ignored(self):
+        self.assertEqual(self._apply({'status': 'running'}), [])
+        self.assertEqual(self._apply({'status': 'exploded', 'create': True}), [])
+        self.assertFalse(self._job())
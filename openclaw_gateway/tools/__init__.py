@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+from . import metrics
+from . import serialization
+from . import compression
+from . import job_notify
+from . import pricelist_cache
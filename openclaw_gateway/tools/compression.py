@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Content-Encoding negotiation and compression for API responses.
+
+gzip is always available; brotli and zstd are used when the optional
+``brotli`` / ``zstandard`` packages are installed on the server.
+"""
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Server preference when the client accepts several encodings equally
+PREFERENCE = ('zstd', 'br', 'gzip')
+
+
+def available_encodings():
+    """Encodings this server can produce, in preference order."""
+    return tuple(
+        encoding for encoding in PREFERENCE
+        if encoding == 'gzip'
+        or (encoding == 'br' and brotli is not None)
+        or (encoding == 'zstd' and zstandard is not None)
+    )
+
+
+def negotiate(accept_encoding):
+    """
+    Pick the best encoding from an Accept-Encoding header.
+    
+    Args:
+        accept_encoding (str): Raw header value (e.g. 'gzip, br;q=0.9')
+        
+    Returns:
+        str: 'zstd', 'br', 'gzip' or None when nothing acceptable is available
+    """
+    if not accept_encoding:
+        return None
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding] = quality
+    wildcard = accepted.get('*', 0.0)
+    best, best_quality = None, 0.0
+    for encoding in available_encodings():
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body, encoding, level=6):
+    """
+    Compress ``body`` with ``encoding``.
+    
+    Args:
+        body (bytes): Payload
+        encoding (str): 'gzip', 'br' or 'zstd'
+        level (int): Compression level, clamped to each codec's range
+        
+    Returns:
+        bytes: Compressed payload
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=max(0, min(level, 11)))
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=max(1, min(level, 22))).compress(body)
+    return gzip.compress(body, compresslevel=max(1, min(level, 9)))
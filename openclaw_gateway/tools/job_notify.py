@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""LISTEN/NOTIFY fan-out for workflow job changes.
+
+Job writes send ``NOTIFY openclaw_workflow_job, '<job_id>'`` inside their
+transaction, so PostgreSQL delivers it only once the change is committed.
+Each worker process runs at most one listener thread per database; waiting
+requests block on a ``threading.Event`` instead of polling the database.
+"""
+import logging
+import select
+import threading
+import time
+
+import odoo
+
+_logger = logging.getLogger(__name__)
+
+CHANNEL = 'openclaw_workflow_job'
+SELECT_TIMEOUT = 30
+RECONNECT_DELAY = 5
+
+_lock = threading.Lock()
+_waiters = {}
+_listeners = {}
+
+
+def notify(cr, job_ids):
+    """
+    Queue a change notification for ``job_ids`` on the current transaction.
+
+    Args:
+        cr: Cursor of the transaction that changed the jobs
+        job_ids (iterable): job_id values that changed
+    """
+    for job_id in set(job_ids):
+        if job_id:
+            cr.execute("SELECT pg_notify(%s, %s)", (CHANNEL, job_id))
+
+
+def wait(dbname, job_id, timeout):
+    """
+    Block until ``job_id`` is notified or ``timeout`` seconds pass.
+
+    Args:
+        dbname (str): Database the job lives in
+        job_id (str): Job to wait for
+        timeout (float): Maximum wait in seconds
+
+    Returns:
+        bool: True when a change was notified
+    """
+    _ensure_listener(dbname)
+    event = threading.Event()
+    key = (dbname, job_id)
+    with _lock:
+        _waiters.setdefault(key, set()).add(event)
+    try:
+        return event.wait(timeout)
+    finally:
+        with _lock:
+            events = _waiters.get(key)
+            if events:
+                events.discard(event)
+                if not events:
+                    del _waiters[key]
+
+
+def _ensure_listener(dbname):
+    with _lock:
+        thread = _listeners.get(dbname)
+        if thread and thread.is_alive():
+            return
+        thread = threading.Thread(
+            target=_listen, args=(dbname,),
+            name=f'openclaw.job_notify.{dbname}', daemon=True,
+        )
+        _listeners[dbname] = thread
+        thread.start()
+
+
+def _wake(dbname, job_id):
+    with _lock:
+        for event in _waiters.get((dbname, job_id), ()):
+            event.set()
+
+
+def _listen(dbname):
+    """
+    Listener loop: one dedicated connection per database, reconnecting on errors.
+
+    LISTEN is committed once and the connection then stays idle outside any
+    transaction, which is when PostgreSQL delivers notifications.
+    """
+    while True:
+        try:
+            with odoo.sql_db.db_connect(dbname).cursor() as cr:
+                conn = cr._cnx
+                cr.execute(f"LISTEN {CHANNEL}")
+                cr.commit()
+                while True:
+                    if select.select([conn], [], [], SELECT_TIMEOUT) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        _wake(dbname, conn.notifies.pop().payload)
+        except Exception as e:
+            _logger.warning("Workflow job listener for %s failed, reconnecting: %s", dbname, e)
+            time.sleep(RECONNECT_DELAY)
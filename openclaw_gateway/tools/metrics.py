@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""In-process gateway counters exposed by GET /api/metrics.
+
+Counters are kept per worker process (Odoo prefork workers do not share
+memory); the metrics endpoint reports the pid so scrapers can aggregate.
+"""
+import os
+import threading
+
+_lock = threading.Lock()
+_counters = {}
+
+
+def incr(name, key=None, amount=1):
+    """
+    Increment counter ``name`` (optionally broken down by ``key``, e.g. a skill code).
+    
+    Args:
+        name (str): Counter name (e.g. 'executions', 'shed')
+        key (str): Optional breakdown key; totals are kept under 'total'
+        amount (int|float): Increment
+    """
+    with _lock:
+        bucket = _counters.setdefault(name, {})
+        bucket['total'] = bucket.get('total', 0) + amount
+        if key:
+            bucket[key] = bucket.get(key, 0) + amount
+
+
+def snapshot():
+    """Return a copy of all counters for this worker."""
+    with _lock:
+        return {
+            'pid': os.getpid(),
+            'counters': {name: dict(values) for name, values in _counters.items()},
+        }
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""Per-worker TTL cache of pricelist rules.
+
+Entries map (database, pricelist) to the pricelist's rules, indexed by the
+category, template or variant they target. Each entry carries the value of the
+``openclaw_pricelist_rules_version`` sequence it was read at; transactions that
+change pricelist rules bump the sequence after committing, which invalidates
+the entry in every worker at once. The TTL only bounds changes made behind the
+ORM's back.
+"""
+import threading
+import time
+
+MAX_ENTRIES = 256
+
+_lock = threading.Lock()
+_entries = {}
+
+
+def get(key, version):
+    """
+    Return the cached rules for ``key`` if they are live and of ``version``.
+
+    Returns:
+        dict|None: Rules index built by ``product.pricelist._openclaw_rules_index``
+    """
+    with _lock:
+        entry = _entries.get(key)
+        if not entry:
+            return None
+        expires_at, entry_version, rules = entry
+        if expires_at < time.monotonic() or entry_version != version:
+            del _entries[key]
+            return None
+        return rules
+
+
+def put(key, version, rules, ttl):
+    """
+    Store the rules of ``key`` for ``ttl`` seconds.
+
+    Args:
+        key (tuple): Cache key
+        version (int): Rules version the rules were read at
+        rules (dict): Rules index
+        ttl (int): Seconds the entry stays valid (0 disables caching)
+    """
+    if ttl <= 0:
+        return
+    now = time.monotonic()
+    with _lock:
+        if len(_entries) >= MAX_ENTRIES and key not in _entries:
+            for stale_key in [k for k, e in _entries.items() if e[0] < now] or [next(iter(_entries))]:
+                del _entries[stale_key]
+        _entries[key] = (now + ttl, version, rules)
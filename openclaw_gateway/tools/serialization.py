@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""JSON encoding for API responses.
+
+Responses are encoded exactly once into bytes; the same bytes are sent to
+the client and stored in the request log. orjson is used when installed
+(it handles datetime natively and is several times faster than the
+stdlib encoder); otherwise the stdlib encoder is used with compact
+separators. MessagePack output requires the optional ``msgpack`` package.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def _default(value):
+    """Fallback for values JSON cannot encode (dates, Decimal, lazy strings...)."""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def dumps(data):
+    """
+    Encode ``data`` to UTF-8 JSON bytes.
+    
+    Args:
+        data: JSON-compatible structure (dates and Decimals are stringified)
+        
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_default, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def dumps_msgpack(data):
+    """
+    Encode ``data`` to MessagePack bytes.
+    
+    Args:
+        data: Structure to encode (dates and Decimals are stringified)
+        
+    Returns:
+        bytes: Encoded document
+    """
+    return msgpack.packb(data, default=_default, use_bin_type=True)
+
+
+def to_text(value):
+    """
+    Return ``value`` as JSON text for storage, reusing already encoded bytes.
+    
+    Args:
+        value: bytes/str already holding JSON, or a structure to encode
+        
+    Returns:
+        str: JSON text ('{}' for empty values)
+    """
+    if not value:
+        return '{}'
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    if isinstance(value, str):
+        return value
+    return dumps(value).decode('utf-8')